@@ -0,0 +1,108 @@
+"""
+bench_collisions.py - Benchmark de colisiones espátula-amenaza
+
+Compara el coste por frame de encontrar qué amenazas toca cada espátula:
+- BUCLES: cada espátula contra cada amenaza (lo que hacía update_game_logic)
+- REJILLA: SpatialHash reconstruida cada frame + una consulta por espátula
+
+Las amenazas se reparten en un mundo cuya área crece con su número, con la
+misma densidad que una partida normal (unas 10 por pantalla), y hay una
+espátula por cada 10 amenazas. Así se ve cómo escala cada método.
+
+Se ejecuta sin ventana:
+    python benchmarks/bench_collisions.py
+    python benchmarks/bench_collisions.py --sizes 1000 10000 --frames 20
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+from settings import *
+from spatial import SpatialHash
+
+THREATS_PER_SCREEN = 10
+
+
+class Box:
+    """Entidad mínima con un rect (para medir solo las colisiones)."""
+
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+def make_world(threat_count, rng):
+    """Crea amenazas y espátulas repartidas en un mundo proporcional a threat_count."""
+    scale = math.sqrt(max(1, threat_count / THREATS_PER_SCREEN))
+    width = int(WINDOW_WIDTH * scale)
+    height = int(WINDOW_HEIGHT * scale)
+
+    threats = [Box(rng.randrange(width), rng.randrange(height), OBSTACLE_WIDTH, OBSTACLE_HEIGHT)
+               for _ in range(threat_count)]
+    knives = [Box(rng.randrange(width), rng.randrange(height), SCRAPER_WIDTH, SCRAPER_HEIGHT)
+              for _ in range(max(1, threat_count // 10))]
+    return threats, knives
+
+
+def nested_loops(threats, knives, grid):
+    """Método antiguo: O(espátulas × amenazas)."""
+    hits = 0
+    for knife in knives:
+        for threat in threats:
+            if knife.rect.colliderect(threat.rect):
+                hits += 1
+                break
+    return hits
+
+
+def spatial_hash(threats, knives, grid):
+    """Método nuevo: reconstruir la rejilla y consultar cada espátula."""
+    grid.clear()
+    grid.insert_all(threats)
+    hits = 0
+    for knife in knives:
+        if grid.query(knife.rect):
+            hits += 1
+    return hits
+
+
+def time_per_frame(function, threats, knives, grid, frames):
+    """Devuelve el coste medio en milisegundos de una llamada a function."""
+    seconds = timeit.timeit(lambda: function(threats, knives, grid), number=frames)
+    return seconds / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de colisiones con y sin rejilla espacial")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000],
+                        help="Número de amenazas a probar")
+    parser.add_argument("--frames", type=int, default=50, help="Frames medidos por caso")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    grid = SpatialHash()
+
+    print(f"Colisiones espátula-amenaza - {args.frames} frames por caso (ms/frame)")
+    print(f"{'amenazas':>10}{'espátulas':>11}{'bucles':>11}{'rejilla':>11}{'mejora':>10}")
+
+    for size in args.sizes:
+        threats, knives = make_world(size, rng)
+
+        # Los dos métodos tienen que encontrar exactamente los mismos choques
+        assert nested_loops(threats, knives, grid) == spatial_hash(threats, knives, grid)
+
+        before = time_per_frame(nested_loops, threats, knives, grid, args.frames)
+        after = time_per_frame(spatial_hash, threats, knives, grid, args.frames)
+        print(f"{size:>10}{len(knives):>11}{before:>11.3f}{after:>11.3f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+bench_compare.py - Comprobar que no hay regresiones de rendimiento
+
+Compara la batería de bench_suite.py con una línea base guardada (un
+JSON de resultados) y falla si algún benchmark se ha vuelto más lento.
+
+Para no dar falsas alarmas por el ruido de la máquina:
+1. La batería se ejecuta --repeats veces y de cada benchmark se queda
+   la MEJOR mediana (el ruido solo puede hacer que algo tarde más)
+2. Lo que parezca más lento se vuelve a medir --confirm veces más, y
+   solo cuenta como regresión si sigue siéndolo
+3. Es regresión si la mediana sube más de --threshold (15% por defecto)
+   Y además más de --min-delta ms (los benchmarks de microsegundos
+   bailan mucho en proporción)
+
+Sale con código 1 si hay alguna regresión, así se puede usar antes de
+hacer commit o en integración continua.
+
+Se ejecuta sin ventana:
+    python benchmarks/bench_compare.py --save-baseline    # Guardar la línea base
+    python benchmarks/bench_compare.py                    # Comparar con ella
+    python benchmarks/bench_compare.py --threshold 0.10 --baseline otra.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from bench_suite import run_suite, BENCH_DIR
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+
+def best_of(reports):
+    """
+    Junta varios informes de run_suite() quedándose con la mejor mediana.
+
+    Returns:
+        dict: Informe con el mismo formato (meta del primero)
+    """
+    results = {}
+    for report in reports:
+        for name, result in report["results"].items():
+            if name not in results or result["median_ms"] < results[name]["median_ms"]:
+                results[name] = result
+    return {"meta": reports[0]["meta"], "results": results}
+
+
+def is_regression(baseline_ms, current_ms, threshold, min_delta):
+    """Indica si pasar de baseline_ms a current_ms es una regresión."""
+    return (current_ms > baseline_ms * (1 + threshold)
+            and current_ms - baseline_ms > min_delta)
+
+
+def compare(baseline, current, threshold, min_delta):
+    """
+    Compara dos informes benchmark a benchmark.
+
+    Returns:
+        list: Filas (nombre, ms base, ms actual, cambio relativo, estado);
+              estado es "OK", "MÁS LENTO", "más rápido", "nuevo" o "falta"
+    """
+    rows = []
+    base_results = baseline["results"]
+    current_results = current["results"]
+
+    for name in list(base_results) + [n for n in current_results if n not in base_results]:
+        base = base_results.get(name)
+        now = current_results.get(name)
+        if base is None:
+            rows.append((name, None, now["median_ms"], None, "nuevo"))
+            continue
+        if now is None:
+            rows.append((name, base["median_ms"], None, None, "falta"))
+            continue
+
+        base_ms = base["median_ms"]
+        now_ms = now["median_ms"]
+        change = now_ms / base_ms - 1 if base_ms else 0.0
+        if is_regression(base_ms, now_ms, threshold, min_delta):
+            status = "MÁS LENTO"
+        elif is_regression(now_ms, base_ms, threshold, min_delta):
+            status = "más rápido"
+        else:
+            status = "OK"
+        rows.append((name, base_ms, now_ms, change, status))
+    return rows
+
+
+def print_table(rows):
+    """Imprime la comparación como tabla."""
+    print(f"{'benchmark':>28}{'base ms':>11}{'ahora ms':>11}{'cambio':>9}  estado")
+    for name, base_ms, now_ms, change, status in rows:
+        base_text = f"{base_ms:.4f}" if base_ms is not None else "-"
+        now_text = f"{now_ms:.4f}" if now_ms is not None else "-"
+        change_text = f"{change:+.0%}" if change is not None else "-"
+        print(f"{name:>28}{base_text:>11}{now_text:>11}{change_text:>9}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara los benchmarks con una línea base guardada")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON de la línea base")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Medir y guardar la línea base en lugar de comparar")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Subida relativa de la mediana que cuenta como regresión (0.15 = 15%%)")
+    parser.add_argument("--min-delta", type=float, default=0.005,
+                        help="Subida mínima en ms para contar como regresión")
+    parser.add_argument("--samples", type=int, default=200, help="Muestras por benchmark")
+    parser.add_argument("--repeats", type=int, default=3, help="Veces que se ejecuta la batería")
+    parser.add_argument("--confirm", type=int, default=3,
+                        help="Mediciones extra de los benchmarks que parezcan más lentos")
+    args = parser.parse_args()
+
+    baseline = None
+    if not args.save_baseline:
+        if not os.path.exists(args.baseline):
+            print(f"No hay línea base en {args.baseline}. Guárdala antes con --save-baseline")
+            return 2
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+
+    pygame.init()
+    current = best_of([run_suite(args.samples) for _ in range(args.repeats)])
+
+    if args.save_baseline:
+        pygame.quit()
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(current, file, indent=2)
+        print(f"Línea base guardada en {args.baseline} ({len(current['results'])} benchmarks)")
+        return 0
+
+    # Volver a medir lo que parece más lento antes de dar la alarma
+    for _ in range(args.confirm):
+        suspects = [row[0] for row in compare(baseline, current, args.threshold, args.min_delta)
+                    if row[4] == "MÁS LENTO"]
+        if not suspects:
+            break
+        current = best_of([current, run_suite(args.samples, names=suspects)])
+    pygame.quit()
+
+    base_meta = baseline.get("meta", {})
+    print(f"Línea base: commit {base_meta.get('commit')} ({base_meta.get('timestamp')}), "
+          f"actual: commit {current['meta']['commit']}")
+    for key in ("platform", "python", "pygame", "numpy"):
+        if base_meta.get(key) != current["meta"][key]:
+            print(f"Aviso: la línea base es de otro {key} ({base_meta.get(key)} != {current['meta'][key]})")
+
+    rows = compare(baseline, current, args.threshold, args.min_delta)
+    print_table(rows)
+
+    regressions = [row for row in rows if row[4] == "MÁS LENTO"]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) más lentos que la línea base "
+              f"(más de {args.threshold:.0%} y {args.min_delta} ms)")
+        return 1
+    print("Sin regresiones de rendimiento")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
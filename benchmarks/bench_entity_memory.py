@@ -0,0 +1,112 @@
+"""
+bench_entity_memory.py - Benchmark de memoria por entidad
+
+Mide cuántos bytes ocupa cada entidad del juego, para dimensionar
+escenarios con muchas entidades (hordas, pruebas de estrés):
+- DICT: el objeto guardando sus atributos en un __dict__ (como antes)
+- SLOTS: el objeto con __slots__ (como ahora)
+- TOTAL: lo que cuesta crear una entidad completa con su constructor
+  (objeto + pygame.Rect y demás valores propios), medido con tracemalloc
+
+Para DICT y SLOTS se crean N copias del objeto que comparten los mismos
+valores, así solo se mide el "contenedor" de los atributos.
+
+Se ejecuta sin ventana:
+    python benchmarks/bench_entity_memory.py
+    python benchmarks/bench_entity_memory.py --count 50000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+from settings import *
+from entities import Player, Obstacle, Enemy, Knife, PowerUp, Explosion, ScreenEffect
+from abilities import CooldownTimer, ComboSystem
+
+
+class DictBacked:
+    """Objeto normal (con __dict__), como eran las entidades antes de __slots__."""
+
+
+def all_slots(cls):
+    """Devuelve todos los nombres de __slots__ de una clase y sus padres."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        names.extend(klass.__dict__.get('__slots__', ()))
+    return names
+
+
+def measure(build, count):
+    """Bytes por objeto al crear `count` objetos con build()."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [build() for _ in range(count)]
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (end - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria por entidad con __dict__ y con __slots__")
+    parser.add_argument("--count", type=int, default=10000, help="Entidades creadas por clase")
+    args = parser.parse_args()
+
+    pygame.init()
+    with contextlib.redirect_stdout(io.StringIO()):
+        player = Player()
+        factories = {
+            "Player": Player,
+            "Obstacle": Obstacle,
+            "Enemy": lambda: Enemy(WINDOW_WIDTH // 2),
+            "Knife": lambda: Knife(player.rect),
+            "PowerUp": lambda: PowerUp('vodka'),
+            "Explosion": lambda: Explosion(100, 100),
+            "ScreenEffect": ScreenEffect,
+            "CooldownTimer": lambda: CooldownTimer(SCRAPER_COOLDOWN),
+            "ComboSystem": ComboSystem,
+        }
+        # Entidades de muestra (los valores se comparten entre las copias)
+        samples = {name: factory() for name, factory in factories.items()}
+
+    print(f"Memoria por entidad - {args.count} entidades por clase (bytes)")
+    print(f"{'clase':>14}{'dict':>9}{'slots':>9}{'ahorro':>9}{'total':>9}")
+
+    for name, sample in samples.items():
+        cls = type(sample)
+        values = {slot: getattr(sample, slot) for slot in all_slots(cls)}
+
+        def build_dict():
+            obj = DictBacked()
+            obj.__dict__.update(values)
+            return obj
+
+        def build_slots():
+            obj = object.__new__(cls)
+            for slot, value in values.items():
+                setattr(obj, slot, value)
+            return obj
+
+        dict_bytes = measure(build_dict, args.count)
+        slot_bytes = measure(build_slots, args.count)
+        # Los sprites salen de sprite_cache, así que sus Surfaces no cuentan aquí
+        with contextlib.redirect_stdout(io.StringIO()):
+            total_bytes = measure(factories[name], args.count)
+
+        saving = 1 - slot_bytes / dict_bytes
+        print(f"{name:>14}{dict_bytes:>9.0f}{slot_bytes:>9.0f}{saving:>8.0%}{total_bytes:>9.0f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
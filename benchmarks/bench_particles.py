@@ -0,0 +1,154 @@
+"""
+bench_particles.py - Benchmark del motor de partículas
+
+Compara el coste por frame (update + draw) de mantener N partículas vivas:
+- DICCIONARIOS: una lista de diccionarios actualizados uno a uno y dibujados
+  con pygame.draw.circle() (lo que hacían Explosion y ParticleEffect)
+- NUMPY: el motor ParticleSystem de particles.py (física vectorizada y un
+  solo blits() con sellos cacheados)
+
+En cada frame se lanzan ráfagas nuevas para que el número de partículas
+vivas se mantenga más o menos en N, igual que en una partida con muchas
+explosiones seguidas.
+
+Se ejecuta sin ventana:
+    python benchmarks/bench_particles.py
+    python benchmarks/bench_particles.py --sizes 1000 10000 --frames 100
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+from settings import *
+from particles import ParticleSystem
+
+BURST_SIZE = PARTICLE_COUNT
+
+
+class LegacyParticles:
+    """Partículas como diccionarios, copiado de la antigua clase Explosion."""
+
+    def __init__(self):
+        self.particles = []
+
+    def spawn_burst(self, x, y, color, count):
+        for _ in range(count):
+            angle = random.uniform(0, 2 * 3.14159)
+            speed = random.uniform(2, 8)
+            self.particles.append({
+                'x': x,
+                'y': y,
+                'vel_x': pygame.math.Vector2(speed, 0).rotate_rad(angle).x,
+                'vel_y': pygame.math.Vector2(speed, 0).rotate_rad(angle).y,
+                'size': random.randint(2, 5),
+                'life': random.randint(15, PARTICLE_LIFE),
+                'color': color,
+            })
+
+    def update(self):
+        for particle in self.particles[:]:
+            particle['x'] += particle['vel_x']
+            particle['y'] += particle['vel_y']
+            particle['life'] -= 1
+            particle['vel_y'] += 0.2
+            particle['vel_x'] *= 0.98
+            if particle['life'] <= 0:
+                self.particles.remove(particle)
+
+    def draw(self, screen):
+        for particle in self.particles:
+            alpha_factor = particle['life'] / PARTICLE_LIFE
+            particle_color = tuple(int(c * alpha_factor) for c in particle['color'])
+            pygame.draw.circle(screen, particle_color,
+                               (int(particle['x']), int(particle['y'])),
+                               particle['size'])
+
+    def __len__(self):
+        return len(self.particles)
+
+
+class EngineParticles:
+    """Adaptador de ParticleSystem con la misma interfaz que LegacyParticles."""
+
+    def __init__(self):
+        self.system = ParticleSystem()
+
+    def spawn_burst(self, x, y, color, count):
+        self.system.spawn_burst(x, y, color, count, "blast")
+
+    def update(self):
+        self.system.update()
+
+    def draw(self, screen):
+        self.system.draw(screen)
+
+    def __len__(self):
+        return len(self.system)
+
+
+def run(particles, target, frames, screen):
+    """
+    Simula frames con unas `target` partículas vivas.
+
+    Returns:
+        tuple: (ms por frame, partículas vivas de media)
+    """
+    random.seed(7)
+    colors = [YELLOW, RED, PURPLE, WHITE]
+    # Partículas nuevas por frame para mantener unas `target` vivas
+    per_frame = max(BURST_SIZE, target * 2 // PARTICLE_LIFE)
+
+    def frame():
+        while len(particles) < target:
+            particles.spawn_burst(random.randrange(WINDOW_WIDTH), random.randrange(WINDOW_HEIGHT),
+                                  random.choice(colors), BURST_SIZE)
+        for _ in range(per_frame // BURST_SIZE):
+            particles.spawn_burst(random.randrange(WINDOW_WIDTH), random.randrange(WINDOW_HEIGHT),
+                                  random.choice(colors), BURST_SIZE)
+        particles.update()
+        particles.draw(screen)
+
+    # Calentar (llenar el sistema y las cachés de sellos)
+    for _ in range(PARTICLE_LIFE):
+        frame()
+
+    alive = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame()
+        alive += len(particles)
+    elapsed = time.perf_counter() - start
+    return elapsed / frames * 1000, alive // frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de partículas con diccionarios y con NumPy")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000],
+                        help="Número de partículas vivas a mantener")
+    parser.add_argument("--frames", type=int, default=60, help="Frames medidos por caso")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print(f"Partículas (update + draw) - {args.frames} frames por caso (ms/frame)")
+    print(f"{'partículas':>11}{'vivas':>8}{'dicts':>10}{'numpy':>10}{'mejora':>10}")
+
+    for size in args.sizes:
+        before, alive = run(LegacyParticles(), size, args.frames, screen)
+        after, _ = run(EngineParticles(), size, args.frames, screen)
+        print(f"{size:>11}{alive:>8}{before:>10.3f}{after:>10.3f}{before / after:>9.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
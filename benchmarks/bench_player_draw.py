@@ -0,0 +1,69 @@
+"""
+bench_player_draw.py - Microbenchmark del dibujado del jugador
+
+Compara el coste por frame de dibujar al jugador:
+- ANTES: transform.flip() + copy() + Surface de tinte en cada frame
+- DESPUÉS: Player.draw() con la tabla de variantes pre-dibujadas
+
+Se ejecuta sin ventana (drivers "dummy" de SDL):
+    python benchmarks/bench_player_draw.py
+"""
+
+import os
+import sys
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+from settings import *
+
+FRAMES = 5000
+
+
+def legacy_draw(player, screen):
+    """Copia del Player.draw() original (flip + tinte en cada frame)."""
+    sprite_to_draw = player.sprite
+    if player.facing_direction == -1:
+        sprite_to_draw = pygame.transform.flip(player.sprite, True, False)
+    if player.has_shield:
+        sprite_to_draw = sprite_to_draw.copy()
+        tint_surface = pygame.Surface(sprite_to_draw.get_size(), pygame.SRCALPHA)
+        tint_surface.fill((*CACHOPO_COLOR, 100))
+        sprite_to_draw.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+    screen.blit(sprite_to_draw, player.rect)
+
+
+def time_per_frame(draw_function, player, screen):
+    """Devuelve el coste medio en microsegundos de una llamada a draw_function."""
+    seconds = timeit.timeit(lambda: draw_function(player, screen), number=FRAMES)
+    return seconds / FRAMES * 1_000_000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    from entities import Player
+    player = Player()
+
+    print(f"Player.draw - {FRAMES} frames por caso (µs/frame)")
+    print(f"{'caso':<28}{'antes':>10}{'después':>10}{'mejora':>10}")
+
+    for facing, has_shield in ((1, False), (-1, False), (1, True), (-1, True)):
+        player.facing_direction = facing
+        player.has_shield = has_shield
+
+        before = time_per_frame(legacy_draw, player, screen)
+        after = time_per_frame(lambda p, s: p.draw(s), player, screen)
+
+        label = f"{'izquierda' if facing == -1 else 'derecha'}, escudo={'sí' if has_shield else 'no'}"
+        print(f"{label:<28}{before:>10.2f}{after:>10.2f}{before / after:>9.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
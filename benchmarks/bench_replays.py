@@ -0,0 +1,121 @@
+"""
+bench_replays.py - Reproducir repeticiones a máxima velocidad
+
+Vuelve a jugar sin pantalla todas las repeticiones .rpl de una carpeta
+(ver replay.py) y, para cada una, muestra:
+- TICKS y lo que duraría la partida en tiempo real
+- BYTES que ocupa el archivo
+- Ticks por segundo al reproducirla y cuántas veces más rápido que jugando
+- Si la puntuación final coincide con la grabada (OK / DISTINTA)
+
+Si alguna puntuación no coincide, algo ha cambiado la lógica del juego
+y el script termina con código 1 (sirve como comprobación de regresiones).
+
+Sin repeticiones en la carpeta, graba antes unas cuantas partidas con
+un "bot" que cambia de teclas cada poco (--generate N).
+
+Se ejecuta sin ventana:
+    python benchmarks/bench_replays.py
+    python benchmarks/bench_replays.py --dir replays --backend soa
+    python benchmarks/bench_replays.py --generate 20
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+from settings import *
+from simulation import GameSimulation, InputSnapshot
+from replay import Replay, ReplayRecorder, play_replay, REPLAY_EXTENSION
+
+
+def record_bot_game(seed, directory):
+    """Juega una partida con un bot de teclas aleatorias y guarda su repetición."""
+    bot = random.Random(seed)
+    recorder = ReplayRecorder()
+    simulation = GameSimulation(seed=seed)
+    recorder.start(simulation.run_seed)
+
+    inputs = InputSnapshot()
+    while not simulation.game_over:
+        if bot.random() < 0.05:
+            # Cambiar de teclas mantenidas de vez en cuando, como una persona
+            inputs = InputSnapshot(left=bot.random() < 0.4, right=bot.random() < 0.4,
+                                   up=bot.random() < 0.2, down=bot.random() < 0.2)
+        throw = bot.random() < 0.05
+        tick_inputs = InputSnapshot(inputs.left, inputs.right, inputs.up, inputs.down, throw)
+        recorder.record(tick_inputs)
+        simulation.step(tick_inputs)
+
+    recorder.replay.score = simulation.player.score
+    path = os.path.join(directory, f"bot_{seed}{REPLAY_EXTENSION}")
+    recorder.replay.save(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduce repeticiones sin pantalla y comprueba la puntuación")
+    parser.add_argument("--dir", default=REPLAY_DIR, help="Carpeta con las repeticiones .rpl")
+    parser.add_argument("--backend", default=THREAT_BACKEND, choices=["objects", "soa"],
+                        help="Backend de amenazas de la simulación")
+    parser.add_argument("--generate", type=int, default=0,
+                        help="Grabar antes N partidas de un bot (si la carpeta está vacía se graban 5)")
+    args = parser.parse_args()
+
+    pygame.init()
+
+    paths = sorted(glob.glob(os.path.join(args.dir, "*" + REPLAY_EXTENSION)))
+    generate = args.generate or (0 if paths else 5)
+    if generate:
+        os.makedirs(args.dir, exist_ok=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for seed in range(1, generate + 1):
+                record_bot_game(seed, args.dir)
+        paths = sorted(glob.glob(os.path.join(args.dir, "*" + REPLAY_EXTENSION)))
+
+    print(f"Repeticiones en {args.dir} (backend {args.backend})")
+    print(f"{'archivo':>28}{'ticks':>9}{'tiempo':>9}{'bytes':>8}{'ticks/s':>10}{'velocidad':>11}  puntuación")
+
+    total_ticks = 0
+    total_seconds = 0.0
+    failures = 0
+    for path in paths:
+        replay = Replay.load(path)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            simulation = play_replay(replay, args.backend)
+            elapsed = time.perf_counter() - start
+
+        ticks = simulation.frame_count
+        total_ticks += ticks
+        total_seconds += elapsed
+        ok = simulation.player.score == replay.score
+        failures += not ok
+
+        game_seconds = len(replay) / replay.tick_rate
+        rate = ticks / elapsed
+        status = "OK" if ok else f"DISTINTA ({simulation.player.score} != {replay.score})"
+        print(f"{os.path.basename(path)[-28:]:>28}{len(replay):>9}{game_seconds:>8.0f}s"
+              f"{os.path.getsize(path):>8}{rate:>10.0f}{rate / replay.tick_rate:>10.0f}x  {status}")
+
+    if total_seconds:
+        print(f"Total: {total_ticks} ticks en {total_seconds:.2f} s "
+              f"({total_ticks / total_seconds / TICK_RATE:.0f}x tiempo real), {failures} distintas")
+
+    pygame.quit()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
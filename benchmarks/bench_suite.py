@@ -0,0 +1,247 @@
+"""
+bench_suite.py - Batería de benchmarks de los caminos calientes (resultados en JSON)
+
+Los demás bench_*.py comparan dos versiones de UNA cosa. Esta batería
+mide de una vez todo lo que se ejecuta cada frame, sobre el juego real
+(JuliasRunGame) y sin ventana, y guarda los resultados en un JSON para
+comparar commits:
+- update_game_logic/N: un tick de juego con N amenazas (10, 100, 1000)
+- draw_game_content/N: dibujar la pantalla de juego con N amenazas
+- new/<Clase>: cada constructor de entidad
+- effects/update y effects/draw: explosiones y efectos de partículas
+- hud/draw: el HUD (puntuación, vidas, cooldown, combos...)
+
+Cada benchmark toma muchas muestras y guarda la mediana y el p95 (el
+tiempo que no supera el 95% de las muestras) en milisegundos. Los
+constructores se miden en lotes y se divide entre el tamaño del lote.
+
+La partida usa siempre la misma semilla (ver random_streams.py), así que
+dos ejecuciones miden exactamente el mismo trabajo.
+
+Se ejecuta sin ventana:
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --output resultados.json --samples 500
+    python benchmarks/bench_suite.py --filter update_game_logic
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+import numpy as np
+import pygame
+from settings import *
+from bench_threats import fill
+
+THREAT_COUNTS = (10, 100, 1000)
+SUITE_SEED = 1
+
+
+def summarize(samples):
+    """
+    Resume una lista de tiempos (ms).
+
+    Returns:
+        dict: median_ms, p95_ms (rango más cercano), min_ms y número de muestras
+    """
+    ordered = sorted(samples)
+    p95_index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+    return {
+        "median_ms": statistics.median(ordered),
+        "p95_ms": ordered[p95_index],
+        "min_ms": ordered[0],
+        "samples": len(ordered),
+    }
+
+
+def measure(run, samples, batch=1, prepare=None):
+    """
+    Mide `samples` veces la función run (sin contar prepare).
+
+    Args:
+        run: Función a medir (sin argumentos)
+        samples: Número de muestras
+        batch: Llamadas a run por muestra (el tiempo se divide entre batch)
+        prepare: Función opcional que se llama antes de cada muestra, fuera del cronómetro
+
+    Returns:
+        list: Milisegundos por llamada de cada muestra
+    """
+    times = []
+    for _ in range(samples):
+        if prepare is not None:
+            prepare()
+        start = time.perf_counter()
+        for _ in range(batch):
+            run()
+        times.append((time.perf_counter() - start) * 1000 / batch)
+    return times
+
+
+def get_commit():
+    """Hash corto del commit actual (None si no es un repositorio git)."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def new_game():
+    """Crea el juego real (sin ventana) con una partida de semilla fija."""
+    from main import JuliasRunGame
+
+    game = JuliasRunGame()
+    game.simulation.seed = SUITE_SEED
+    game.reset_game()
+    return game
+
+
+def build_benchmarks(game):
+    """
+    Devuelve los benchmarks como {nombre: (run, batch, prepare)}.
+
+    Args:
+        game: JuliasRunGame ya creado
+    """
+    from entities import Player, Obstacle, Enemy, Knife, PowerUp, Explosion, ScreenEffect
+    from abilities import ParticleEffect
+    from particles import particle_system
+
+    simulation = game.simulation
+    benchmarks = {}
+
+    def keep_threats(count):
+        def prepare():
+            simulation.player.invulnerability_timer = TICK_RATE  # Que la partida no acabe
+            fill(simulation, count)
+        return prepare
+
+    for count in THREAT_COUNTS:
+        benchmarks[f"update_game_logic/{count}"] = (game.update_game_logic, 1, keep_threats(count))
+    for count in THREAT_COUNTS:
+        benchmarks[f"draw_game_content/{count}"] = (lambda: game.draw_game_content(game.screen), 1,
+                                                    keep_threats(count))
+
+    player_rect = simulation.player.rect
+    constructors = {
+        "Player": Player,
+        "Obstacle": Obstacle,
+        "Enemy": lambda: Enemy(WINDOW_WIDTH // 2),
+        "Knife": lambda: Knife(player_rect),
+        "PowerUp": lambda: PowerUp('vodka'),
+        "Explosion": lambda: Explosion(100, 100),
+        "ParticleEffect": lambda: ParticleEffect(100, 100, YELLOW, 15, "sparkle"),
+        "ScreenEffect": ScreenEffect,
+    }
+    for name, constructor in constructors.items():
+        # Cada Explosion/ParticleEffect lanza partículas: vaciar antes de cada lote
+        benchmarks[f"new/{name}"] = (constructor, 100, particle_system.clear)
+
+    def keep_effects():
+        """Mantener unas 20 explosiones y 20 efectos vivos, como en una partida movida."""
+        while len(game.explosions) < 20:
+            game.explosions.append(game.explosion_pool.acquire(random.randrange(WINDOW_WIDTH),
+                                                               random.randrange(WINDOW_HEIGHT)))
+        while len(game.particles) < 20:
+            game.particles.append(game.particle_effect_pool.acquire(
+                random.randrange(WINDOW_WIDTH), random.randrange(WINDOW_HEIGHT), YELLOW, 15, "sparkle"))
+
+    def update_effects():
+        game.explosions.retain(Explosion.update)
+        game.particles.retain(ParticleEffect.update)
+        particle_system.update()
+
+    def prepare_draw():
+        keep_effects()
+        update_effects()
+
+    benchmarks["effects/update"] = (update_effects, 1, keep_effects)
+    benchmarks["effects/draw"] = (lambda: particle_system.draw(game.screen), 1, prepare_draw)
+    benchmarks["hud/draw"] = (lambda: game.draw_hud(game.screen), 1, None)
+    return benchmarks
+
+
+def run_suite(samples, name_filter=None, names=None):
+    """
+    Ejecuta la batería completa.
+
+    Args:
+        samples: Muestras por benchmark
+        name_filter: Texto que debe aparecer en el nombre (None = todos)
+        names: Nombres exactos a ejecutar (None = todos)
+
+    Returns:
+        dict: {"meta": {...}, "results": {nombre: resumen}}
+    """
+    random.seed(SUITE_SEED)
+    results = {}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = new_game()
+        benchmarks = build_benchmarks(game)
+
+    for name, (run, batch, prepare) in benchmarks.items():
+        if name_filter and name_filter not in name:
+            continue
+        if names is not None and name not in names:
+            continue
+
+        # Cada benchmark empieza con la misma partida vacía
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.reset_game()
+            measure(run, max(1, samples // 10), batch, prepare)  # Calentar cachés
+            times = measure(run, samples, batch, prepare)
+        results[name] = summarize(times)
+
+    meta = {
+        "commit": get_commit(),
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "samples": samples,
+        "threat_backend": THREAT_BACKEND,
+    }
+    return {"meta": meta, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batería de benchmarks sin ventana con salida JSON")
+    parser.add_argument("--samples", type=int, default=200, help="Muestras por benchmark")
+    parser.add_argument("--output", default="bench_results.json", help="Archivo JSON de resultados")
+    parser.add_argument("--filter", default=None, help="Solo los benchmarks cuyo nombre contenga este texto")
+    args = parser.parse_args()
+
+    pygame.init()
+    report = run_suite(args.samples, args.filter)
+    pygame.quit()
+
+    print(f"Benchmarks - {args.samples} muestras (ms)")
+    print(f"{'benchmark':>28}{'mediana':>10}{'p95':>10}")
+    for name, result in report["results"].items():
+        print(f"{name:>28}{result['median_ms']:>10.4f}{result['p95_ms']:>10.4f}")
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+bench_threats.py - Benchmark de los backends de amenazas
+
+Compara el coste por frame de GameSimulation.update_entities() con:
+- OBJECTS: cada amenaza es un objeto con su update() + rejilla espacial
+- SOA: todas las amenazas en arrays de NumPy (threat_store.py)
+
+En cada frame se rellena la partida hasta N amenazas (una de cada diez
+es un enemigo) repartidas por la pantalla, con una espátula por cada
+diez amenazas. El jugador es invulnerable para que la partida no acabe.
+Solo se mide update_entities(), no el relleno.
+
+Se ejecuta sin ventana:
+    python benchmarks/bench_threats.py
+    python benchmarks/bench_threats.py --sizes 100 1000 --frames 100
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+from settings import *
+from simulation import GameSimulation, InputSnapshot
+
+
+def fill(simulation, threat_count):
+    """Rellena la partida hasta threat_count amenazas y threat_count // 10 espátulas."""
+    while len(simulation.obstacles) + len(simulation.enemies) < threat_count:
+        if random.random() < 0.1:
+            threat = simulation.enemy_pool.acquire(simulation.player.rect.centerx)
+            add = simulation.add_enemy
+        else:
+            threat = simulation.obstacle_pool.acquire()
+            add = simulation.add_obstacle
+        threat.rect.y = random.randrange(-OBSTACLE_HEIGHT, WINDOW_HEIGHT)
+        add(threat)
+
+    while len(simulation.knives) < max(1, threat_count // 10):
+        knife = simulation.knife_pool.acquire(simulation.player.rect)
+        knife.rect.x = random.randrange(WINDOW_WIDTH)
+        knife.rect.y = random.randrange(WINDOW_HEIGHT)
+        simulation.knives.append(knife)
+
+
+def run(backend, threat_count, frames):
+    """Devuelve los milisegundos por frame de update_entities() con un backend."""
+    random.seed(1)
+    inputs = InputSnapshot()
+    elapsed = 0.0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = GameSimulation(backend, seed=1)
+        for _ in range(frames):
+            simulation.player.invulnerability_timer = TICK_RATE
+            fill(simulation, threat_count)
+
+            start = time.perf_counter()
+            simulation.update_entities(inputs)
+            elapsed += time.perf_counter() - start
+
+    return elapsed / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de amenazas con objetos y con arrays (SoA)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 2000],
+                        help="Número de amenazas a mantener")
+    parser.add_argument("--frames", type=int, default=50, help="Frames medidos por caso")
+    args = parser.parse_args()
+
+    pygame.init()
+
+    print(f"update_entities() - {args.frames} frames por caso (ms/frame)")
+    print(f"{'amenazas':>10}{'objects':>11}{'soa':>11}{'mejora':>10}")
+
+    for size in args.sizes:
+        before = run("objects", size, args.frames)
+        after = run("soa", size, args.frames)
+        print(f"{size:>10}{before:>11.3f}{after:>11.3f}{before / after:>9.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,23 @@ diseñado para enseñar programación orientada a objetos.
 Módulos:
 - main: Punto de entrada y game loop principal
 - settings: Configuración y constantes del juego
+- simulation: Lógica de juego sin pantalla ni audio (GameSimulation)
+- spatial: Rejilla espacial para colisiones (SpatialHash)
+- threat_store: Amenazas en arrays de NumPy (ThreatStore, backend "soa")
+- timestep: Paso de tiempo fijo e interpolación al dibujar (FixedTimestep)
 - entities: Clases de entidades (Player, Obstacle, etc.)
 - abilities: Sistema de power-ups y cooldowns
+- audio: Banco de sonidos precargados con pool de canales
+- containers: EntityList (borrado diferido) y ObjectPool (reutilizar entidades)
+- particles: Motor de partículas vectorizado con NumPy (ParticleSystem)
+- profiler: Perfilador de fases del frame para el overlay de F1 (FrameProfiler)
+- random_streams: Generadores aleatorios con semilla por subsistema (RandomStreams)
+- replay: Grabación y reproducción de partidas (Replay, ReplayRecorder, play_replay)
+- frame_times: Tiempos de frame, percentiles y peores frames (FrameTimeRecorder)
+- tracing: Línea de tiempo en formato Chrome trace-event (Tracer)
+- allocations: Memoria reservada por frame con tracemalloc (AllocationTracker)
 - game_states: Estados del juego (menú, juego, game over)
+- graphics: Cachés gráficas (sprites, fondos, rotaciones...)
 - utils: Funciones auxiliares y utilidades
 
 Para ejecutar el juego:
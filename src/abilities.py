@@ -15,8 +15,10 @@ Referencias útiles:
 """
 
 import pygame
-import random
 from settings import *
+from audio import sound_bank
+from graphics import font_registry, text_cache
+from particles import particle_system, PARTICLE_PRESETS
 
 class CooldownTimer:
     """
@@ -31,6 +33,9 @@ class CooldownTimer:
     - max_cooldown: Duración total del cooldown en frames
     """
     
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = ('max_cooldown', 'frames_remaining')
+    
     def __init__(self, cooldown_frames):
         """
         Constructor del timer de cooldown.
@@ -85,6 +90,9 @@ class CooldownTimer:
             screen: Superficie donde dibujar
             x, y: Posición de la barra (opcional, usa valores por defecto de settings)
             width, height: Tamaño de la barra (opcional, usa valores por defecto)
+            
+        Returns:
+            pygame.Rect: Zona dibujada (barra + texto), para dirty rects
         """
         # Usar valores por defecto de settings si no se especifican
         if x is None: x = COOLDOWN_BAR_X
@@ -119,20 +127,17 @@ class CooldownTimer:
         # Borde de la barra
         pygame.draw.rect(screen, BLACK, background_rect, 2)
         
-        # ✅ IMPLEMENTADO: Texto indicativo
+        # ✅ IMPLEMENTADO: Texto indicativo (fuente y texto cacheados, ver graphics.py)
+        font = font_registry.get(FONT_SIZE_SMALL)
         if progress >= 1.0:
             # Mostrar "LISTO" cuando está disponible
-            font = pygame.font.Font(None, 16)
-            text = font.render("LISTO", True, WHITE)
-            text_rect = text.get_rect(center=(x + width // 2, y - 12))
-            screen.blit(text, text_rect)
+            text = text_cache.render(font, "LISTO", True, WHITE)
         else:
             # Mostrar tiempo restante
-            time_left = self.frames_remaining / FPS
-            font = pygame.font.Font(None, 16)
-            text = font.render(f"{time_left:.1f}s", True, WHITE)
-            text_rect = text.get_rect(center=(x + width // 2, y - 12))
-            screen.blit(text, text_rect)
+            time_left = self.frames_remaining / TICK_RATE
+            text = text_cache.render(font, f"{time_left:.1f}s", True, WHITE)
+        text_rect = text.get_rect(center=(x + width // 2, y - 12))
+        return background_rect.union(screen.blit(text, text_rect))
 
 
 class PowerUpEffect:
@@ -144,6 +149,9 @@ class PowerUpEffect:
     de estos efectos.
     """
     
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = ('cocacola_timer', 'cachopo_timer', 'original_speed')
+    
     def __init__(self):
         """Constructor del sistema de efectos de power-ups."""
         
@@ -167,8 +175,8 @@ class PowerUpEffect:
         # Aumentar la velocidad del jugador
         player.speed = int(self.original_speed * COCACOLA_SPEED_MULTIPLIER)
         
-        # TODO 4: Añadir efecto sonoro
-        pygame.mixer.Sound(SOUND_POWERUP).play()
+        # ✅ IMPLEMENTADO: Efecto sonoro (precargado en el banco de sonidos)
+        sound_bank.play(SOUND_POWERUP)
         
         print("¡Coca-cola Boost activado! Velocidad aumentada.")  # Debug
     
@@ -185,8 +193,8 @@ class PowerUpEffect:
         # Activar escudo
         player.has_shield = True
         
-        # TODO 4: Añadir efecto sonoro
-        pygame.mixer.Sound(SOUND_POWERUP).play()
+        # ✅ IMPLEMENTADO: Efecto sonoro (precargado en el banco de sonidos)
+        sound_bank.play(SOUND_POWERUP)
         
         print("¡Cachopo Mágico activado! Escudo protector obtenido.")  # Debug
     
@@ -226,11 +234,11 @@ class PowerUpEffect:
     
     def get_cocacola_time_left(self):
         """Obtiene el tiempo restante del Coca-cola Boost en segundos."""
-        return self.cocacola_timer / FPS
+        return self.cocacola_timer / TICK_RATE
     
     def get_cachopo_time_left(self):
         """Obtiene el tiempo restante del Cachopo Mágico en segundos."""
-        return self.cachopo_timer / FPS
+        return self.cachopo_timer / TICK_RATE
     
     # ✅ IMPLEMENTADO: Método para mostrar efectos activos en pantalla
     def draw_active_effects(self, screen, font):
@@ -240,13 +248,17 @@ class PowerUpEffect:
         Args:
             screen: Superficie donde dibujar
             font: Fuente para el texto
+            
+        Returns:
+            list: Zonas dibujadas (pygame.Rect), para dirty rects
         """
+        dirty_rects = []
         y_offset = 140  # Posición inicial (debajo de la barra de cooldown)
         
         if self.is_cocacola_active():
             # ✅ IMPLEMENTADO: Efecto visual para Coca-cola Boost
             time_left = f"⚡ Coca-Cola Boost: {self.get_cocacola_time_left():.1f}s"
-            text = font.render(time_left, True, COCACOLA_COLOR)
+            text = text_cache.render(font, time_left, True, COCACOLA_COLOR)
             
             # Fondo semi-transparente para mejor legibilidad
             text_rect = text.get_rect()
@@ -259,12 +271,13 @@ class PowerUpEffect:
             pygame.draw.rect(screen, COCACOLA_COLOR, background_rect, 1)
             
             screen.blit(text, text_rect)
+            dirty_rects.append(background_rect)
             y_offset += 25
         
         if self.is_cachopo_active():
             # ✅ IMPLEMENTADO: Efecto visual para Cachopo Mágico
             time_left = f"🛡️ Cachopo Mágico: {self.get_cachopo_time_left():.1f}s"
-            text = font.render(time_left, True, CACHOPO_COLOR)
+            text = text_cache.render(font, time_left, True, CACHOPO_COLOR)
             
             # Fondo semi-transparente
             text_rect = text.get_rect()
@@ -277,7 +290,10 @@ class PowerUpEffect:
             pygame.draw.rect(screen, CACHOPO_COLOR, background_rect, 1)
             
             screen.blit(text, text_rect)
+            dirty_rects.append(background_rect)
             y_offset += 25
+        
+        return dirty_rects
 
 
 # ✅ IMPLEMENTADO: Clase para efectos de partículas
@@ -287,9 +303,16 @@ class ParticleEffect:
     
     Las partículas son pequeños elementos gráficos que se mueven
     y desaparecen para crear efectos como explosiones, chispas, etc.
+    
+    ✅ IMPLEMENTADO: Las partículas viven en el motor global
+    (particle_system, ver particles.py), que calcula la física de todas
+    a la vez con NumPy. Esta clase solo lanza la ráfaga y cuenta su vida.
     """
     
-    def __init__(self, x, y, color, particle_count=10, effect_type="explosion"):
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = ('effect_type', 'life')
+    
+    def __init__(self, x, y, color, particle_count=10, effect_type="explosion", priority=None):
         """
         Constructor del sistema de partículas.
         
@@ -298,79 +321,33 @@ class ParticleEffect:
             color: Color base de las partículas
             particle_count: Número de partículas a crear
             effect_type: Tipo de efecto ("explosion", "sparkle", "trail")
+            priority: PARTICLE_PRIORITY_* (None = la del tipo de efecto)
+        """
+        self.reset(x, y, color, particle_count, effect_type, priority)
+    
+    def reset(self, x, y, color, particle_count=10, effect_type="explosion", priority=None):
+        """
+        Reinicia el efecto con una ráfaga nueva (para ObjectPool).
+        
+        Los argumentos son los mismos que los del constructor.
         """
-        self.particles = []
         self.effect_type = effect_type
         
-        for _ in range(particle_count):
-            if effect_type == "explosion":
-                # Partículas que salen en todas las direcciones
-                angle = random.uniform(0, 2 * 3.14159)
-                speed = random.uniform(1, 6)
-            elif effect_type == "sparkle":
-                # Partículas que suben lentamente
-                angle = random.uniform(-0.5, 0.5)  # Principalmente hacia arriba
-                speed = random.uniform(0.5, 2)
-            else:  # "trail"
-                # Partículas que caen
-                angle = random.uniform(1.57 - 0.3, 1.57 + 0.3)  # Hacia abajo
-                speed = random.uniform(1, 3)
-            
-            particle = {
-                'x': x + random.uniform(-5, 5),
-                'y': y + random.uniform(-5, 5),
-                'vel_x': speed * pygame.math.Vector2(1, 0).rotate_rad(angle).x,
-                'vel_y': speed * pygame.math.Vector2(1, 0).rotate_rad(angle).y,
-                'size': random.randint(1, 4),
-                'life': random.randint(20, 40),
-                'max_life': 40,
-                'color': color
-            }
-            self.particles.append(particle)
+        # Vida del efecto = vida máxima de sus partículas
+        self.life = PARTICLE_PRESETS[effect_type]['max_life']
+        
+        # ✅ IMPLEMENTADO: Crear todas las partículas en una sola llamada
+        particle_system.spawn_burst(x, y, color, particle_count, effect_type, priority)
     
     def update(self):
         """
-        Actualizar posición de todas las partículas.
+        Avanzar el tiempo de vida del efecto.
         
         Returns:
             bool: False si todas las partículas expiraron, True si quedan activas
         """
-        for particle in self.particles[:]:
-            # Actualizar posición
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['life'] -= 1
-            
-            # Aplicar efectos físicos según el tipo
-            if self.effect_type == "explosion":
-                # Gravedad y fricción
-                particle['vel_y'] += 0.1  # Gravedad
-                particle['vel_x'] *= 0.98  # Fricción
-            elif self.effect_type == "sparkle":
-                # Flotación suave
-                particle['vel_y'] -= 0.05  # Anti-gravedad
-                particle['vel_x'] *= 0.99
-            
-            # Eliminar partículas muertas
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-        
-        return len(self.particles) > 0
-    
-    def draw(self, screen):
-        """Dibujar todas las partículas."""
-        for particle in self.particles:
-            # Calcular alpha (transparencia) basada en vida restante
-            alpha_factor = particle['life'] / particle['max_life']
-            
-            # Color que se desvanece
-            faded_color = tuple(int(c * alpha_factor) for c in particle['color'])
-            
-            # Dibujar partícula
-            if particle['size'] > 0:
-                pygame.draw.circle(screen, faded_color,
-                                 (int(particle['x']), int(particle['y'])),
-                                 int(particle['size'] * alpha_factor))
+        self.life -= 1
+        return self.life > 0
 
 
 # ✅ IMPLEMENTADO: Sistema de combos
@@ -382,6 +359,9 @@ class ComboSystem:
     de manera consecutiva (ej: destruir obstáculos seguidos).
     """
     
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = ('combo_count', 'combo_timer', 'max_combo_time', 'best_combo', 'combo_multiplier')
+    
     def __init__(self):
         """Constructor del sistema de combos."""
         self.combo_count = 0           # Número actual de combos
@@ -450,11 +430,15 @@ class ComboSystem:
         Args:
             screen: Superficie donde dibujar
             font: Fuente para el texto
+            
+        Returns:
+            pygame.Rect: Zona dibujada (None si no hay combo), para dirty rects
         """
+        dirty_rect = None
         if self.combo_count > 1:  # Solo mostrar si hay combo activo
             # Posición en la parte superior derecha
             combo_text = f"COMBO x{self.combo_count}"
-            text = font.render(combo_text, True, YELLOW)
+            text = text_cache.render(font, combo_text, True, YELLOW)
             
             # Calcular posición
             text_rect = text.get_rect()
@@ -468,15 +452,19 @@ class ComboSystem:
             pygame.draw.rect(screen, YELLOW, background_rect, 2)
             
             screen.blit(text, text_rect)
+            dirty_rect = background_rect
             
             # Multiplicador debajo
             if self.combo_multiplier > 1.0:
                 mult_text = f"{self.combo_multiplier:.1f}x puntos"
-                mult_surface = font.render(mult_text, True, GREEN)
+                mult_surface = text_cache.render(font, mult_text, True, GREEN)
                 mult_rect = mult_surface.get_rect()
                 mult_rect.right = WINDOW_WIDTH - 10
                 mult_rect.top = text_rect.bottom + 2
                 screen.blit(mult_surface, mult_rect)
+                dirty_rect = dirty_rect.union(mult_rect)
+        
+        return dirty_rect
 
 
 # TODO 7: Clase para efectos de partículas
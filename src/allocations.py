@@ -0,0 +1,214 @@
+"""
+allocations.py - Memoria reservada por frame (modo debug, F7)
+
+Crear objetos cada frame (Rects temporales, tuplas de color, Vector2,
+superficies rotadas o escaladas...) hace trabajar al recolector y al
+gestor de memoria de Python. Lo ideal es que una partida en marcha no
+reserve memoria nueva: todo sale de pools y cachés.
+
+AllocationTracker usa tracemalloc para medir dos cosas:
+- Por línea de código: cuánta memoria que SIGUE VIVA ha reservado, en
+  bytes por segundo. Cada ALLOC_SAMPLE_FRAMES frames compara una foto
+  (snapshot) de la memoria con la anterior. Solo cuenta el código del
+  juego (los archivos de src/)
+- Por frame: el pico de memoria temporal (reservada y liberada dentro
+  del mismo frame) con get_traced_memory() y reset_peak()
+
+tracemalloc solo ve la memoria viva en el momento de la foto, así que lo
+que se crea y se libera en el mismo frame no aparece por línea: aparece
+en el pico por frame. Entre las dos medidas se ve si una partida larga
+tiende a cero reservas.
+
+Solo para depurar: con tracemalloc activo todo el juego va más lento y
+cada foto tarda unos milisegundos (se ve como un tirón cada
+ALLOC_SAMPLE_FRAMES frames). Desactivado, mark_frame() es una función
+vacía. Al acabar la partida se guarda un resumen en ALLOC_SUMMARY_FILE.
+
+Conceptos de programación cubiertos:
+- Perfilado de memoria con tracemalloc (snapshots y compare_to)
+- Memoria viva frente a memoria temporal (picos)
+
+Referencias útiles:
+- tracemalloc: https://docs.python.org/3/library/tracemalloc.html
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from settings import *
+
+# Solo interesan las reservas hechas desde el código del juego
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _skip(*args):
+    """Sustituto de mark_frame() con el seguimiento desactivado."""
+
+
+def get_site_name(frame):
+    """Nombre corto de una línea de código: "entities.py:120"."""
+    return f"{os.path.basename(frame.filename)}:{frame.lineno}"
+
+
+class AllocationTracker:
+    """
+    Líneas del juego que más memoria reservan, en bytes por segundo.
+
+    Uso (lo hace JuliasRunGame en main.py):
+        allocation_tracker.set_enabled(True)     # F7 (con el modo debug)
+        allocation_tracker.mark_frame()          # Una vez por vuelta del game loop
+        allocation_tracker.top_sites             # [(línea, bytes/s, bloques/frame), ...]
+        allocation_tracker.write_summary()       # Al acabar la partida
+
+    Atributos:
+    - enabled: Si está midiendo
+    - top_sites: Líneas que más memoria han reservado en la última ventana
+    - frame_peak: Memoria temporal (bytes) del último frame
+    - max_frame_peak: Mayor memoria temporal de un frame desde clear()
+    - totals: Bytes netos reservados por cada línea desde clear()
+    - seconds, frames: Tiempo y frames medidos desde clear()
+    """
+
+    def __init__(self, interval=ALLOC_SAMPLE_FRAMES, top=ALLOC_TOP_SITES):
+        """
+        Constructor del medidor.
+
+        Args:
+            interval: Frames entre dos fotos de la memoria
+            top: Cuántas líneas se muestran
+        """
+        self.enabled = False
+        self.interval = interval
+        self.top = top
+        self.top_sites = []
+        self.frame_peak = 0
+        self.max_frame_peak = 0
+        self.totals = {}
+        self.seconds = 0.0
+        self.frames = 0
+        self._filters = [tracemalloc.Filter(True, os.path.join(SOURCE_DIR, "*")),
+                         tracemalloc.Filter(False, os.path.abspath(__file__))]  # Sin contarse a sí mismo
+        self._snapshot = None
+        self._snapshot_time = 0.0
+        self._window_frames = 0
+        self._frame_memory = 0
+        self._started = False  # Si tracemalloc lo arrancó este medidor
+        self.mark_frame = _skip
+
+    def set_enabled(self, enabled):
+        """Arranca o para tracemalloc (si ya estaba en marcha por otro motivo, se respeta)."""
+        if enabled and not self.enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started = True
+            self.enabled = True
+            self.clear()
+        elif not enabled and self.enabled:
+            self.enabled = False
+            self._snapshot = None
+            if self._started:
+                tracemalloc.stop()
+                self._started = False
+        self.mark_frame = self._mark_frame if self.enabled else _skip
+
+    def toggle(self):
+        """Cambia entre medir y no medir. Devuelve el nuevo estado."""
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def _take_snapshot(self):
+        """Foto de la memoria viva reservada desde src/."""
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def _mark_frame(self):
+        """Cierra un frame: apunta su pico de memoria temporal y, si toca, hace una foto."""
+        current, peak = tracemalloc.get_traced_memory()
+        self.frame_peak = max(0, peak - self._frame_memory)
+        self.max_frame_peak = max(self.max_frame_peak, self.frame_peak)
+        self._window_frames += 1
+
+        if self._window_frames >= self.interval:
+            self._sample()
+            current = tracemalloc.get_traced_memory()[0]  # La foto también reserva memoria
+
+        tracemalloc.reset_peak()
+        self._frame_memory = current
+
+    def _sample(self):
+        """Compara una foto nueva con la anterior y actualiza top_sites y totals."""
+        now = time.perf_counter()
+        snapshot = self._take_snapshot()
+        elapsed = max(now - self._snapshot_time, 1e-9)
+        frames = self._window_frames
+
+        growing = []
+        for stat in snapshot.compare_to(self._snapshot, 'lineno'):
+            if stat.size_diff == 0:
+                continue
+            site = get_site_name(stat.traceback[0])
+            self.totals[site] = self.totals.get(site, 0) + stat.size_diff
+            if stat.size_diff > 0:
+                growing.append((site, stat.size_diff / elapsed, stat.count_diff / frames))
+        growing.sort(key=lambda site: site[1], reverse=True)
+        self.top_sites = growing[:self.top]
+
+        self.seconds += elapsed
+        self.frames += frames
+        self._snapshot = snapshot
+        self._snapshot_time = time.perf_counter()  # No contar lo que tarda la foto
+        self._window_frames = 0
+
+    def get_summary(self):
+        """
+        Resumen desde clear().
+
+        Returns:
+            dict: tiempo, frames, bytes/s netos, mayor pico temporal de un
+                  frame y las líneas que más memoria han reservado
+        """
+        seconds = self.seconds or 1.0
+        top_totals = sorted(((size, site) for site, size in self.totals.items() if size > 0), reverse=True)
+        return {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "seconds": self.seconds,
+            "frames": self.frames,
+            "net_bytes_per_second": sum(self.totals.values()) / seconds,
+            "max_frame_peak_bytes": self.max_frame_peak,
+            "top_sites": [{"site": site, "bytes": size, "bytes_per_second": size / seconds}
+                          for size, site in top_totals[:self.top]],
+        }
+
+    def write_summary(self, path=ALLOC_SUMMARY_FILE):
+        """
+        Guarda el resumen en un archivo JSON.
+
+        Returns:
+            dict: El resumen guardado
+        """
+        summary = self.get_summary()
+        try:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(summary, file, indent=2)
+        except OSError as e:
+            print(f"Error guardando el resumen de memoria: {e}")
+        return summary
+
+    def clear(self):
+        """Empieza de cero (al activar y al empezar una partida nueva)."""
+        self.top_sites = []
+        self.frame_peak = 0
+        self.max_frame_peak = 0
+        self.totals = {}
+        self.seconds = 0.0
+        self.frames = 0
+        self._window_frames = 0
+        if self.enabled:
+            self._snapshot = self._take_snapshot()
+            self._snapshot_time = time.perf_counter()
+            tracemalloc.reset_peak()
+            self._frame_memory = tracemalloc.get_traced_memory()[0]
+
+
+# Instancia global (como frame_profiler)
+allocation_tracker = AllocationTracker()
@@ -0,0 +1,201 @@
+"""
+audio.py - Banco de sonidos de Chipi's Run
+
+Este archivo centraliza la carga y reproducción de efectos de sonido.
+Antes, cada golpe, lanzamiento o power-up creaba un pygame.mixer.Sound
+nuevo, lo que obligaba a leer y decodificar el WAV desde disco en mitad
+de un frame.
+
+Conceptos de programación cubiertos:
+- Precarga de recursos (cargar una vez, usar muchas)
+- Pool de recursos limitados (canales del mixer)
+- Límites de voces por sonido
+- Degradación elegante (el juego funciona aunque no haya audio)
+
+Referencias útiles:
+- pygame.mixer: https://www.pygame.org/docs/ref/mixer.html
+"""
+
+import pygame
+import settings
+from settings import *
+from tracing import tracer
+
+# Música: se reproduce en streaming con play_music(), no se precarga como Sound
+STREAMED_SOUNDS = ("SOUND_BACKGROUND", "SOUND_GAMEOVER")
+
+
+class SoundBank:
+    """
+    Banco de sonidos con objetos Sound precargados y un pool de canales.
+
+    - Todos los SOUND_* de settings.py se cargan UNA vez (excepto la música
+      de fondo y la de game over, que se reproducen en streaming con
+      pygame.mixer.music).
+    - Los efectos suenan por canales reservados (pygame.mixer.set_reserved),
+      así nunca se agotan los canales del mixer.
+    - Cada sonido tiene un máximo de voces simultáneas: si se supera, se
+      reutiliza la voz más antigua de ese mismo sonido.
+
+    Si el mixer no está inicializado (por ejemplo, en un servidor sin
+    tarjeta de sonido), play() simplemente no hace nada.
+    """
+
+    def __init__(self, channel_count=SOUNDBANK_CHANNELS):
+        """
+        Constructor del banco de sonidos.
+
+        Args:
+            channel_count: Número de canales reservados para efectos
+        """
+        self.channel_count = channel_count
+        self.sounds = {}            # ruta -> pygame.mixer.Sound
+        self.channels = []          # Canales reservados del pool
+        self._voices = []           # Por canal: (ruta, orden_de_inicio) o None
+        self._play_counter = 0      # Para saber qué voz es la más antigua
+        self._failed = set()        # Rutas que no se pudieron cargar
+
+    def is_available(self):
+        """Comprueba si hay un mixer de audio utilizable."""
+        return pygame.mixer.get_init() is not None
+
+    def load_all(self):
+        """
+        Precarga todos los efectos SOUND_* de settings.py y reserva los canales.
+
+        Llamar una vez después de pygame.mixer.init().
+        """
+        if not self.is_available():
+            return
+
+        # Reservar canales: Sound.play() normal nunca usará estos canales
+        if pygame.mixer.get_num_channels() < self.channel_count:
+            pygame.mixer.set_num_channels(self.channel_count)
+        pygame.mixer.set_reserved(self.channel_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+        self._voices = [None] * self.channel_count
+
+        for name in dir(settings):
+            if not name.startswith("SOUND_") or name in STREAMED_SOUNDS:
+                continue
+            self.load(getattr(settings, name))
+
+    def load(self, sound_path):
+        """
+        Carga un sonido en el banco (si no estaba ya cargado).
+
+        Args:
+            sound_path: Ruta del archivo de sonido
+
+        Returns:
+            pygame.mixer.Sound o None si no se pudo cargar
+        """
+        sound = self.sounds.get(sound_path)
+        if sound is not None or sound_path in self._failed:
+            return sound
+
+        try:
+            sound = pygame.mixer.Sound(sound_path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"⚠️ Error cargando sonido {sound_path}: {e}")
+            self._failed.add(sound_path)
+            return None
+
+        self.sounds[sound_path] = sound
+        return sound
+
+    def play(self, sound_path, volume=None):
+        """
+        Reproduce un efecto de sonido por el pool de canales.
+
+        Args:
+            sound_path: Ruta del sonido (constantes SOUND_* de settings.py)
+            volume: Volumen (0.0 a 1.0) o None para volumen completo
+
+        Returns:
+            pygame.mixer.Channel usado, o None si no sonó
+        """
+        if not self.is_available():
+            return None
+        if not self.channels:
+            self.load_all()
+
+        sound = self.load(sound_path)
+        if sound is None:
+            return None
+
+        index = self._pick_channel(sound_path)
+        channel = self.channels[index]
+        # El volumen se queda en el canal: ponerlo siempre para no heredar
+        # el de un sonido anterior más bajo
+        channel.set_volume(1.0 if volume is None else volume)
+        channel.play(sound)
+        tracer.instant("sonido", sound_path)  # ✅ En la traza (F6, ver tracing.py)
+
+        self._play_counter += 1
+        self._voices[index] = (sound_path, self._play_counter)
+        return channel
+
+    def _pick_channel(self, sound_path):
+        """
+        Elige el canal del pool para un nuevo sonido.
+
+        1. Si el sonido ya llegó a su límite de voces, reutiliza su voz más antigua.
+        2. Si no, usa un canal libre.
+        3. Si no hay canales libres, reutiliza la voz más antigua de todas.
+
+        Returns:
+            int: Índice del canal elegido
+        """
+        max_voices = SOUNDBANK_MAX_VOICES.get(sound_path, SOUNDBANK_DEFAULT_VOICES)
+
+        free_index = None
+        oldest_same = None      # (orden, índice) de la voz más antigua de este sonido
+        oldest_any = None       # (orden, índice) de la voz más antigua en general
+        active_same = 0
+
+        for index, channel in enumerate(self.channels):
+            voice = self._voices[index]
+            if voice is None or not channel.get_busy():
+                if free_index is None:
+                    free_index = index
+                continue
+
+            voice_path, order = voice
+            if oldest_any is None or order < oldest_any[0]:
+                oldest_any = (order, index)
+            if voice_path == sound_path:
+                active_same += 1
+                if oldest_same is None or order < oldest_same[0]:
+                    oldest_same = (order, index)
+
+        if active_same >= max_voices:
+            return oldest_same[1]
+        if free_index is not None:
+            return free_index
+        return oldest_any[1]
+
+    def get_active_voices(self):
+        """Número de canales del pool que están sonando ahora mismo."""
+        return sum(1 for channel in self.channels if channel.get_busy())
+
+    def play_music(self, music_path, loops=-1):
+        """
+        Reproduce música en streaming (pygame.mixer.music) sin romper el juego
+        si el archivo no existe o no hay audio.
+
+        Args:
+            music_path: Ruta del archivo de música
+            loops: Repeticiones (-1 = bucle infinito, 0 = una vez)
+        """
+        if not self.is_available():
+            return
+        try:
+            pygame.mixer.music.load(music_path)
+            pygame.mixer.music.play(loops)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"⚠️ Error cargando música {music_path}: {e}")
+
+
+# Banco de sonidos global: una sola instancia para todo el juego
+sound_bank = SoundBank()
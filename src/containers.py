@@ -0,0 +1,215 @@
+"""
+containers.py - Contenedores de entidades para el game loop
+
+Borrar elementos de una lista mientras se recorre es un error clásico.
+La solución de siempre (recorrer una copia con lista[:] y usar
+lista.remove()) funciona, pero cada frame crea una copia de cada lista y
+cada remove() es O(n) y compara por igualdad.
+
+EntityList evita las dos cosas: los elementos se marcan como muertos
+mientras se recorre la lista y se eliminan todos juntos al final, en una
+sola pasada y sin crear listas nuevas.
+
+ObjectPool va un paso más allá: en lugar de tirar las entidades que
+terminan y crear otras nuevas en cada spawn, las guarda y las reutiliza
+reiniciándolas "in place". Así, en una partida larga apenas se crean
+objetos nuevos y el recolector de basura (GC) tiene mucho menos trabajo.
+
+Conceptos de programación cubiertos:
+- Borrado diferido (marcar y compactar)
+- Modificar una lista "in place"
+- Herencia de tipos básicos (una clase hija de list)
+- Object Pool: reutilizar objetos en vez de crearlos y destruirlos
+
+Referencias útiles:
+- Game Programming Patterns (Object Pool): https://gameprogrammingpatterns.com/object-pool.html
+"""
+
+
+class EntityList(list):
+    """
+    Lista de entidades con borrado diferido (mark-dead-then-compact).
+
+    Uso típico dentro del game loop:
+        for obstacle in self.obstacles:
+            if not obstacle.update():
+                self.obstacles.discard(obstacle)   # Solo se marca
+        self.obstacles.compact()                   # Se eliminan todos juntos
+
+    Hereda de list, así que recorrerla, len() o acceder por índice cuestan
+    lo mismo que con una lista normal. Mientras se recorre solo se debe
+    usar discard(); los elementos marcados siguen en la lista hasta compact().
+
+    Se conserva el orden de los elementos (importa para el orden de dibujo
+    y para decidir qué amenaza golpea primero una espátula), por eso se
+    compacta en lugar de intercambiar con el último (swap-and-pop).
+
+    Los elementos muertos se identifican por id(), así que funciona también
+    con elementos no hasheables como los diccionarios de partículas.
+
+    Si se le pasa un ObjectPool, los elementos que salen de la lista
+    (compact, retain o clear) se devuelven automáticamente a ese pool.
+    """
+
+    def __init__(self, items=(), pool=None):
+        """
+        Constructor de la lista.
+
+        Args:
+            items: Elementos iniciales (opcional)
+            pool: ObjectPool al que devolver los elementos eliminados (opcional)
+        """
+        super().__init__(items)
+        self._dead_ids = set()
+        self.pool = pool
+
+    def discard(self, item):
+        """
+        Marca un elemento para eliminarlo en el próximo compact().
+
+        Es seguro llamarlo mientras se recorre la lista.
+        """
+        self._dead_ids.add(id(item))
+
+    def is_dead(self, item):
+        """Indica si un elemento ya está marcado para eliminar."""
+        return id(item) in self._dead_ids
+
+    def compact(self):
+        """
+        Elimina de golpe todos los elementos marcados, conservando el orden.
+
+        Returns:
+            int: Número de elementos eliminados
+        """
+        dead_ids = self._dead_ids
+        if not dead_ids:
+            return 0
+
+        write = 0
+        pool = self.pool
+        for item in self:
+            if id(item) not in dead_ids:
+                self[write] = item
+                write += 1
+            elif pool is not None:
+                pool.release(item)
+
+        removed = len(self) - write
+        del self[write:]
+        dead_ids.clear()
+        return removed
+
+    def retain(self, keep):
+        """
+        Deja solo los elementos para los que keep(elemento) es verdadero.
+
+        Recorre la lista una vez, llamando a keep() con cada elemento, y la
+        compacta en la misma pasada. Útil para el típico "actualizar y quitar
+        los que han terminado": lista.retain(Explosion.update)
+
+        Args:
+            keep: Función que recibe un elemento y devuelve True si sigue vivo
+
+        Returns:
+            int: Número de elementos eliminados
+        """
+        write = 0
+        pool = self.pool
+        for item in self:
+            if keep(item):
+                self[write] = item
+                write += 1
+            elif pool is not None:
+                pool.release(item)
+
+        removed = len(self) - write
+        del self[write:]
+        return removed
+
+    def clear(self):
+        """Vacía la lista (y las marcas pendientes), devolviendo todo al pool."""
+        if self.pool is not None:
+            self.pool.release_all(self)
+        super().clear()
+        self._dead_ids.clear()
+
+
+class ObjectPool:
+    """
+    Almacén de objetos reutilizables de una clase.
+
+    La clase tiene que tener un método reset() con los mismos argumentos
+    que su constructor, que deje el objeto como recién creado.
+
+    Uso típico:
+        obstacle_pool = ObjectPool(Obstacle, "Obstáculos")
+        obstacle = obstacle_pool.acquire(difficulty)   # Nuevo o reutilizado
+        ...
+        obstacle_pool.release(obstacle)                # Vuelve al pool
+
+    Un objeto devuelto con release() no se debe seguir usando: el próximo
+    acquire() lo reiniciará y lo entregará a otro.
+
+    Atributos:
+    - name: Nombre para mostrar en el modo debug
+    - created: Objetos creados con el constructor
+    - reused: Veces que acquire() ha reutilizado un objeto
+    """
+
+    def __init__(self, cls, name=None):
+        """
+        Constructor del pool.
+
+        Args:
+            cls: Clase de los objetos (con método reset())
+            name: Nombre para las estadísticas (por defecto, el de la clase)
+        """
+        self.cls = cls
+        self.name = name or cls.__name__
+        self._free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        """
+        Entrega un objeto listo para usar.
+
+        Reutiliza uno libre (llamando a su reset()) o, si no queda
+        ninguno, crea uno nuevo.
+
+        Args:
+            *args, **kwargs: Argumentos del constructor / reset()
+
+        Returns:
+            object: Objeto inicializado
+        """
+        free = self._free
+        if free:
+            item = free.pop()
+            item.reset(*args, **kwargs)
+            self.reused += 1
+            return item
+
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, item):
+        """Devuelve un objeto al pool para reutilizarlo más tarde."""
+        self._free.append(item)
+
+    def release_all(self, items):
+        """Devuelve varios objetos al pool."""
+        self._free.extend(items)
+
+    def get_in_use(self):
+        """Objetos entregados que todavía no se han devuelto."""
+        return self.created - len(self._free)
+
+    def get_stats_text(self):
+        """Resumen para el modo debug: "Nombre en uso/libres (N reutil.)"."""
+        return f"{self.name} {self.get_in_use()}/{len(self._free)} ({self.reused} reutil.)"
+
+    def __len__(self):
+        """Número de objetos libres."""
+        return len(self._free)
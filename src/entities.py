@@ -32,9 +32,12 @@ Es el ejemplo perfecto para entender Programación Orientada a Objetos (POO).
 """
 
 import pygame
-import random
 import os
 from settings import *
+from random_streams import random_streams
+from graphics import sprite_cache, rotation_cache, pulse_cache, font_registry, text_cache
+from audio import sound_bank
+from particles import particle_system
 
 # === GESTIÓN DE SPRITES ===
 """
@@ -64,11 +67,28 @@ def load_sprite_with_fallback(sprite_path, fallback_color, width, height):
     """
     Función auxiliar para cargar sprites con fallback seguro.
     
+    ✅ IMPLEMENTADO: Los sprites se guardan en una caché global (graphics.py),
+    así que cada imagen se decodifica UNA sola vez aunque se creen cientos
+    de obstáculos. La Surface devuelta es compartida: no modificarla in-place.
+    
     Args:
         sprite_path: Ruta al archivo de imagen
         fallback_color: Color a usar si la imagen no se encuentra
         width, height: Dimensiones para escalar la imagen
     
+    Returns:
+        tuple: (imagen_cargada, es_fallback_boolean)
+    """
+    cache_key = (sprite_path, (width, height), tuple(fallback_color))
+    return sprite_cache.get(
+        cache_key,
+        lambda: _load_sprite_from_disk(sprite_path, fallback_color, width, height)
+    )
+
+def _load_sprite_from_disk(sprite_path, fallback_color, width, height):
+    """
+    Carga real del sprite desde disco (sin caché).
+    
     Returns:
         tuple: (imagen_cargada, es_fallback_boolean)
     """
@@ -77,8 +97,11 @@ def load_sprite_with_fallback(sprite_path, fallback_color, width, height):
             # Cargar imagen original
             image = pygame.image.load(sprite_path)
             
-            # convert_alpha() optimiza la imagen y preserva transparencia
-            image = image.convert_alpha()
+            # convert_alpha() optimiza la imagen y preserva transparencia.
+            # ✅ IMPLEMENTADO: Sin ventana (simulación headless) no se puede
+            # convertir; la imagen sin convertir sirve igual para la lógica
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
             
             # Escalar al tamaño deseado - pygame.transform.scale()
             image = pygame.transform.scale(image, (width, height))
@@ -115,6 +138,26 @@ def create_fallback_sprite(color, width, height):
     
     return surface
 
+def _place_rect(rect, x, y, width, height):
+    """
+    ✅ IMPLEMENTADO: Coloca un rect reutilizando el que ya existe.
+    
+    Las entidades de los pools (ver ObjectPool en containers.py) se
+    reinician muchas veces: así no se crea un pygame.Rect nuevo cada vez.
+    
+    Args:
+        rect: Rect anterior de la entidad (None si es nueva)
+        x, y, width, height: Nueva posición y tamaño
+    
+    Returns:
+        pygame.Rect: El mismo rect actualizado, o uno nuevo
+    """
+    if rect is None:
+        return pygame.Rect(x, y, width, height)
+    rect.update(x, y, width, height)
+    return rect
+
+
 class Player:
     """
     🎮 CLASE PLAYER - Representa al personaje principal (Julia)
@@ -145,6 +188,16 @@ class Player:
     (PlayerMovement, PlayerGraphics, PlayerState) para mejor organización.
     """
     
+    # ✅ IMPLEMENTADO: __slots__ declara de antemano los atributos del objeto.
+    # Python los guarda en huecos fijos en lugar de en un diccionario (__dict__):
+    # cada objeto ocupa menos memoria y leer sus atributos es algo más rápido.
+    # A cambio, no se pueden añadir atributos nuevos que no estén en la lista.
+    __slots__ = (
+        'rect', 'lives', 'score', 'speed', 'has_shield', 'sprite', 'using_fallback',
+        'sprite_frame', 'animation_timer', 'facing_direction', 'hit_flash_timer',
+        'invulnerability_timer', 'sprite_variants',
+    )
+    
     def __init__(self):
         """
         🏗️ CONSTRUCTOR - Cómo se "construye" un jugador
@@ -183,6 +236,10 @@ class Player:
         self.hit_flash_timer = 0       # Timer para efecto de parpadeo al recibir daño
         self.invulnerability_timer = 0 # Frames de invulnerabilidad después de recibir daño
         
+        # ✅ IMPLEMENTADO: Tabla de variantes pre-dibujadas del sprite
+        # (dirección × escudo × fase de pulso) para dibujar con un solo blit
+        self.sprite_variants = self.build_sprite_variants()
+        
         # Debug info para desarrollo
         if self.using_fallback:
             print("🎮 Player: Usando rectángulo fallback (imagen no encontrada)")
@@ -246,79 +303,116 @@ class Player:
         if not is_moving:
             self.sprite_frame = 0  # Frame estático cuando no se mueve
     
+    def build_sprite_variants(self):
+        """
+        ✅ IMPLEMENTADO: Pre-dibuja todas las apariencias posibles del jugador.
+        
+        Antes, cada frame se volteaba el sprite (transform.flip) y, con escudo,
+        se copiaba y se tintaba creando Surfaces nuevas. Como solo hay
+        2 direcciones × 2 estados de escudo × 2 fases de pulso = 8 variantes,
+        se calculan una vez aquí y draw() solo tiene que elegir una.
+        
+        El sprite real no cambia con el pulso: sus dos fases comparten la
+        misma Surface (4 en lugar de 8).
+        
+        Returns:
+            dict: (facing_direction, has_shield, pulse) -> pygame.Surface
+        """
+        variants = {}
+        
+        for facing in (1, -1):
+            for has_shield in (False, True):
+                if self.using_fallback:
+                    for pulse in (0, 1):
+                        variants[(facing, has_shield, pulse)] = self._build_fallback_variant(facing, has_shield, pulse)
+                else:
+                    variant = self._build_sprite_variant(facing, has_shield)
+                    variants[(facing, has_shield, 0)] = variant
+                    variants[(facing, has_shield, 1)] = variant
+        
+        return variants
+    
+    def _build_sprite_variant(self, facing, has_shield):
+        """Crea una variante del sprite real (volteado y/o tintado)."""
+        variant = self.sprite
+        
+        # Si está mirando hacia la izquierda, voltear el sprite
+        if facing == -1:
+            variant = pygame.transform.flip(self.sprite, True, False)
+        
+        # Si tiene escudo, aplicar tinte verdoso
+        if has_shield:
+            # Crear una copia del sprite con tinte (el sprite original es compartido)
+            variant = variant.copy()
+            
+            # Crear superficie de tinte
+            tint_surface = pygame.Surface(variant.get_size(), pygame.SRCALPHA)
+            tint_surface.fill((*CACHOPO_COLOR, 100))  # Verde semi-transparente
+            
+            # Aplicar tinte al sprite
+            variant.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        
+        return variant
+    
+    def _build_fallback_variant(self, facing, has_shield, pulse):
+        """Crea una variante del rectángulo fallback con su indicador de dirección."""
+        width, height = self.rect.size
+        variant = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # Color base del jugador
+        color = PLAYER_COLOR
+        
+        # Si tiene escudo, cambiar color para indicarlo visualmente
+        if has_shield:
+            color = CACHOPO_COLOR  # Verde cuando tiene escudo
+            if pulse:
+                # Fase brillante del pulso del escudo
+                color = tuple(min(255, c + 50) for c in color)
+        
+        variant.fill(color)
+        
+        # Pequeño triángulo para mostrar hacia dónde mira
+        center_y = height // 2
+        if facing == 1:  # Derecha
+            points = [(width, center_y), (width - 8, center_y - 4), (width - 8, center_y + 4)]
+        else:  # Izquierda
+            points = [(0, center_y), (8, center_y - 4), (8, center_y + 4)]
+        pygame.draw.polygon(variant, WHITE, points)
+        
+        return variant
+    
     def draw(self, screen):
         """
         Dibuja al jugador en la pantalla.
         
+        ✅ IMPLEMENTADO: Elige la variante pre-dibujada correspondiente
+        (ver build_sprite_variants) y la dibuja con un solo blit.
+        
         Args:
             screen: Superficie de pygame donde dibujar
+            
+        Returns:
+            pygame.Rect: Zona dibujada (None si no se dibujó), para dirty rects
         """
         
         # ✅ IMPLEMENTADO: Efecto de parpadeo cuando recibe daño
         if self.hit_flash_timer > 0 and self.hit_flash_timer % 4 < 2:
-            return  # No dibujar cada 2 frames para crear efecto de parpadeo
+            return None  # No dibujar cada 2 frames para crear efecto de parpadeo
         
-        # === RENDERIZADO DE SPRITE O FALLBACK ===
-        if self.using_fallback:
-            # Si usamos fallback, dibujar rectángulo mejorado
-            # Color base del jugador
-            color = PLAYER_COLOR
-            
-            # Si tiene escudo, cambiar color para indicarlo visualmente
-            if self.has_shield:
-                color = CACHOPO_COLOR  # Verde cuando tiene escudo
-                
-                # ✅ IMPLEMENTADO: Efecto de pulso para el escudo
-                pulse = abs((pygame.time.get_ticks() // 200) % 2)  # Cambia cada 200ms
-                if pulse:
-                    # Hacer el color más brillante
-                    color = tuple(min(255, c + 50) for c in color)
-            
-            # pygame.draw.rect(superficie, color, rectángulo)
-            pygame.draw.rect(screen, color, self.rect)
-            
-            # ✅ IMPLEMENTADO: Dibujar dirección con un pequeño indicador
-            # Pequeño triángulo para mostrar hacia dónde mira
-            if self.facing_direction == 1:  # Derecha
-                points = [(self.rect.right, self.rect.centery),
-                         (self.rect.right - 8, self.rect.centery - 4),
-                         (self.rect.right - 8, self.rect.centery + 4)]
-            else:  # Izquierda
-                points = [(self.rect.left, self.rect.centery),
-                         (self.rect.left + 8, self.rect.centery - 4),
-                         (self.rect.left + 8, self.rect.centery + 4)]
-            
-            pygame.draw.polygon(screen, WHITE, points)
+        # ✅ IMPLEMENTADO: Efecto de pulso para el escudo (cambia cada 200ms)
+        pulse = (pygame.time.get_ticks() // 200) % 2 if self.has_shield else 0
         
-        else:
-            # === RENDERIZADO DE SPRITE REAL ===
-            sprite_to_draw = self.sprite
-            
-            # Si está mirando hacia la izquierda, voltear el sprite
-            if self.facing_direction == -1:
-                sprite_to_draw = pygame.transform.flip(self.sprite, True, False)
-            
-            # Si tiene escudo, aplicar tinte verdoso
-            if self.has_shield:
-                # Crear una copia del sprite con tinte
-                sprite_to_draw = sprite_to_draw.copy()
-                
-                # Crear superficie de tinte
-                tint_surface = pygame.Surface(sprite_to_draw.get_size(), pygame.SRCALPHA)
-                tint_surface.fill((*CACHOPO_COLOR, 100))  # Verde semi-transparente
-                
-                # Aplicar tinte al sprite
-                sprite_to_draw.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-            
-            # Dibujar el sprite en la posición del rectángulo
-            screen.blit(sprite_to_draw, self.rect)
+        variant = self.sprite_variants[(self.facing_direction, self.has_shield, pulse)]
+        dirty_rect = screen.blit(variant, self.rect)
         
         # ✅ IMPLEMENTADO: Borde adicional si es invulnerable
         if self.invulnerability_timer > 0:
             # Dibujar borde de invulnerabilidad
             border_rect = pygame.Rect(self.rect.x - 2, self.rect.y - 2, 
                                     self.rect.width + 4, self.rect.height + 4)
-            pygame.draw.rect(screen, YELLOW, border_rect, 2)
+            dirty_rect.union_ip(pygame.draw.rect(screen, YELLOW, border_rect, 2))
+        
+        return dirty_rect
     
     def take_damage(self):
         """
@@ -339,7 +433,7 @@ class Player:
             # ✅ IMPLEMENTADO: Efecto visual al perder escudo
             self.hit_flash_timer = 20  # 20 frames de parpadeo
             print("¡Escudo perdido!")  # Mensaje educativo para debug
-            pygame.mixer.Sound(SOUND_HIT).play() # Sonido de escudo perdido (bonk)
+            sound_bank.play(SOUND_HIT) # Sonido de escudo perdido (bonk)
             return True
         else:
             # Pierde una vida
@@ -347,7 +441,7 @@ class Player:
             # ✅ IMPLEMENTADO: Período de invulnerabilidad tras recibir daño
             self.invulnerability_timer = 60  # 1 segundo de invulnerabilidad
             self.hit_flash_timer = 30        # 30 frames de parpadeo
-            pygame.mixer.Sound(SOUND_HIT).play() # Sonido de vida perdida (bonk)
+            sound_bank.play(SOUND_HIT) # Sonido de vida perdida (bonk)
             print(f"¡Vida perdida! Vidas restantes: {self.lives}")  # Debug educativo
             return self.lives > 0
     
@@ -392,6 +486,12 @@ class Obstacle:
     métodos como _setup_fast_obstacle(), _setup_big_obstacle().
     """
     
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = (
+        'rect', 'obstacle_type', 'speed', 'color', 'sprite', 'using_fallback', 'rotation',
+        'pulse_timer',
+    )
+    
     def __init__(self, difficulty_multiplier=1.0):
         """
         🏗️ CONSTRUCTOR - Crea un obstáculo aleatorio
@@ -402,18 +502,31 @@ class Obstacle:
         - Lógica condicional: if/elif/else para comportamientos diferentes
         - Cálculos matemáticos: Ajustar velocidad según dificultad
         
+        Args:
+            difficulty_multiplier: Multiplicador de dificultad (por defecto 1.0)
+        """
+        self.rect = None
+        self.reset(difficulty_multiplier)
+    
+    def reset(self, difficulty_multiplier=1.0):
+        """
+        ♻️ REINICIAR - Deja el obstáculo como recién creado
+        
+        ✅ IMPLEMENTADO: Lo usa ObjectPool (containers.py) para reutilizar
+        obstáculos en vez de crear uno nuevo en cada spawn.
+        
         Args:
             difficulty_multiplier: Multiplicador de dificultad (por defecto 1.0)
         """
         
         # 📍 POSICIÓN INICIAL - Aparece arriba en X aleatoria
-        start_x = random.randint(0, WINDOW_WIDTH - OBSTACLE_WIDTH)
+        start_x = random_streams.gameplay.randint(0, WINDOW_WIDTH - OBSTACLE_WIDTH)
         start_y = -OBSTACLE_HEIGHT  # Arriba de la pantalla (invisible al inicio)
         
-        self.rect = pygame.Rect(start_x, start_y, OBSTACLE_WIDTH, OBSTACLE_HEIGHT)
+        self.rect = _place_rect(self.rect, start_x, start_y, OBSTACLE_WIDTH, OBSTACLE_HEIGHT)
         
         # 🎲 TIPO ALEATORIO - ¡Aquí está la magia de la variedad!
-        self.obstacle_type = random.choice(['normal', 'fast', 'big'])
+        self.obstacle_type = random_streams.gameplay.choice(['normal', 'fast', 'big'])
         
         # ⚙️ CONFIGURACIÓN SEGÚN TIPO - Cada tipo tiene características únicas
         if self.obstacle_type == 'fast':
@@ -448,7 +561,7 @@ class Obstacle:
         
         # ✅ IMPLEMENTADO: Efectos visuales
         self.rotation = 0  # Para rotación visual
-        self.pulse_timer = random.randint(0, 60)  # Para efecto de pulso
+        self.pulse_timer = random_streams.cosmetic.randint(0, 60)  # Para efecto de pulso (solo visual)
         
         # Debug info para desarrollo
         if self.using_fallback:
@@ -474,7 +587,12 @@ class Obstacle:
         return self.rect.top < WINDOW_HEIGHT
     
     def draw(self, screen):
-        """Dibuja el obstáculo en la pantalla."""
+        """
+        Dibuja el obstáculo en la pantalla.
+        
+        Returns:
+            pygame.Rect: Zona dibujada, para el renderizado por dirty rects
+        """
         
         # === RENDERIZADO DE SPRITE O FALLBACK ===
         if self.using_fallback:
@@ -508,38 +626,29 @@ class Obstacle:
             # Borde del obstáculo
             pygame.draw.rect(screen, BLACK, self.rect, 1)
             
+            # Todo lo anterior queda dentro del rect del obstáculo
+            return self.rect.copy()
+            
         else:
             # === RENDERIZADO DE SPRITE REAL ===
-            sprite_to_draw = self.sprite
-            
-            # Aplicar rotación visual si el obstáculo está cayendo
-            if self.rotation != 0:
-                # Rotar sprite alrededor de su centro
-                sprite_to_draw = pygame.transform.rotate(self.sprite, self.rotation)
-                
-                # Calcular nueva posición para que el centro se mantenga
-                old_center = self.rect.center
-                new_rect = sprite_to_draw.get_rect()
-                new_rect.center = old_center
-                
-                # Dibujar sprite rotado
-                screen.blit(sprite_to_draw, new_rect)
-            else:
-                # Dibujar sprite normal
-                screen.blit(sprite_to_draw, self.rect)
+            # ✅ IMPLEMENTADO: Rotación visual usando sprites pre-rotados
+            # (rotation_cache, ver graphics.py) en lugar de transform.rotate()
+            dirty_rect = rotation_cache.blit(screen, self.sprite, self.rotation, self.rect.center)
             
             # ✅ IMPLEMENTADO: Indicadores sobre el sprite para diferentes tipos
             if self.obstacle_type == 'fast':
                 # Efecto de velocidad: líneas semi-transparentes
                 for i in range(3):
                     line_y = self.rect.centery - 6 + i * 6
-                    pygame.draw.line(screen, (255, 255, 255, 150), 
+                    dirty_rect.union_ip(pygame.draw.line(screen, (255, 255, 255, 150), 
                                    (self.rect.left - 10, line_y), 
-                                   (self.rect.left - 5, line_y), 2)
+                                   (self.rect.left - 5, line_y), 2))
             
             elif self.obstacle_type == 'big':
                 # Indicador de peligro: borde rojo
-                pygame.draw.rect(screen, RED, self.rect, 3)
+                dirty_rect.union_ip(pygame.draw.rect(screen, RED, self.rect, 3))
+            
+            return dirty_rect
 
 
 class Knife:
@@ -550,10 +659,23 @@ class Knife:
     Desaparecen cuando salen de la pantalla por arriba.
     """
     
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = ('rect', 'speed', 'sprite', 'using_fallback', 'rotation')
+    
     def __init__(self, player_rect):
         """
         Constructor del cuchillo. Aparece en la posición del jugador.
         
+        Args:
+            player_rect: Rectángulo del jugador para saber dónde aparecer
+        """
+        self.rect = None
+        self.reset(player_rect)
+    
+    def reset(self, player_rect):
+        """
+        Reinicia la espátula en la posición del jugador (para ObjectPool).
+        
         Args:
             player_rect: Rectángulo del jugador para saber dónde aparecer
         """
@@ -562,7 +684,7 @@ class Knife:
         start_x = player_rect.centerx - SCRAPER_WIDTH // 2
         start_y = player_rect.top
         
-        self.rect = pygame.Rect(start_x, start_y, SCRAPER_WIDTH, SCRAPER_HEIGHT)
+        self.rect = _place_rect(self.rect, start_x, start_y, SCRAPER_WIDTH, SCRAPER_HEIGHT)
         self.speed = SCRAPER_SPEED
         
         # === CARGA DE SPRITE PARA CUCHILLO ===
@@ -602,38 +724,29 @@ class Knife:
         return self.rect.bottom > 0
     
     def draw(self, screen):
-        """Dibuja la espátula en la pantalla."""
+        """
+        Dibuja la espátula en la pantalla.
+        
+        Returns:
+            pygame.Rect: Zona dibujada, para el renderizado por dirty rects
+        """
         
         # === RENDERIZADO DE SPRITE O FALLBACK ===
         if self.using_fallback:
             # Dibujar rectángulo fallback
-            pygame.draw.rect(screen, SCRAPER_COLOR, self.rect)
+            dirty_rect = pygame.draw.rect(screen, SCRAPER_COLOR, self.rect)
             
             # Añadir una punta para que parezca más un cuchillo
             tip_points = [(self.rect.centerx, self.rect.top - 3),
                          (self.rect.left + 2, self.rect.top + 3),
                          (self.rect.right - 2, self.rect.top + 3)]
-            pygame.draw.polygon(screen, SCRAPER_COLOR, tip_points)
+            dirty_rect.union_ip(pygame.draw.polygon(screen, SCRAPER_COLOR, tip_points))
+            return dirty_rect
             
         else:
             # === RENDERIZADO DE SPRITE REAL ===
-            sprite_to_draw = self.sprite
-            
-            # Aplicar rotación al sprite
-            if self.rotation != 0:
-                # Rotar sprite alrededor de su centro
-                sprite_to_draw = pygame.transform.rotate(self.sprite, self.rotation)
-                
-                # Calcular nueva posición para que el centro se mantenga
-                old_center = self.rect.center
-                new_rect = sprite_to_draw.get_rect()
-                new_rect.center = old_center
-                
-                # Dibujar sprite rotado
-                screen.blit(sprite_to_draw, new_rect)
-            else:
-                # Dibujar sprite normal
-                screen.blit(sprite_to_draw, self.rect)
+            # ✅ IMPLEMENTADO: Rotación con sprites pre-rotados (rotation_cache)
+            return rotation_cache.blit(screen, self.sprite, self.rotation, self.rect.center)
 
 
 class PowerUp:
@@ -644,19 +757,35 @@ class PowerUp:
     cuando el jugador los recoge.
     """
     
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = (
+        'rect', 'type', 'speed', 'color', 'symbol', 'sprite', 'using_fallback', 'pulse_timer',
+        'float_offset', 'sparkle_timer', 'original_y',
+    )
+    
     def __init__(self, powerup_type):
         """
         Constructor del power-up.
         
+        Args:
+            powerup_type: Tipo de power-up ('coca-cola' o 'cachopo')
+        """
+        self.rect = None
+        self.reset(powerup_type)
+    
+    def reset(self, powerup_type):
+        """
+        Reinicia el power-up arriba de la pantalla (para ObjectPool).
+        
         Args:
             powerup_type: Tipo de power-up ('coca-cola' o 'cachopo')
         """
         
         # Posición aleatoria en X, fija en Y (parte superior)
-        start_x = random.randint(0, WINDOW_WIDTH - POWERUP_WIDTH)
+        start_x = random_streams.gameplay.randint(0, WINDOW_WIDTH - POWERUP_WIDTH)
         start_y = -POWERUP_HEIGHT
         
-        self.rect = pygame.Rect(start_x, start_y, POWERUP_WIDTH, POWERUP_HEIGHT)
+        self.rect = _place_rect(self.rect, start_x, start_y, POWERUP_WIDTH, POWERUP_HEIGHT)
         self.type = powerup_type
         self.speed = POWERUP_SPEED
         
@@ -714,74 +843,63 @@ class PowerUp:
         return self.rect.top < WINDOW_HEIGHT
     
     def draw(self, screen):
-        """Dibuja el power-up en la pantalla."""
+        """
+        Dibuja el power-up en la pantalla.
+        
+        Returns:
+            pygame.Rect: Zona dibujada, para el renderizado por dirty rects
+        """
         
         # ✅ IMPLEMENTADO: Posición con efecto de flotación
-        draw_rect = pygame.Rect(self.rect.x, self.rect.y + self.float_offset, 
-                               self.rect.width, self.rect.height)
+        draw_x = self.rect.x
+        draw_y = int(self.rect.y + self.float_offset)
+        center_x = draw_x + self.rect.width // 2
+        center_y = draw_y + self.rect.height // 2
         
         # === RENDERIZADO DE SPRITE O FALLBACK ===
         if self.using_fallback:
+            draw_rect = pygame.Rect(draw_x, draw_y, self.rect.width, self.rect.height)
+            
             # ✅ IMPLEMENTADO: Efecto de pulso en el color
             pulse_intensity = abs(pygame.math.Vector2(1, 0).rotate(self.pulse_timer * POWERUP_PULSE_SPEED).x)
             base_color = self.color
             pulse_color = tuple(int(c * (0.7 + 0.3 * pulse_intensity)) for c in base_color)
             
             # Dibujar el power-up principal
-            pygame.draw.rect(screen, pulse_color, draw_rect)
+            dirty_rect = pygame.draw.rect(screen, pulse_color, draw_rect)
             
             # ✅ IMPLEMENTADO: Borde brillante
             border_color = tuple(min(255, c + 50) for c in base_color)
             pygame.draw.rect(screen, border_color, draw_rect, 2)
             
             # ✅ IMPLEMENTADO: Símbolo identificativo en el centro
-            font = pygame.font.Font(None, 20)
-            text = font.render(self.symbol, True, WHITE)
+            font = font_registry.get(20)
+            text = text_cache.render(font, self.symbol, True, WHITE)
             text_rect = text.get_rect(center=draw_rect.center)
             screen.blit(text, text_rect)
             
         else:
             # === RENDERIZADO DE SPRITE REAL ===
-            sprite_to_draw = self.sprite
-            
-            # Aplicar efecto de pulso escalando el sprite
-            pulse_intensity = abs(pygame.math.Vector2(1, 0).rotate(self.pulse_timer * POWERUP_PULSE_SPEED).x)
-            scale_factor = 0.9 + 0.2 * pulse_intensity  # Escala entre 0.9 y 1.1
-            
-            if scale_factor != 1.0:
-                # Escalar sprite para efecto de pulso
-                scaled_size = (int(self.rect.width * scale_factor), 
-                              int(self.rect.height * scale_factor))
-                sprite_to_draw = pygame.transform.scale(self.sprite, scaled_size)
-                
-                # Calcular posición centrada
-                scaled_rect = sprite_to_draw.get_rect()
-                scaled_rect.center = draw_rect.center
-                
-                # Dibujar sprite escalado
-                screen.blit(sprite_to_draw, scaled_rect)
-            else:
-                # Dibujar sprite normal
-                screen.blit(sprite_to_draw, draw_rect)
-            
-            # Aplicar tinte de color según el tipo (para distinguir vodka de té)
-            if self.type == 'tea':
-                # Crear superficie de tinte para el té
-                tint_surface = pygame.Surface(draw_rect.size, pygame.SRCALPHA)
-                tint_surface.fill((*CACHOPO_COLOR, 80))  # Verde semi-transparente
-                screen.blit(tint_surface, draw_rect, special_flags=pygame.BLEND_ALPHA_SDL2)
+            # ✅ IMPLEMENTADO: Pulso con frames pre-escalados (pulse_cache, ver
+            # graphics.py). El tinte del té (para distinguirlo) ya viene aplicado.
+            tint = (*CACHOPO_COLOR, 80) if self.type == 'tea' else None
+            frame, offset_x, offset_y = pulse_cache.get(self.sprite, self.pulse_timer, tint)
+            dirty_rect = screen.blit(frame, (center_x + offset_x, center_y + offset_y))
         
         # ✅ IMPLEMENTADO: Efecto de brillo ocasional (para ambos casos)
         if self.sparkle_timer % 30 < 5:  # Brilla cada 30 frames durante 5 frames
             # Pequeñas estrellas alrededor del power-up
-            sparkle_points = [
-                (draw_rect.centerx, draw_rect.top - 3),
-                (draw_rect.right + 3, draw_rect.centery),
-                (draw_rect.centerx, draw_rect.bottom + 3),
-                (draw_rect.left - 3, draw_rect.centery)
-            ]
-            for point in sparkle_points:
-                pygame.draw.circle(screen, WHITE, point, 1)
+            bottom = draw_y + self.rect.height
+            right = draw_x + self.rect.width
+            pygame.draw.circle(screen, WHITE, (center_x, draw_y - 3), 1)
+            pygame.draw.circle(screen, WHITE, (right + 3, center_y), 1)
+            pygame.draw.circle(screen, WHITE, (center_x, bottom + 3), 1)
+            pygame.draw.circle(screen, WHITE, (draw_x - 3, center_y), 1)
+            # Las estrellas quedan como mucho 4 píxeles fuera del power-up
+            dirty_rect = dirty_rect.union(pygame.Rect(draw_x, draw_y, self.rect.width,
+                                                      self.rect.height).inflate(8, 8))
+        
+        return dirty_rect
 
 
 # ✅ IMPLEMENTADO: Clase Enemy para enemigos más complejos
@@ -793,6 +911,9 @@ class Enemy(Obstacle):
     Esta clase demuestra herencia de la clase Obstacle.
     """
     
+    # ✅ IMPLEMENTADO: Solo los atributos nuevos; el resto vienen de Obstacle
+    __slots__ = ('target_x', 'horizontal_speed')
+    
     def __init__(self, player_x, difficulty_multiplier=1.0):
         """
         Constructor del enemigo.
@@ -801,7 +922,18 @@ class Enemy(Obstacle):
             player_x: Posición X del jugador para seguimiento
             difficulty_multiplier: Multiplicador de dificultad
         """
-        super().__init__(difficulty_multiplier)  # Llamar al constructor padre
+        self.rect = None
+        self.reset(player_x, difficulty_multiplier)
+    
+    def reset(self, player_x, difficulty_multiplier=1.0):
+        """
+        Reinicia el enemigo (para ObjectPool).
+        
+        Args:
+            player_x: Posición X del jugador para seguimiento
+            difficulty_multiplier: Multiplicador de dificultad
+        """
+        super().reset(difficulty_multiplier)  # Reiniciar la parte de obstáculo
         
         # Configuración específica del enemigo
         self.color = (150, 0, 150)  # Color púrpura para distinguir
@@ -837,7 +969,12 @@ class Enemy(Obstacle):
         return self.rect.top < WINDOW_HEIGHT
     
     def draw(self, screen):
-        """Dibujar enemigo con indicadores especiales."""
+        """
+        Dibujar enemigo con indicadores especiales.
+        
+        Returns:
+            pygame.Rect: Zona dibujada, para el renderizado por dirty rects
+        """
         # Color base con pulso
         base_color = self.color
         pulse_offset = int(abs(pygame.math.Vector2(1, 0).rotate(self.pulse_timer * 4).x) * 30)
@@ -857,6 +994,9 @@ class Enemy(Obstacle):
         
         # Borde amenazante
         pygame.draw.rect(screen, RED, self.rect, 2)
+        
+        # Ojos y borde quedan dentro del rect del enemigo
+        return self.rect.copy()
 
 
 # ✅ IMPLEMENTADO: Clase Explosion para efectos visuales
@@ -866,12 +1006,30 @@ class Explosion:
     
     Esta clase demuestra cómo crear efectos temporales que se
     dibujan durante un tiempo limitado y luego desaparecen.
+    
+    ✅ IMPLEMENTADO: Las partículas ya no se guardan aquí como diccionarios:
+    se crean de golpe en el motor global (particle_system, ver particles.py),
+    que las mueve y las dibuja todas juntas. Esta clase solo recuerda dónde
+    y cuándo se produjo la explosión.
     """
     
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = ('x', 'y', 'color', 'life')
+    
     def __init__(self, x, y, color=YELLOW):
         """
         Constructor de la explosión.
         
+        Args:
+            x, y: Posición central de la explosión
+            color: Color base de la explosión
+        """
+        self.reset(x, y, color)
+    
+    def reset(self, x, y, color=YELLOW):
+        """
+        Reinicia la explosión en otro punto (para ObjectPool).
+        
         Args:
             x, y: Posición central de la explosión
             color: Color base de la explosión
@@ -879,62 +1037,20 @@ class Explosion:
         self.x = x
         self.y = y
         self.color = color
-        self.particles = []
         self.life = PARTICLE_LIFE  # Vida total del efecto
         
-        # ✅ IMPLEMENTADO: Crear partículas individuales
-        for _ in range(PARTICLE_COUNT):
-            # Cada partícula tiene posición, velocidad y tamaño aleatorio
-            angle = random.uniform(0, 2 * 3.14159)  # Ángulo aleatorio
-            speed = random.uniform(2, 8)             # Velocidad aleatoria
-            
-            particle = {
-                'x': x,
-                'y': y,
-                'vel_x': pygame.math.Vector2(speed, 0).rotate_rad(angle).x,
-                'vel_y': pygame.math.Vector2(speed, 0).rotate_rad(angle).y,
-                'size': random.randint(2, 5),
-                'life': random.randint(15, PARTICLE_LIFE)
-            }
-            self.particles.append(particle)
+        # ✅ IMPLEMENTADO: Crear todas las partículas en una sola llamada
+        particle_system.spawn_burst(x, y, color, PARTICLE_COUNT, "blast")
     
     def update(self):
         """
-        Actualizar todas las partículas de la explosión.
+        Avanzar el tiempo de vida de la explosión.
         
         Returns:
             bool: False si la explosión terminó, True si sigue activa
         """
         self.life -= 1
-        
-        # Actualizar cada partícula
-        for particle in self.particles[:]:  # [:] para iterar copia segura
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['life'] -= 1
-            
-            # Aplicar gravedad y fricción
-            particle['vel_y'] += 0.2  # Gravedad
-            particle['vel_x'] *= 0.98  # Fricción
-            
-            # Eliminar partículas que expiraron
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-        
-        # La explosión termina cuando no quedan partículas o se acaba el tiempo
-        return len(self.particles) > 0 and self.life > 0
-    
-    def draw(self, screen):
-        """Dibujar todas las partículas de la explosión."""
-        for particle in self.particles:
-            # Color que se desvanece con el tiempo
-            alpha_factor = particle['life'] / PARTICLE_LIFE
-            particle_color = tuple(int(c * alpha_factor) for c in self.color)
-            
-            # Dibujar partícula como círculo
-            pygame.draw.circle(screen, particle_color, 
-                             (int(particle['x']), int(particle['y'])), 
-                             particle['size'])
+        return self.life > 0
 
 
 # ✅ IMPLEMENTADO: Clase para efectos de pantalla
@@ -943,6 +1059,9 @@ class ScreenEffect:
     Efectos que afectan a toda la pantalla como screen shake.
     """
     
+    # ✅ IMPLEMENTADO: Atributos fijos, sin __dict__ (ver Player)
+    __slots__ = ('shake_intensity', 'shake_duration', 'shake_offset_x', 'shake_offset_y')
+    
     def __init__(self):
         """Constructor del sistema de efectos de pantalla."""
         self.shake_intensity = 0
@@ -968,8 +1087,8 @@ class ScreenEffect:
             
             # Calcular offset aleatorio para el shake
             if self.shake_duration > 0:
-                self.shake_offset_x = random.randint(-self.shake_intensity, self.shake_intensity)
-                self.shake_offset_y = random.randint(-self.shake_intensity, self.shake_intensity)
+                self.shake_offset_x = random_streams.cosmetic.randint(-self.shake_intensity, self.shake_intensity)
+                self.shake_offset_y = random_streams.cosmetic.randint(-self.shake_intensity, self.shake_intensity)
             else:
                 self.shake_offset_x = 0
                 self.shake_offset_y = 0
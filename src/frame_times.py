@@ -0,0 +1,222 @@
+"""
+frame_times.py - Tiempos de frame: histograma, percentiles y peores frames
+
+clock.get_fps() es una media suavizada: 59 frames de 10 ms y uno de
+200 ms siguen dando "60 FPS", pero el jugador ve el tirón. Para ajustar
+el rendimiento importa el p99 (el tiempo que no supera el 99% de los
+frames), no la media.
+
+FrameTimeRecorder apunta la duración real de cada vuelta del game loop:
+- En un buffer circular (ring buffer) con los últimos FRAME_TIME_BUFFER
+  frames, para ver percentiles "de ahora mismo"
+- En un histograma tipo HDR de toda la partida: memoria fija y error
+  relativo pequeño (menos del 2%) para tiempos de microsegundos a segundos
+- En una lista con los FRAME_TIME_WORST peores frames
+
+dump() guarda en FRAME_TIME_FILE (JSON) el p50/p90/p99/p99.9, los peores
+frames y el histograma. Se llama con F5 y al acabar cada partida.
+
+Conceptos de programación cubiertos:
+- Buffer circular de tamaño fijo
+- Histogramas con cubetas logarítmicas (HDR Histogram)
+- Percentiles y colas de prioridad (heapq)
+
+Referencias útiles:
+- HdrHistogram: http://hdrhistogram.org/
+- heapq: https://docs.python.org/3/library/heapq.html
+"""
+
+import heapq
+import json
+import math
+import time
+import numpy as np
+from settings import *
+
+# Percentiles que se guardan en el informe
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+# Cubetas del histograma: 2**SUB_BUCKET_BITS valores exactos y después
+# HALF_BUCKETS cubetas por cada potencia de 2 (error relativo < 1/HALF_BUCKETS)
+SUB_BUCKET_BITS = 7
+HALF_BUCKETS = 2 ** (SUB_BUCKET_BITS - 1)
+MAX_FRAME_US = 60_000_000  # Frames de más de un minuto cuentan como un minuto
+
+
+class FrameTimeHistogram:
+    """
+    Histograma tipo HDR de tiempos en microsegundos.
+
+    Los valores pequeños (menos de 128 µs) tienen su propia cubeta; a
+    partir de ahí cada potencia de 2 se parte en 64 cubetas iguales, así
+    el error es siempre menor del 1,6% del valor.
+
+    Atributos:
+    - counts: Array con el número de frames de cada cubeta
+    - total: Frames apuntados
+    """
+
+    def __init__(self):
+        """Constructor del histograma (todas las cubetas a cero)."""
+        self.counts = np.zeros(self.bucket_index(MAX_FRAME_US) + 1, dtype=np.int64)
+        self.total = 0
+
+    @staticmethod
+    def bucket_index(us):
+        """Cubeta de un tiempo en microsegundos (entero)."""
+        if us < 2 ** SUB_BUCKET_BITS:
+            return us
+        exponent = us.bit_length() - SUB_BUCKET_BITS
+        return exponent * HALF_BUCKETS + (us >> exponent)
+
+    @staticmethod
+    def bucket_upper(index):
+        """Mayor tiempo (µs) que cae en una cubeta."""
+        if index < 2 ** SUB_BUCKET_BITS:
+            return index
+        exponent = index // HALF_BUCKETS - 1
+        sub = index - exponent * HALF_BUCKETS
+        return ((sub + 1) << exponent) - 1
+
+    def record(self, ms):
+        """Apunta un frame de `ms` milisegundos."""
+        us = min(MAX_FRAME_US, max(0, int(ms * 1000)))
+        self.counts[self.bucket_index(us)] += 1
+        self.total += 1
+
+    def get_percentile(self, percentile):
+        """
+        Tiempo (ms) que no supera el `percentile` % de los frames.
+
+        Devuelve el límite superior de la cubeta, así nunca se queda corto.
+        """
+        if self.total == 0:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self.total))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return self.bucket_upper(index) / 1000
+
+    def get_buckets(self):
+        """Cubetas con algún frame, como lista [límite superior en ms, frames]."""
+        return [[self.bucket_upper(index) / 1000, int(self.counts[index])]
+                for index in np.flatnonzero(self.counts).tolist()]
+
+    def clear(self):
+        """Vacía el histograma."""
+        self.counts[:] = 0
+        self.total = 0
+
+
+class FrameTimeRecorder:
+    """
+    Apunta el tiempo real de cada frame del game loop.
+
+    Uso (lo hace JuliasRunGame en main.py):
+        frame_time_recorder.mark_frame()          # Una vez por vuelta del game loop
+        frame_time_recorder.get_recent_percentile(99)
+        frame_time_recorder.dump()                # F5 y Game Over
+
+    Atributos:
+    - buffer: Últimos tiempos de frame en ms (buffer circular)
+    - histogram: FrameTimeHistogram de toda la partida
+    - worst: Peores frames como montículo de (ms, número de frame)
+    - frame: Frames apuntados desde el último clear()
+    - total_ms: Suma de todos los tiempos (para la media)
+    """
+
+    def __init__(self, size=FRAME_TIME_BUFFER, worst_count=FRAME_TIME_WORST):
+        """
+        Constructor del grabador.
+
+        Args:
+            size: Frames que guarda el buffer circular
+            worst_count: Cuántos peores frames se recuerdan
+        """
+        self.buffer = np.zeros(size, dtype=np.float64)
+        self.histogram = FrameTimeHistogram()
+        self.worst_count = worst_count
+        self.worst = []
+        self.frame = 0
+        self.total_ms = 0.0
+        self._last = None
+
+    def mark_frame(self):
+        """Apunta el tiempo pasado desde la llamada anterior (la primera solo empieza a contar)."""
+        now = time.perf_counter()
+        if self._last is not None:
+            self.record((now - self._last) * 1000)
+        self._last = now
+
+    def record(self, ms):
+        """Apunta un frame de `ms` milisegundos."""
+        self.buffer[self.frame % len(self.buffer)] = ms
+        self.frame += 1
+        self.total_ms += ms
+        self.histogram.record(ms)
+
+        # Montículo de mínimos: la raíz es el "menos malo" de los peores
+        entry = (ms, self.frame)
+        if len(self.worst) < self.worst_count:
+            heapq.heappush(self.worst, entry)
+        elif ms > self.worst[0][0]:
+            heapq.heapreplace(self.worst, entry)
+
+    def get_recent(self):
+        """Tiempos de los frames que hay en el buffer circular (sin orden)."""
+        return self.buffer[:min(self.frame, len(self.buffer))]
+
+    def get_recent_percentile(self, percentile):
+        """Percentil (ms) de los últimos frames, exacto (0.0 sin frames)."""
+        recent = self.get_recent()
+        if len(recent) == 0:
+            return 0.0
+        return float(np.percentile(recent, percentile))
+
+    def get_report(self):
+        """
+        Informe de la partida.
+
+        Returns:
+            dict: frames, media, máximo, percentiles (del histograma y de los
+                  últimos frames), peores frames e histograma
+        """
+        histogram = self.histogram
+        recent = self.get_recent()
+        return {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "frames": self.frame,
+            "mean_ms": self.total_ms / self.frame if self.frame else 0.0,
+            "max_ms": max((ms for ms, _ in self.worst), default=0.0),
+            "percentiles_ms": {f"p{p:g}": histogram.get_percentile(p) for p in REPORT_PERCENTILES},
+            "recent_percentiles_ms": {f"p{p:g}": float(np.percentile(recent, p)) if len(recent) else 0.0
+                                      for p in REPORT_PERCENTILES},
+            "worst_frames": [{"frame": frame, "ms": ms} for ms, frame in sorted(self.worst, reverse=True)],
+            "histogram": histogram.get_buckets(),
+        }
+
+    def dump(self, path=FRAME_TIME_FILE):
+        """
+        Guarda el informe en un archivo JSON.
+
+        Returns:
+            dict: El informe guardado
+        """
+        report = self.get_report()
+        try:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(report, file, indent=2)
+        except OSError as e:
+            print(f"Error guardando tiempos de frame: {e}")
+        return report
+
+    def clear(self):
+        """Empieza de cero (al empezar una partida nueva)."""
+        self.histogram.clear()
+        self.worst = []
+        self.frame = 0
+        self.total_ms = 0.0
+        self._last = None
+
+
+# Instancia global (como particle_system)
+frame_time_recorder = FrameTimeRecorder()
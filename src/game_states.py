@@ -21,6 +21,8 @@ Referencias útiles:
 
 import pygame
 from settings import *
+from graphics import background_layers, font_registry, text_cache
+from tracing import tracer
 
 class GameStateManager:
     """
@@ -46,9 +48,10 @@ class GameStateManager:
 
         # Inicializar fuentes para texto
         pygame.font.init()
-        self.font_large = pygame.font.Font(None, FONT_SIZE_LARGE)
-        self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
-        self.font_small = pygame.font.Font(None, FONT_SIZE_SMALL)
+        # ✅ IMPLEMENTADO: Fuentes compartidas a través del registro de fuentes
+        self.font_large = font_registry.get(FONT_SIZE_LARGE)
+        self.font_medium = font_registry.get(FONT_SIZE_MEDIUM)
+        self.font_small = font_registry.get(FONT_SIZE_SMALL)
 
     
     def change_state(self, new_state):
@@ -65,6 +68,7 @@ class GameStateManager:
         if self.next_state:
             self.current_state = self.next_state
             self.next_state = None
+            tracer.instant("estado", self.current_state)  # ✅ En la traza (F6)
     
     def get_current_state(self):
         """Obtiene el estado actual."""
@@ -113,16 +117,28 @@ class MenuState:
         """
         Dibuja el menú principal.
         
+        ✅ IMPLEMENTADO: Todo el menú es estático, así que se pre-compone
+        una sola vez en una capa (ver graphics.py) y cada frame es un blit.
+        
         Args:
             screen: Superficie de pygame donde dibujar
         """
+        background_layers.draw(screen, "menu", self.build_background)
+    
+    def build_background(self, screen):
+        """
+        Dibuja el contenido estático del menú (se llama una sola vez).
+        
+        Args:
+            screen: Superficie de la capa donde dibujar
+        """
         
         # Limpiar pantalla con color de fondo
         screen.fill(LIGHT_BLUE)
         
         # TODO 9: Añadir demo visual o animación de fondo
         # self.draw_background_animation(screen)
-        fondo = pygame.image.load(SPRITE_BACKGROUND).convert()
+        fondo = background_layers.get_image(SPRITE_BACKGROUND)
         fondo_center = fondo.get_rect(center=(WINDOW_WIDTH//2, 350))
         screen.blit(fondo, fondo_center)
 
@@ -213,13 +229,17 @@ class InstructionsState:
         pass
 
     def draw(self, screen):
-        """Dibuja el menú de instrucciones"""
+        """Dibuja el menú de instrucciones (capa pre-compuesta, un solo blit)."""
+        background_layers.draw(screen, "instructions", self.build_background)
+
+    def build_background(self, screen):
+        """Dibuja el contenido estático de las instrucciones (una sola vez)."""
         
         # Limpiar pantalla con color de fondo
         screen.fill(LIGHT_BLUE)
 
         # Fondo de pantalla
-        fondo = pygame.image.load(SPRITE_BACKGROUND).convert()
+        fondo = background_layers.get_image(SPRITE_BACKGROUND)
         fondo_center = fondo.get_rect(center=(WINDOW_WIDTH//2, 350))
         screen.blit(fondo, fondo_center)
 
@@ -244,33 +264,28 @@ class PlayingState:
         """Constructor del estado de juego."""
         self.state_manager = state_manager
     
-    def handle_events(self, events, player, knife_cooldown):
+    def handle_events(self, events):
         """
         Maneja los eventos durante el juego.
         
+        ✅ IMPLEMENTADO: Ya no crea las espátulas aquí; solo avisa de que se
+        pulsó ESPACIO. La simulación (simulation.py) comprueba el cooldown
+        y lanza la espátula en su siguiente paso.
+        
         Args:
             events: Lista de eventos de pygame
-            player: Instancia del jugador
-            knife_cooldown: Timer de cooldown para cuchillos
             
         Returns:
-            list: Lista de nuevos cuchillos creados (si se lanzó alguno)
+            tuple: (se_pulsó_lanzar, continuar_jugando)
         """
         
-        new_knives = []
+        throw_pressed = False
         
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == KEY_SPACE:
-                    # Lanzar cuchillo si no hay cooldown
-                    if knife_cooldown.is_ready():
-                        from entities import Knife  # Import local para evitar circular
-                        new_knife = Knife(player.rect)
-                        new_knives.append(new_knife)
-                        knife_cooldown.start_cooldown()
-                        
-                        # TODO 4: Añadir sonido de lanzamiento
-                        pygame.mixer.Sound(SOUND_THROW).play()
+                    # Pedir lanzamiento de espátula
+                    throw_pressed = True
                 
                 elif event.key == KEY_P:
                     # ✅ IMPLEMENTADO: Implementar pausa
@@ -278,9 +293,9 @@ class PlayingState:
                     print("Juego pausado")  # Debug
                 
                 elif event.key == KEY_ESCAPE:
-                    return new_knives, False  # Salir del juego
+                    return throw_pressed, False  # Salir del juego
         
-        return new_knives, True  # Continuar jugando
+        return throw_pressed, True  # Continuar jugando
     
     def update(self, player, obstacles, knives, powerups, effects, knife_cooldown):
         """
@@ -408,16 +423,16 @@ class PlayingState:
         """
         
         # Puntuación
-        score_text = self.state_manager.font_medium.render(f"Puntuación: {player.score}", True, WHITE)
+        score_text = text_cache.render(self.state_manager.font_medium, f"Puntuación: {player.score}", True, WHITE)
         screen.blit(score_text, (10, 10))
         
         # Vidas
-        lives_text = self.state_manager.font_medium.render(f"Vidas: {player.lives}", True, WHITE)
+        lives_text = text_cache.render(self.state_manager.font_medium, f"Vidas: {player.lives}", True, WHITE)
         screen.blit(lives_text, (10, 40))
         
         # Estado del escudo
         if player.has_shield:
-            shield_text = self.state_manager.font_small.render("🛡️ ESCUDO ACTIVO", True, CACHOPO_COLOR)
+            shield_text = text_cache.render(self.state_manager.font_small, "🛡️ ESCUDO ACTIVO", True, CACHOPO_COLOR)
             screen.blit(shield_text, (10, 70))
         
         # ✅ IMPLEMENTADO: Barra de cooldown visual
@@ -487,30 +502,30 @@ class GameOverState:
         screen.fill(BLACK)
         
         # Título
-        game_over_text = self.state_manager.font_large.render("GAME OVER", True, RED)
+        game_over_text = text_cache.render(self.state_manager.font_large, "GAME OVER", True, RED)
         title_rect = game_over_text.get_rect(center=(WINDOW_WIDTH//2, 150))
         screen.blit(game_over_text, title_rect)
         
         # Puntuación final
-        score_text = self.state_manager.font_medium.render(f"Tu puntuación: {self.final_score}", True, WHITE)
+        score_text = text_cache.render(self.state_manager.font_medium, f"Tu puntuación: {self.final_score}", True, WHITE)
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH//2, 220))
         screen.blit(score_text, score_rect)
         
         # Récord
         if self.is_new_record:
-            record_text = self.state_manager.font_medium.render("¡NUEVO RÉCORD!", True, YELLOW)
+            record_text = text_cache.render(self.state_manager.font_medium, "¡NUEVO RÉCORD!", True, YELLOW)
         else:
-            record_text = self.state_manager.font_medium.render(f"Récord: {self.best_score}", True, GRAY)
+            record_text = text_cache.render(self.state_manager.font_medium, f"Récord: {self.best_score}", True, GRAY)
         
         record_rect = record_text.get_rect(center=(WINDOW_WIDTH//2, 260))
         screen.blit(record_text, record_rect)
         
         # Instrucciones
-        restart_text = self.state_manager.font_small.render("Presiona ENTER para jugar de nuevo", True, WHITE)
+        restart_text = text_cache.render(self.state_manager.font_small, "Presiona ENTER para jugar de nuevo", True, WHITE)
         restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH//2, 350))
         screen.blit(restart_text, restart_rect)
         
-        exit_text = self.state_manager.font_small.render("ESC para salir", True, WHITE)
+        exit_text = text_cache.render(self.state_manager.font_small, "ESC para salir", True, WHITE)
         exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH//2, 380))
         screen.blit(exit_text, exit_rect)
 
@@ -580,16 +595,14 @@ class PausedState:
         pulse_factor = abs(pygame.math.Vector2(1, 0).rotate(self.pulse_timer * 3).x)
         pulse_size = int(FONT_SIZE_LARGE + pulse_factor * 10)
         
-        try:
-            pulse_font = pygame.font.Font(None, pulse_size)
-        except:
-            pulse_font = self.state_manager.font_large
+        # ✅ IMPLEMENTADO: Una fuente por tamaño de pulso (se crean una sola vez)
+        pulse_font = font_registry.get(pulse_size)
         
-        paused_text = pulse_font.render("PAUSED", True, YELLOW)
+        paused_text = text_cache.render(pulse_font, "PAUSED", True, YELLOW)
         paused_rect = paused_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
         
         # Sombra del texto para mejor legibilidad
-        shadow_text = pulse_font.render("PAUSED", True, BLACK)
+        shadow_text = text_cache.render(pulse_font, "PAUSED", True, BLACK)
         shadow_rect = shadow_text.get_rect(center=(paused_rect.centerx + 3, paused_rect.centery + 3))
         screen.blit(shadow_text, shadow_rect)
         screen.blit(paused_text, paused_rect)
@@ -602,7 +615,7 @@ class PausedState:
         
         y_offset = WINDOW_HEIGHT//2 + 20
         for instruction in instructions:
-            text = self.state_manager.font_medium.render(instruction, True, WHITE)
+            text = text_cache.render(self.state_manager.font_medium, instruction, True, WHITE)
             text_rect = text.get_rect(center=(WINDOW_WIDTH//2, y_offset))
             
             # Fondo semi-transparente para las instrucciones
@@ -0,0 +1,590 @@
+"""
+graphics.py - Cachés gráficas de Chipi's Run
+
+Este archivo agrupa las estructuras que evitan repetir trabajo gráfico
+costoso (decodificar PNGs, escalar imágenes...) en cada frame o en cada
+spawn de una entidad.
+
+Conceptos de programación cubiertos:
+- Memoización (guardar resultados ya calculados)
+- Diccionarios como tablas de búsqueda
+- Objetos compartidos (varias entidades usan la misma Surface)
+- Estadísticas de aciertos/fallos de una caché
+
+Referencias útiles:
+- pygame.Surface: https://www.pygame.org/docs/ref/surface.html
+"""
+
+import math
+from collections import OrderedDict
+import pygame
+from settings import *
+
+
+class SpriteCache:
+    """
+    Caché de sprites compartida por todo el proceso.
+
+    Cada sprite se identifica por una clave (ruta, tamaño, color de fallback).
+    La primera vez que se pide una clave se carga con la función indicada;
+    las siguientes veces se devuelve exactamente la misma Surface.
+
+    ⚠️ IMPORTANTE: Las Surfaces devueltas son COMPARTIDAS entre todas las
+    entidades. Nunca se deben modificar in-place (usar .copy() si hace falta).
+
+    Atributos:
+    - hits: Número de veces que el sprite ya estaba en caché
+    - misses: Número de veces que hubo que cargarlo desde disco
+    """
+
+    def __init__(self):
+        """Constructor de la caché de sprites."""
+        self._entries = {}   # clave -> (surface, es_fallback)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, loader):
+        """
+        Obtiene un sprite de la caché o lo carga si no existe.
+
+        Args:
+            key: Clave hashable (ruta, (ancho, alto), color_fallback)
+            loader: Función sin argumentos que devuelve (surface, es_fallback)
+
+        Returns:
+            tuple: (surface_compartida, es_fallback_boolean)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = loader()
+        self._entries[key] = entry
+        return entry
+
+    def clear(self):
+        """Vacía la caché (por ejemplo, si cambia el modo de vídeo)."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_hit_rate(self):
+        """
+        Obtiene el porcentaje de aciertos de la caché.
+
+        Returns:
+            float: Valor entre 0.0 y 1.0 (0.0 si aún no hubo peticiones)
+        """
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def __len__(self):
+        """Número de sprites distintos guardados."""
+        return len(self._entries)
+
+
+# Caché global: una sola instancia para todo el juego
+sprite_cache = SpriteCache()
+
+
+class BackgroundLayers:
+    """
+    Capas de fondo pre-compuestas para cada pantalla del juego.
+
+    Antes, cada frame se volvía a cargar el PNG del fondo desde disco y se
+    volvía a renderizar el texto estático. Ahora:
+    1. Cada imagen de fondo se decodifica UNA vez y se convierte al formato
+       de píxeles de la pantalla (convert()).
+    2. Todo lo estático de una pantalla (color de relleno, imagen, textos
+       fijos...) se dibuja una sola vez en una Surface del tamaño de la ventana.
+    3. Cada frame solo hace falta UN blit de esa Surface.
+
+    Las capas se identifican por nombre ("menu", "game"...) y se construyen
+    con una función builder(surface) que dibuja el contenido estático.
+    """
+
+    def __init__(self):
+        """Constructor del sistema de capas de fondo."""
+        self._images = {}   # ruta -> Surface decodificada
+        self._layers = {}   # nombre -> Surface pre-compuesta
+
+    def get_image(self, image_path):
+        """
+        Obtiene una imagen de fondo decodificada (solo se carga una vez).
+
+        Args:
+            image_path: Ruta al archivo de imagen
+
+        Returns:
+            pygame.Surface: Imagen en el formato de píxeles de la pantalla
+        """
+        image = self._images.get(image_path)
+        if image is None:
+            image = pygame.image.load(image_path).convert()
+            self._images[image_path] = image
+        return image
+
+    def get_layer(self, name, builder):
+        """
+        Obtiene la capa pre-compuesta de una pantalla, creándola si hace falta.
+
+        Args:
+            name: Nombre de la capa (por ejemplo "menu" o "game")
+            builder: Función builder(surface) que dibuja el contenido estático
+
+        Returns:
+            pygame.Surface: Capa del tamaño de la ventana lista para blit
+        """
+        layer = self._layers.get(name)
+        if layer is None:
+            layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+            builder(layer)
+            self._layers[name] = layer
+        return layer
+
+    def draw(self, surface, name, builder):
+        """
+        Dibuja la capa de una pantalla con un solo blit.
+
+        Args:
+            surface: Superficie donde dibujar
+            name: Nombre de la capa
+            builder: Función que construye la capa la primera vez
+        """
+        surface.blit(self.get_layer(name, builder), (0, 0))
+
+    def invalidate(self, name=None):
+        """
+        Descarta una capa (o todas) para que se reconstruya en el próximo frame.
+
+        Args:
+            name: Nombre de la capa a descartar, o None para descartar todas
+        """
+        if name is None:
+            self._layers.clear()
+        else:
+            self._layers.pop(name, None)
+
+
+# Capas de fondo compartidas por todos los estados del juego
+background_layers = BackgroundLayers()
+
+
+class RotationCache:
+    """
+    Caché de sprites pre-rotados a ángulos cuantizados.
+
+    pygame.transform.rotate() es caro y antes se llamaba cada frame para
+    cada obstáculo y cada espátula. Aquí cada sprite se rota UNA vez a
+    N ángulos fijos (por ejemplo 72 = cada 5 grados) y se guarda también
+    el desplazamiento necesario para que la imagen quede centrada.
+
+    Dibujar un sprite rotado pasa a ser: buscar en la tabla + un blit.
+    El coste ya no depende de cuántas entidades haya en pantalla.
+    """
+
+    def __init__(self, buckets=ROTATION_CACHE_BUCKETS):
+        """
+        Constructor de la caché de rotaciones.
+
+        Args:
+            buckets: Número de ángulos pre-calculados por sprite
+        """
+        self.buckets = buckets
+        self.step = 360.0 / buckets
+        self._tables = {}   # sprite -> lista de (surface_rotada, offset_x, offset_y)
+
+    def get_table(self, sprite):
+        """
+        Obtiene (o construye) la tabla de rotaciones de un sprite.
+
+        Args:
+            sprite: Surface original (compartida, ver SpriteCache)
+
+        Returns:
+            list: Una entrada (surface, offset_x, offset_y) por ángulo
+        """
+        table = self._tables.get(sprite)
+        if table is None:
+            table = []
+            for i in range(self.buckets):
+                rotated = pygame.transform.rotate(sprite, i * self.step)
+                width, height = rotated.get_size()
+                # Offset desde el centro hasta la esquina superior izquierda
+                table.append((rotated, -(width // 2), -(height // 2)))
+            self._tables[sprite] = table
+        return table
+
+    def get(self, sprite, angle):
+        """
+        Obtiene el sprite rotado más cercano al ángulo pedido.
+
+        Args:
+            sprite: Surface original
+            angle: Ángulo en grados (cualquier valor, se normaliza)
+
+        Returns:
+            tuple: (surface_rotada, offset_x, offset_y)
+        """
+        index = int(round((angle % 360) / self.step)) % self.buckets
+        return self.get_table(sprite)[index]
+
+    def blit(self, surface, sprite, angle, center):
+        """
+        Dibuja un sprite rotado centrado en una posición.
+
+        Args:
+            surface: Superficie donde dibujar
+            sprite: Surface original
+            angle: Ángulo en grados
+            center: Tupla (x, y) del centro donde dibujar
+
+        Returns:
+            pygame.Rect: Zona de la pantalla que se ha dibujado
+        """
+        rotated, offset_x, offset_y = self.get(sprite, angle)
+        return surface.blit(rotated, (center[0] + offset_x, center[1] + offset_y))
+
+    def clear(self):
+        """Vacía todas las tablas de rotación."""
+        self._tables.clear()
+
+
+# Rotaciones compartidas por obstáculos, enemigos y espátulas
+rotation_cache = RotationCache()
+
+
+class PulseAnimationCache:
+    """
+    Caché de frames pre-escalados para el efecto de pulso de los power-ups.
+
+    El pulso de un power-up es periódico: la escala vale
+    0.9 + 0.2 * |cos(pulse_timer * POWERUP_PULSE_SPEED)|, así que se repite
+    cada 180 / POWERUP_PULSE_SPEED frames. En lugar de llamar a
+    transform.scale() cada frame, se calculan todos los frames de un
+    periodo una sola vez (ya tintados si hace falta) y se indexan con
+    pulse_timer.
+    """
+
+    def __init__(self, pulse_speed=POWERUP_PULSE_SPEED):
+        """
+        Constructor de la caché de pulsos.
+
+        Args:
+            pulse_speed: Grados que avanza el pulso por frame
+        """
+        self.pulse_speed = pulse_speed
+        # |cos| tiene periodo 180 grados: buscamos cuántos frames tarda en repetirse
+        self.period = 180 // math.gcd(180, pulse_speed)
+        self._animations = {}   # (sprite, tinte) -> lista de (surface, offset_x, offset_y)
+
+    def get_scale(self, pulse_timer):
+        """
+        Calcula el factor de escala del pulso para un frame.
+
+        Args:
+            pulse_timer: Contador de frames del power-up
+
+        Returns:
+            float: Escala entre 0.9 y 1.1
+        """
+        pulse_intensity = abs(math.cos(math.radians(pulse_timer * self.pulse_speed)))
+        return 0.9 + 0.2 * pulse_intensity
+
+    def get_frames(self, sprite, tint=None):
+        """
+        Obtiene (o construye) todos los frames de un periodo de pulso.
+
+        Args:
+            sprite: Surface original del power-up (compartida)
+            tint: Color RGBA con el que tintar cada frame, o None
+
+        Returns:
+            list: Una entrada (surface, offset_x, offset_y) por frame del periodo
+        """
+        key = (sprite, tint)
+        frames = self._animations.get(key)
+        if frames is None:
+            frames = []
+            width, height = sprite.get_size()
+            for pulse_timer in range(self.period):
+                scale_factor = self.get_scale(pulse_timer)
+                scaled_size = (int(width * scale_factor), int(height * scale_factor))
+                frame = pygame.transform.scale(sprite, scaled_size)
+
+                if tint is not None:
+                    # Tinte pre-aplicado (mismo método que el escudo del jugador)
+                    tint_surface = pygame.Surface(scaled_size, pygame.SRCALPHA)
+                    tint_surface.fill(tint)
+                    frame.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+
+                frames.append((frame, -(scaled_size[0] // 2), -(scaled_size[1] // 2)))
+            self._animations[key] = frames
+        return frames
+
+    def get(self, sprite, pulse_timer, tint=None):
+        """
+        Obtiene el frame de pulso correspondiente a pulse_timer.
+
+        Returns:
+            tuple: (surface, offset_x, offset_y) relativo al centro
+        """
+        return self.get_frames(sprite, tint)[pulse_timer % self.period]
+
+    def clear(self):
+        """Vacía todas las animaciones guardadas."""
+        self._animations.clear()
+
+
+# Animaciones de pulso compartidas por todos los power-ups
+pulse_cache = PulseAnimationCache()
+
+
+class FontRegistry:
+    """
+    Registro de fuentes por tamaño.
+
+    Crear un pygame.font.Font es caro (hay que leer y preparar la fuente).
+    Antes se creaban fuentes nuevas en cada frame (barra de cooldown,
+    power-ups fallback, texto de pausa...). Aquí cada tamaño se crea una
+    sola vez y se reutiliza.
+    """
+
+    def __init__(self):
+        """Constructor del registro de fuentes."""
+        self._fonts = {}   # tamaño -> pygame.font.Font
+
+    def get(self, size):
+        """
+        Obtiene la fuente por defecto de pygame con un tamaño dado.
+
+        Args:
+            size: Tamaño de la fuente en píxeles
+
+        Returns:
+            pygame.font.Font: Fuente compartida
+        """
+        font = self._fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+
+
+class TextCache:
+    """
+    Caché de textos ya renderizados con expulsión LRU.
+
+    font.render() crea una Surface nueva cada vez. La mayoría de textos del
+    HUD ("Vidas: 3", "LISTO"...) no cambian de un frame a otro, así que se
+    guardan por (fuente, texto, antialias, color). Cuando la caché se llena,
+    se descarta el texto usado hace más tiempo (LRU = Least Recently Used).
+
+    ⚠️ Las Surfaces devueltas son compartidas: no modificarlas in-place.
+
+    Atributos:
+    - hits / misses: Estadísticas de aciertos y fallos
+    - evictions: Textos descartados por falta de espacio
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        """
+        Constructor de la caché de textos.
+
+        Args:
+            max_entries: Número máximo de textos guardados
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """
+        Equivalente a font.render(text, antialias, color), pero con caché.
+
+        Args:
+            font: Fuente con la que renderizar
+            text: Texto a renderizar
+            antialias: Suavizado de bordes (True/False)
+            color: Color RGB del texto
+
+        Returns:
+            pygame.Surface: Texto renderizado (compartido)
+        """
+        key = (font, text, antialias, color)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)   # Marcar como usado recientemente
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)  # Descartar el menos usado
+            self.evictions += 1
+        return surface
+
+    def get_hit_rate(self):
+        """
+        Obtiene el porcentaje de aciertos de la caché.
+
+        Returns:
+            float: Valor entre 0.0 y 1.0 (0.0 si aún no hubo peticiones)
+        """
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def clear(self):
+        """Vacía la caché y sus estadísticas."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """Número de textos guardados."""
+        return len(self._entries)
+
+
+# Fuentes y textos compartidos por el HUD, los estados y las entidades
+font_registry = FontRegistry()
+text_cache = TextCache()
+
+
+class DirtyRectRenderer:
+    """
+    Renderizado por rectángulos sucios (dirty rects) para la pantalla de juego.
+
+    En lugar de repintar el fondo entero y hacer display.flip() cada frame,
+    solo se restaura el fondo en las zonas que las entidades, el HUD y los
+    efectos ocupaban el frame anterior, y se envían a la pantalla (con
+    display.update) esas zonas más las que ocupan ahora.
+
+    Funciona porque todas las entidades se vuelven a dibujar cada frame:
+    lo único que hay que "borrar" es su posición anterior.
+
+    Flujo de un frame:
+    1. begin_frame(): decide si el frame puede ser parcial
+    2. restore_background(): pinta el fondo sobre los rects del frame anterior
+    3. add()/add_all(): cada draw() informa del rect que ha cubierto
+    4. present(): envía los rects a la pantalla (o hace flip si es completo)
+
+    Atributos:
+    - enabled: Si el modo dirty rects está activado (tecla F4)
+    - last_count: Número de rects enviados en el último frame (0 si fue completo)
+    """
+
+    def __init__(self, enabled=DIRTY_RECT_RENDERING):
+        """Constructor del renderizador por rectángulos sucios."""
+        self.enabled = enabled
+        self.last_count = 0
+        self._previous_rects = []   # Zonas cubiertas en el frame anterior
+        self._current_rects = []    # Zonas cubiertas en este frame
+        self._needs_full_redraw = True
+        self._partial = False
+
+    def toggle(self):
+        """
+        Activa o desactiva el modo dirty rects.
+
+        Returns:
+            bool: Nuevo estado del modo
+        """
+        self.enabled = not self.enabled
+        self.invalidate()
+        return self.enabled
+
+    def invalidate(self):
+        """Fuerza un repintado completo en el próximo frame."""
+        self._needs_full_redraw = True
+
+    def begin_frame(self, can_be_partial):
+        """
+        Prepara un nuevo frame.
+
+        Args:
+            can_be_partial: False si el estado actual repinta toda la pantalla
+                            (menús, pausa, screen shake...)
+
+        Returns:
+            bool: True si este frame se dibujará de forma parcial
+        """
+        self._current_rects = []
+        self._partial = self.enabled and can_be_partial and not self._needs_full_redraw
+
+        if not can_be_partial:
+            # La pantalla entera cambia: el siguiente frame parcial no sirve
+            self._needs_full_redraw = True
+        elif self.enabled:
+            self._needs_full_redraw = False
+
+        return self._partial
+
+    def is_partial(self):
+        """Indica si el frame actual se está dibujando de forma parcial."""
+        return self._partial
+
+    def restore_background(self, surface, background):
+        """
+        Restaura el fondo solo en las zonas ocupadas el frame anterior.
+
+        Args:
+            surface: Superficie de la pantalla
+            background: Capa de fondo completa (mismo tamaño que la ventana)
+        """
+        for rect in self._previous_rects:
+            surface.blit(background, rect, rect)
+
+    def add(self, rect):
+        """
+        Registra una zona dibujada en este frame.
+
+        Args:
+            rect: pygame.Rect cubierto, o None si no se dibujó nada
+        """
+        if self.enabled and rect:
+            self._current_rects.append(rect)
+
+    def add_all(self, rects):
+        """Registra varias zonas dibujadas en este frame."""
+        if self.enabled:
+            self._current_rects.extend(rect for rect in rects if rect)
+
+    def present(self):
+        """
+        Hace visible lo dibujado en este frame.
+
+        En modo parcial envía los rects antiguos y nuevos con display.update;
+        en cualquier otro caso hace un display.flip() normal.
+        """
+        if self._partial:
+            dirty_rects = self._previous_rects + self._current_rects
+            self.last_count = len(dirty_rects)
+            if self.last_count > DIRTY_RECT_MAX:
+                # Demasiados rects: un flip completo sale más barato
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+        else:
+            self.last_count = 0
+            pygame.display.flip()
+
+        # Solo tiene sentido recordar los rects si el modo está activo
+        self._previous_rects = self._current_rects if self.enabled else []
+        self._current_rects = []
+
+
+# Renderizador de la pantalla principal
+dirty_renderer = DirtyRectRenderer()
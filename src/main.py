@@ -37,19 +37,29 @@ Para ejecutar: python src/main.py
 import sys
 import pygame
 import random
+from itertools import chain
 
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 # Importar nuestros módulos
 from settings import *
-from entities import Player, Obstacle, Knife, PowerUp, Enemy, Explosion, ScreenEffect
-from abilities import CooldownTimer, PowerUpEffect, ParticleEffect, ComboSystem
+from entities import Explosion, ScreenEffect
+from graphics import sprite_cache, background_layers, text_cache, dirty_renderer
+from audio import sound_bank
+from abilities import ParticleEffect
+from simulation import GameSimulation, InputSnapshot
+from containers import EntityList, ObjectPool
+from particles import particle_system
+from timestep import FixedTimestep, RenderInterpolator
+from replay import ReplayRecorder
+from profiler import frame_profiler, IDLE_PHASE
+from frame_times import frame_time_recorder
+from tracing import tracer
+from allocations import allocation_tracker
 from game_states import GameStateManager, MenuState, PlayingState, GameOverState, PausedState, InstructionsState
 from utils import (
-    load_best_score, save_best_score, should_spawn_obstacle, 
-    should_spawn_powerup, get_random_powerup_type, get_difficulty_multiplier,
-    debug_print, update_play_statistics, get_fps_color
+    load_best_score, save_best_score, debug_print, update_play_statistics, get_fps_color
 )
 
 class JuliasRunGame:
@@ -90,23 +100,36 @@ class JuliasRunGame:
         self.paused_state = PausedState(self.state_manager)  # ✅ IMPLEMENTADO
 
         # Música de fondo
-        pygame.mixer.music.load(SOUND_BACKGROUND)
-        pygame.mixer.music.play(-1)
+        sound_bank.play_music(SOUND_BACKGROUND, -1)
 
-        # Efectos de sonido
-        sonido_throw = pygame.mixer.Sound(SOUND_THROW)
-        sonido_hit = pygame.mixer.Sound(SOUND_HIT)
-        sonido_powerup = pygame.mixer.Sound(SOUND_POWERUP)
+        # ✅ IMPLEMENTADO: Efectos de sonido precargados una sola vez (ver audio.py)
+        sound_bank.load_all()
         
         # Variables del juego
         self.running = True
-        self.frame_count = 0
         
         # ✅ IMPLEMENTADO: Variables adicionales para funcionalidad completa
         self.debug_mode = False        # Modo debug (activar con F1)
         self.show_fps = False         # Mostrar FPS (activar con F2)
         self.game_start_time = 0      # Para tracking de tiempo de juego
         
+        # ✅ IMPLEMENTADO: Toda la lógica de juego vive en la simulación
+        # (simulation.py); esta clase solo lee el teclado y dibuja
+        self.simulation = GameSimulation()
+        self.throw_requested = False  # Se pulsó ESPACIO desde el último update
+        self.recorder = ReplayRecorder()  # ✅ IMPLEMENTADO: Grabación de la partida (ver replay.py)
+        
+        # ✅ IMPLEMENTADO: Pools de efectos visuales (ver ObjectPool en containers.py)
+        self.explosion_pool = ObjectPool(Explosion, "Explosiones")
+        self.particle_effect_pool = ObjectPool(ParticleEffect, "Efectos")
+        self.explosions = EntityList(pool=self.explosion_pool)       # Lista de explosiones
+        self.particles = EntityList(pool=self.particle_effect_pool)  # Lista de efectos de partículas
+        
+        # ✅ IMPLEMENTADO: La lógica avanza a TICK_RATE ticks por segundo de
+        # tiempo real y se dibuja interpolando entre ticks (ver timestep.py)
+        self.timestep = FixedTimestep()
+        self.interpolator = RenderInterpolator()
+        
         # Inicializar componentes del juego
         self.reset_game()
     
@@ -118,30 +141,20 @@ class JuliasRunGame:
         Es importante resetear TODOS los componentes para evitar bugs.
         """
         
-        # Crear jugador
-        self.player = Player()
-        
-        # Listas de entidades del juego
-        self.obstacles = []      # Lista de obstáculos en pantalla
-        self.knives = []         # Lista de cuchillos lanzados
-        self.powerups = []       # Lista de power-ups en pantalla
-        self.enemies = []        # ✅ IMPLEMENTADO: Lista de enemigos
-        self.explosions = []     # ✅ IMPLEMENTADO: Lista de explosiones
-        self.particles = []      # ✅ IMPLEMENTADO: Lista de efectos de partículas
+        # ✅ IMPLEMENTADO: Jugador, entidades, combos, power-ups y dificultad
+        # se reinician dentro de la simulación
+        self.simulation.reset()
+        self.throw_requested = False
+        self.recorder.start(self.simulation.run_seed)  # ✅ IMPLEMENTADO: Semilla + controles
         
-        # Sistemas de juego
-        self.knife_cooldown = CooldownTimer(SCRAPER_COOLDOWN)
-        self.powerup_effects = PowerUpEffect()
-        self.combo_system = ComboSystem()     # ✅ IMPLEMENTADO: Sistema de combos
+        # Efectos puramente visuales (no afectan a la partida)
+        self.explosions.clear()  # ✅ IMPLEMENTADO: Vuelven a su pool
+        self.particles.clear()
         self.screen_effects = ScreenEffect()  # ✅ IMPLEMENTADO: Efectos de pantalla
-        
-        # Contadores
-        self.frame_count = 0
-        self.enemy_spawn_timer = 0  # ✅ IMPLEMENTADO: Timer para spawn de enemigos
-        
-        # ✅ IMPLEMENTADO: Variables para dificultad progresiva
-        self.current_difficulty = 1.0
-        self.last_difficulty_score = 0
+        particle_system.clear()  # ✅ IMPLEMENTADO: Quitar las partículas de la partida anterior
+        self.interpolator.clear()  # ✅ IMPLEMENTADO: Las posiciones guardadas eran de la partida anterior
+        frame_time_recorder.clear()  # ✅ IMPLEMENTADO: Percentiles de esta partida (ver frame_times.py)
+        allocation_tracker.clear()  # ✅ IMPLEMENTADO: Memoria reservada en esta partida (F7)
         
         # Cargar mejor puntuación
         self.best_score = load_best_score()
@@ -171,15 +184,36 @@ class JuliasRunGame:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F1:
                     self.debug_mode = not self.debug_mode
+                    frame_profiler.set_enabled(self.debug_mode)  # ✅ Solo mide con el overlay visible
+                    if not self.debug_mode:
+                        allocation_tracker.set_enabled(False)  # tracemalloc ralentiza todo el juego
                     print(f"Modo debug: {'ON' if self.debug_mode else 'OFF'}")
                 elif event.key == pygame.K_F2:
                     self.show_fps = not self.show_fps
                     print(f"Mostrar FPS: {'ON' if self.show_fps else 'OFF'}")
                 elif event.key == pygame.K_F3 and self.debug_mode:
                     # Cheat: añadir puntos para testing
-                    if hasattr(self, 'player'):
-                        self.player.score += 50
+                    if hasattr(self, 'simulation'):
+                        self.simulation.player.score += 50
+                        self.recorder.mark_tainted()  # ✅ Los puntos no están en los controles grabados
                         print("Cheat: +50 puntos añadidos")
+                elif event.key == pygame.K_F4:
+                    # ✅ IMPLEMENTADO: Renderizado por dirty rects (ver graphics.py)
+                    enabled = dirty_renderer.toggle()
+                    print(f"Dirty rects: {'ON' if enabled else 'OFF'}")
+                elif event.key == pygame.K_F5:
+                    # ✅ IMPLEMENTADO: Guardar percentiles y peores frames (ver frame_times.py)
+                    self.dump_frame_times()
+                elif event.key == pygame.K_F6:
+                    # ✅ IMPLEMENTADO: Traza Chrome trace-event (ver tracing.py);
+                    # las vueltas del perfilador son los tramos de la traza
+                    enabled = tracer.toggle()
+                    frame_profiler.set_tracer(tracer if enabled else None)
+                    print(f"Traza: {'ON' if enabled else 'OFF'} ({tracer.count} eventos, se guarda al salir)")
+                elif event.key == pygame.K_F7 and self.debug_mode:
+                    # ✅ IMPLEMENTADO: Memoria reservada por frame (ver allocations.py)
+                    enabled = allocation_tracker.toggle()
+                    print(f"Memoria por frame (tracemalloc): {'ON' if enabled else 'OFF'}")
         
         # Delegar el manejo de eventos al estado actual
         current_state = self.state_manager.get_current_state()
@@ -191,11 +225,13 @@ class JuliasRunGame:
             return self.instructions_state.handle_events(events)
         
         elif current_state == STATE_PLAYING:
-            new_knives, continue_playing = self.playing_state.handle_events(
-                events, self.player, self.knife_cooldown
-            )
-            # Añadir nuevos cuchillos a la lista
-            self.knives.extend(new_knives)
+            throw_pressed, continue_playing = self.playing_state.handle_events(events)
+            # La espátula se lanza en el siguiente paso de la simulación
+            if throw_pressed:
+                self.throw_requested = True
+            # ✅ IMPLEMENTADO: La pausa también queda en la repetición
+            if self.state_manager.next_state == STATE_PAUSED:
+                self.recorder.mark_pause()
             return continue_playing
         
         elif current_state == STATE_PAUSED:
@@ -224,41 +260,6 @@ class JuliasRunGame:
             self.menu_state.update()
         
         elif current_state == STATE_PLAYING:
-            # Incrementar contador de frames
-            self.frame_count += 1
-            
-            # ✅ IMPLEMENTADO: Calcular dificultad progresiva
-            self.current_difficulty = get_difficulty_multiplier(self.player.score)
-            
-            # ✅ IMPLEMENTADO: Notificar al jugador cuando aumenta la dificultad
-            if self.player.score // DIFFICULTY_INCREASE_INTERVAL > self.last_difficulty_score // DIFFICULTY_INCREASE_INTERVAL:
-                self.last_difficulty_score = self.player.score
-                debug_print(f"¡Dificultad aumentada! Nivel: {self.current_difficulty:.1f}", 
-                          debug_mode=True)  # Siempre mostrar este mensaje
-            
-            # Spawn de nuevos obstáculos (con dificultad ajustada)
-            adjusted_spawn_rate = max(30, OBSTACLE_SPAWN_RATE - int(self.current_difficulty * 10))
-            if self.frame_count % adjusted_spawn_rate == 0:
-                new_obstacle = Obstacle(self.current_difficulty)
-                self.obstacles.append(new_obstacle)
-            
-            # ✅ IMPLEMENTADO: Spawn de enemigos ocasional
-            self.enemy_spawn_timer += 1
-            enemy_spawn_rate = max(300, 600 - int(self.current_difficulty * 50))
-            if self.enemy_spawn_timer >= enemy_spawn_rate:
-                if len(self.enemies) < 2:  # Máximo 2 enemigos a la vez
-                    new_enemy = Enemy(self.player.rect.centerx, self.current_difficulty)
-                    self.enemies.append(new_enemy)
-                    debug_print("¡Enemigo aparecido!", debug_mode=self.debug_mode)
-                self.enemy_spawn_timer = 0
-            
-            # Spawn de power-ups (menos frecuente con dificultad)
-            adjusted_powerup_rate = max(200, POWERUP_SPAWN_RATE + int(self.current_difficulty * 20))
-            if self.frame_count % adjusted_powerup_rate == 0:
-                powerup_type = get_random_powerup_type()
-                new_powerup = PowerUp(powerup_type)
-                self.powerups.append(new_powerup)
-            
             # Actualizar lógica del juego
             player_alive = self.update_game_logic()
             
@@ -279,167 +280,112 @@ class JuliasRunGame:
     
     def update_game_logic(self):
         """
-        ✅ IMPLEMENTADO: Lógica de juego mejorada con todos los sistemas.
+        ✅ IMPLEMENTADO: Avanza la partida un frame.
         
-        Esta función centraliza toda la lógica del juego durante el estado PLAYING,
-        incluyendo sistemas nuevos como combos, partículas y efectos de pantalla.
+        La lógica (movimiento, spawn, colisiones, puntuación) está en
+        GameSimulation. Aquí se leen los controles, se avanza la simulación
+        y se actualizan los efectos visuales que dependen de sus eventos.
         
         Returns:
             bool: True si el jugador sigue vivo, False si Game Over
         """
         
-        # Actualizar timers y sistemas
-        self.knife_cooldown.update()
-        self.powerup_effects.update(self.player)
-        self.combo_system.update()
+        # Controles de este frame (teclas mantenidas + lanzamiento pendiente)
+        inputs = InputSnapshot.from_keys(pygame.key.get_pressed(), throw=self.throw_requested)
+        self.throw_requested = False
+        self.recorder.record(inputs)
+        
+        events = self.simulation.step(inputs)
+        
+        # ✅ IMPLEMENTADO: Actualizar efectos de pantalla
         self.screen_effects.update()
         
-        # Mover jugador según teclas presionadas
-        keys = pygame.key.get_pressed()
-        self.player.move(keys)
-        
-        # ✅ IMPLEMENTADO: Actualizar obstáculos normales
-        for obstacle in self.obstacles[:]:
-            if not obstacle.update():
-                # Obstáculo salió de pantalla - dar puntos por esquivar
-                self.obstacles.remove(obstacle)
-                points = self.combo_system.get_combo_bonus_points(POINTS_PER_OBSTACLE_AVOIDED)
-                self.player.score += points
-                debug_print(f"Obstáculo esquivado: +{points} puntos", debug_mode=self.debug_mode)
-        
-        # ✅ IMPLEMENTADO: Actualizar enemigos
-        for enemy in self.enemies[:]:
-            if not enemy.update(self.player.rect.centerx):
-                self.enemies.remove(enemy)
-                # Los enemigos dan más puntos por esquivar
-                points = self.combo_system.get_combo_bonus_points(POINTS_PER_OBSTACLE_AVOIDED * 2)
-                self.player.score += points
-                debug_print(f"Enemigo esquivado: +{points} puntos", debug_mode=self.debug_mode)
-        
-        # Actualizar cuchillos
-        for knife in self.knives[:]:
-            if not knife.update():
-                self.knives.remove(knife)
-        
-        # Actualizar power-ups
-        for powerup in self.powerups[:]:
-            if not powerup.update():
-                self.powerups.remove(powerup)
-        
-        # ✅ IMPLEMENTADO: Actualizar explosiones
-        for explosion in self.explosions[:]:
-            if not explosion.update():
-                self.explosions.remove(explosion)
-        
-        # ✅ IMPLEMENTADO: Actualizar partículas
-        for particle_effect in self.particles[:]:
-            if not particle_effect.update():
-                self.particles.remove(particle_effect)
-        
-        # ✅ IMPLEMENTADO: Detección de colisiones jugador-obstáculos (con invulnerabilidad)
-        all_threats = self.obstacles + self.enemies
-        for threat in all_threats[:]:
-            if self.player.rect.colliderect(threat.rect):
-                # Remover la amenaza
-                if threat in self.obstacles:
-                    self.obstacles.remove(threat)
-                else:
-                    self.enemies.remove(threat)
-                
-                # ✅ IMPLEMENTADO: Efectos al recibir daño
-                if not self.player.take_damage():
-                    # Game Over
-                    return False
-                
-                # Resetear combo al recibir daño
-                self.combo_system.add_miss()
-                
+        # ✅ IMPLEMENTADO: Actualizar explosiones y partículas; retain() quita
+        # las que han terminado sin copiar la lista (ver containers.py)
+        self.explosions.retain(Explosion.update)
+        self.particles.retain(ParticleEffect.update)
+        
+        # ✅ IMPLEMENTADO: La física de todas las partículas se calcula de una vez
+        particle_system.update()
+        
+        self.handle_simulation_events(events)
+        frame_profiler.lap("Efectos")
+        
+        return not self.simulation.game_over
+    
+    def handle_simulation_events(self, events):
+        """
+        ✅ IMPLEMENTADO: Reacciona a lo ocurrido en la simulación.
+        
+        Crea explosiones y partículas, inicia el screen shake, reproduce
+        sonidos y muestra mensajes de debug. Nada de esto afecta a la partida.
+        
+        Args:
+            events: Lista de eventos devuelta por GameSimulation.step()
+        """
+        for event in events:
+            event_type = event['type']
+            
+            if event_type == EVENT_KNIFE_THROWN:
+                # ✅ IMPLEMENTADO: Sonido de lanzamiento (precargado)
+                sound_bank.play(SOUND_THROW)
+            
+            elif event_type == EVENT_PLAYER_HIT:
                 # ✅ IMPLEMENTADO: Efectos visuales al recibir daño
                 self.screen_effects.start_screen_shake()
                 
                 # Crear efecto de partículas en el punto de impacto
-                impact_particles = ParticleEffect(
-                    threat.rect.centerx, threat.rect.centery, 
-                    RED, particle_count=8, effect_type="explosion"
+                impact_particles = self.particle_effect_pool.acquire(
+                    event['x'], event['y'],
+                    RED, particle_count=8, effect_type="explosion",
+                    priority=PARTICLE_PRIORITY_IMPACT
                 )
                 self.particles.append(impact_particles)
-        
-        # ✅ IMPLEMENTADO: Detección de colisiones cuchillo-amenazas
-        for knife in self.knives[:]:
-            hit_something = False
             
-            # Colisiones con obstáculos
-            for obstacle in self.obstacles[:]:
-                if knife.rect.colliderect(obstacle.rect):
-                    # Destruir ambos y dar puntos
-                    self.knives.remove(knife)
-                    self.obstacles.remove(obstacle)
-                    
-                    # ✅ IMPLEMENTADO: Puntos con sistema de combos
-                    points = self.combo_system.get_combo_bonus_points(POINTS_PER_OBSTACLE_DESTROYED)
-                    self.player.score += points
-                    self.combo_system.add_hit()
-                    
+            elif event_type == EVENT_THREAT_DESTROYED:
+                if event['kind'] == 'obstacle':
                     # ✅ IMPLEMENTADO: Crear explosión visual
-                    explosion = Explosion(obstacle.rect.centerx, obstacle.rect.centery)
+                    explosion = self.explosion_pool.acquire(event['x'], event['y'])
                     self.explosions.append(explosion)
                     
-                    # ✅ IMPLEMENTADO: Partículas adicionales
-                    explosion_particles = ParticleEffect(
-                        obstacle.rect.centerx, obstacle.rect.centery,
+                    # ✅ IMPLEMENTADO: Partículas adicionales (decorativas: son las
+                    # primeras que se descartan si se supera el presupuesto)
+                    explosion_particles = self.particle_effect_pool.acquire(
+                        event['x'], event['y'],
                         YELLOW, particle_count=12, effect_type="explosion"
                     )
                     self.particles.append(explosion_particles)
                     
-                    debug_print(f"Obstáculo destruido: +{points} puntos (combo x{self.combo_system.combo_count})", 
+                    debug_print(f"Obstáculo destruido: +{event['points']} puntos (combo x{event['combo']})", 
                               debug_mode=self.debug_mode)
-                    hit_something = True
-                    break
+                else:
+                    # Explosión más grande para enemigos
+                    explosion = self.explosion_pool.acquire(event['x'], event['y'], PURPLE)
+                    self.explosions.append(explosion)
+                    
+                    debug_print(f"Enemigo destruido: +{event['points']} puntos!", debug_mode=self.debug_mode)
             
-            # ✅ IMPLEMENTADO: Colisiones con enemigos (más difíciles de destruir)
-            if not hit_something:
-                for enemy in self.enemies[:]:
-                    if knife.rect.colliderect(enemy.rect):
-                        self.knives.remove(knife)
-                        self.enemies.remove(enemy)
-                        
-                        # Los enemigos dan más puntos
-                        points = self.combo_system.get_combo_bonus_points(POINTS_PER_OBSTACLE_DESTROYED * 3)
-                        self.player.score += points
-                        self.combo_system.add_hit()
-                        
-                        # Explosión más grande para enemigos
-                        explosion = Explosion(enemy.rect.centerx, enemy.rect.centery, PURPLE)
-                        self.explosions.append(explosion)
-                        
-                        debug_print(f"Enemigo destruido: +{points} puntos!", debug_mode=self.debug_mode)
-                        break
-        
-        # Detectar colisiones jugador-power-ups
-        for powerup in self.powerups[:]:
-            if self.player.rect.colliderect(powerup.rect):
-                self.powerups.remove(powerup)
-                
-                # ✅ IMPLEMENTADO: Puntos con sistema de combos
-                points = self.combo_system.get_combo_bonus_points(POINTS_PER_POWERUP)
-                self.player.score += points
-                
-                # Activar efecto según el tipo
-                if powerup.type == 'vodka':
-                    self.powerup_effects.activate_cocacola_boost(self.player)
-                elif powerup.type == 'tea':
-                    self.powerup_effects.activate_cachopo_shield(self.player)
-                
+            elif event_type == EVENT_POWERUP_COLLECTED:
                 # ✅ IMPLEMENTADO: Efectos visuales para power-ups
-                sparkle_particles = ParticleEffect(
-                    powerup.rect.centerx, powerup.rect.centery,
-                    powerup.color, particle_count=10, effect_type="sparkle"
+                sparkle_particles = self.particle_effect_pool.acquire(
+                    event['x'], event['y'],
+                    event['color'], particle_count=10, effect_type="sparkle"
                 )
                 self.particles.append(sparkle_particles)
                 
-                debug_print(f"Power-up recogido: +{points} puntos", debug_mode=self.debug_mode)
-        
-        return True  # Jugador sigue vivo
+                debug_print(f"Power-up recogido: +{event['points']} puntos", debug_mode=self.debug_mode)
+            
+            elif event_type == EVENT_THREAT_AVOIDED:
+                name = "Obstáculo" if event['kind'] == 'obstacle' else "Enemigo"
+                debug_print(f"{name} esquivado: +{event['points']} puntos", debug_mode=self.debug_mode)
+            
+            elif event_type == EVENT_SPAWN and event['kind'] == 'enemy':
+                debug_print("¡Enemigo aparecido!", debug_mode=self.debug_mode)
+            
+            elif event_type == EVENT_DIFFICULTY_UP:
+                # ✅ IMPLEMENTADO: Notificar al jugador cuando aumenta la dificultad
+                debug_print(f"¡Dificultad aumentada! Nivel: {event['difficulty']:.1f}", 
+                          debug_mode=True)  # Siempre mostrar este mensaje
     
     def handle_game_over(self):
         """
@@ -451,25 +397,41 @@ class JuliasRunGame:
         
         # ✅ IMPLEMENTADO: Actualizar estadísticas de juego
         game_time = (pygame.time.get_ticks() / 1000.0) - self.game_start_time
-        update_play_statistics(self.player.score, game_time)
+        update_play_statistics(self.simulation.player.score, game_time)
 
         # IMPLEMENTADO: Música de game over
-        pygame.mixer.music.load(SOUND_GAMEOVER)
-        pygame.mixer.music.play(0)
+        sound_bank.play_music(SOUND_GAMEOVER, 0)
         
         # Guardar nueva mejor puntuación si corresponde
-        if self.player.score > self.best_score:
-            save_best_score(self.player.score)
-            self.best_score = self.player.score
+        if self.simulation.player.score > self.best_score:
+            save_best_score(self.simulation.player.score)
+            self.best_score = self.simulation.player.score
+        
+        # ✅ IMPLEMENTADO: Guardar los tiempos de frame de la partida
+        self.dump_frame_times()
+        
+        # ✅ IMPLEMENTADO: Resumen de memoria reservada si se estaba midiendo (F7)
+        if allocation_tracker.enabled:
+            summary = allocation_tracker.write_summary()
+            print(f"Memoria: {summary['net_bytes_per_second'] / 1024:.1f} KiB/s netos, "
+                  f"pico de {summary['max_frame_peak_bytes'] / 1024:.1f} KiB en un frame -> {ALLOC_SUMMARY_FILE}")
+        
+        # ✅ IMPLEMENTADO: Guardar la repetición de la partida (ver replay.py)
+        # (no si se usó un cheat: la puntuación cambia la dificultad y no se podría reproducir)
+        if RECORD_REPLAYS and self.recorder.tainted:
+            print("Repetición no guardada: se usaron cheats en la partida")
+        elif RECORD_REPLAYS:
+            path = self.recorder.save(self.simulation.player.score)
+            print(f"Repetición guardada en {path}")
         
         # Configurar el estado de Game Over
-        self.game_over_state.set_scores(self.player.score, self.best_score)
+        self.game_over_state.set_scores(self.simulation.player.score, self.best_score)
         
         # ✅ IMPLEMENTADO: Mostrar estadísticas finales en debug
-        debug_print(f"Game Over! Puntuación final: {self.player.score}", debug_mode=True)
+        debug_print(f"Game Over! Puntuación final: {self.simulation.player.score}", debug_mode=True)
         debug_print(f"Tiempo jugado: {game_time:.1f} segundos", debug_mode=True)
-        debug_print(f"Mejor combo: {self.combo_system.best_combo}", debug_mode=True)
-        debug_print(f"Dificultad alcanzada: {self.current_difficulty:.1f}", debug_mode=True)
+        debug_print(f"Mejor combo: {self.simulation.combo_system.best_combo}", debug_mode=True)
+        debug_print(f"Dificultad alcanzada: {self.simulation.current_difficulty:.1f}", debug_mode=True)
         
         # Cambiar al estado de Game Over
         self.state_manager.change_state(STATE_GAME_OVER)
@@ -487,6 +449,10 @@ class JuliasRunGame:
         # ✅ IMPLEMENTADO: Aplicar screen shake si está activo
         screen_offset = self.screen_effects.get_screen_offset()
         
+        # ✅ IMPLEMENTADO: Solo la pantalla de juego sin temblor admite dirty rects;
+        # el resto de estados repinta la ventana entera
+        dirty_renderer.begin_frame(current_state == STATE_PLAYING and screen_offset == (0, 0))
+        
         if current_state == STATE_MENU:
             self.menu_state.draw(self.screen)
         
@@ -498,7 +464,7 @@ class JuliasRunGame:
                 self.draw_game_content(temp_surface)
                 self.screen.blit(temp_surface, screen_offset)
             else:
-                self.draw_game_content(self.screen)
+                dirty_renderer.add_all(self.draw_game_content(self.screen))
         
         elif current_state == STATE_PAUSED:
             # ✅ IMPLEMENTADO: Dibujar pausa con fondo del juego
@@ -511,14 +477,24 @@ class JuliasRunGame:
         
         # ✅ IMPLEMENTADO: Dibujar información de debug si está activa
         if self.debug_mode:
-            self.draw_debug_info()
+            dirty_renderer.add_all(self.draw_debug_info())
+            dirty_renderer.add_all(self.draw_profiler())
+            dirty_renderer.add_all(self.draw_allocations())
         
         # ✅ IMPLEMENTADO: Mostrar FPS si está activado
         if self.show_fps:
-            self.draw_fps_counter()
+            dirty_renderer.add(self.draw_fps_counter())
+        
+        # ✅ IMPLEMENTADO: Contador de dirty rects para comparar rendimiento
+        if dirty_renderer.enabled:
+            dirty_renderer.add(self.draw_dirty_rect_counter())
         
-        # Actualizar la pantalla (hacer visible lo dibujado)
-        pygame.display.flip()
+        frame_profiler.lap("Overlay")
+        
+        # Actualizar la pantalla (hacer visible lo dibujado): flip completo
+        # o solo los rects sucios si el modo está activo
+        dirty_renderer.present()
+        frame_profiler.lap("Flip")
     
     def draw_game_content(self, surface):
         """
@@ -526,13 +502,98 @@ class JuliasRunGame:
         
         Esta función centraliza el dibujo del juego para poder reutilizarla
         en diferentes contextos (juego normal, pausa con fondo, etc.).
+        
+        Returns:
+            list: Zonas dibujadas (pygame.Rect) por entidades, efectos y HUD
+        """
+        
+        # ✅ IMPLEMENTADO: Fondo + instrucciones pre-compuestos en una capa.
+        # En un frame de dirty rects solo se restaura donde hubo algo dibujado.
+        if surface is self.screen and dirty_renderer.is_partial():
+            background = background_layers.get_layer("game", self.build_game_background)
+            dirty_renderer.restore_background(surface, background)
+        else:
+            background_layers.draw(surface, "game", self.build_game_background)
+        frame_profiler.lap("Fondo")
+        
+        dirty_rects = []
+        
+        # ✅ IMPLEMENTADO: Con THREAT_BACKEND = "soa" las posiciones de las
+        # amenazas viven en arrays; se copian a los objetos antes de dibujar
+        self.simulation.sync_views()
+        
+        # ✅ IMPLEMENTADO: Dibujar las entidades entre el tick anterior y el
+        # actual (solo jugando; en pausa la imagen queda quieta)
+        self.interpolator.apply(self.get_drawable_entities(), self.get_render_alpha())
+        
+        # Dibujar todas las entidades
+        dirty_rects.append(self.simulation.player.draw(surface))
+        
+        for obstacle in self.simulation.obstacles:
+            dirty_rects.append(obstacle.draw(surface))
+        
+        for enemy in self.simulation.enemies:
+            dirty_rects.append(enemy.draw(surface))
+        
+        for knife in self.simulation.knives:
+            dirty_rects.append(knife.draw(surface))
+        
+        for powerup in self.simulation.powerups:
+            dirty_rects.append(powerup.draw(surface))
+        
+        self.interpolator.restore()
+        frame_profiler.lap("Entidades")
+        
+        # ✅ IMPLEMENTADO: Dibujar efectos visuales (todas las partículas
+        # de explosiones y efectos con un solo blits(), ver particles.py)
+        dirty_rects.append(particle_system.draw(surface))
+        frame_profiler.lap("Partículas")
+        
+        # Dibujar HUD (Heads-Up Display)
+        dirty_rects.extend(self.draw_hud(surface))
+        frame_profiler.lap("HUD")
+        
+        return dirty_rects
+    
+    def get_drawable_entities(self):
+        """
+        ✅ IMPLEMENTADO: Entidades que se dibujan interpoladas.
+        
+        Se recorren las listas de la simulación sin copiarlas: se llama dos
+        veces por frame y una lista nueva cada vez sería memoria reservada
+        en el camino caliente.
+        
+        Returns:
+            iterator: Jugador, obstáculos, enemigos, cuchillos y power-ups
+        """
+        simulation = self.simulation
+        return chain((simulation.player,), simulation.obstacles, simulation.enemies,
+                     simulation.knives, simulation.powerups)
+    
+    def get_render_alpha(self):
+        """
+        ✅ IMPLEMENTADO: Fracción entre el tick anterior y el actual al dibujar.
+        
+        Fuera de la partida (pausa, game over) no hay ticks de juego que
+        interpolar, así que se dibuja la posición real (1.0).
+        """
+        if self.state_manager.get_current_state() != STATE_PLAYING:
+            return 1.0
+        return self.timestep.get_alpha()
+    
+    def build_game_background(self, surface):
+        """
+        ✅ IMPLEMENTADO: Dibuja la parte estática de la pantalla de juego.
+        
+        Se llama una sola vez; el resultado se guarda en una capa de
+        background_layers y cada frame solo se hace un blit.
         """
         
         # Limpiar pantalla
         surface.fill(GREEN_LIGHT)
 
         # Fondo de pantalla del juego
-        fondo = pygame.image.load(SPRITE_BACKGROUND_GAME).convert()
+        fondo = background_layers.get_image(SPRITE_BACKGROUND_GAME)
         fondo_center = fondo.get_rect(center=(WINDOW_WIDTH//2, 350))
         surface.blit(fondo, fondo_center)
 
@@ -551,58 +612,38 @@ class JuliasRunGame:
             text = self.state_manager.font_small.render(instruction, True, color)
             text_rect = text.get_rect(right=843, top=start_y + i * 25)
             surface.blit(text, text_rect)
-        
-        # Dibujar todas las entidades
-        self.player.draw(surface)
-        
-        for obstacle in self.obstacles:
-            obstacle.draw(surface)
-        
-        for enemy in self.enemies:
-            enemy.draw(surface)
-        
-        for knife in self.knives:
-            knife.draw(surface)
-        
-        for powerup in self.powerups:
-            powerup.draw(surface)
-        
-        # ✅ IMPLEMENTADO: Dibujar efectos visuales
-        for explosion in self.explosions:
-            explosion.draw(surface)
-        
-        for particle_effect in self.particles:
-            particle_effect.draw(surface)
-        
-        # Dibujar HUD (Heads-Up Display)
-        self.draw_hud(surface)
     
     def draw_hud(self, surface):
         """
         ✅ IMPLEMENTADO: Dibuja la interfaz de usuario mejorada.
+        
+        Returns:
+            list: Zonas dibujadas (pygame.Rect), para dirty rects
         """
+        dirty_rects = []
         
         # Puntuación con formato mejorado
         from utils import format_score
-        score_text = self.state_manager.font_medium.render(
-            f"Puntuación: {format_score(self.player.score)}", True, WHITE
+        score_text = text_cache.render(
+            self.state_manager.font_medium,
+            f"Puntuación: {format_score(self.simulation.player.score)}", True, WHITE
         )
-        surface.blit(score_text, (10, 10))
+        dirty_rects.append(surface.blit(score_text, (10, 10)))
         
         # Vidas con indicadores visuales
-        lives_text = self.state_manager.font_medium.render(f"Vidas: {self.player.lives}", True, WHITE)
-        surface.blit(lives_text, (10, 40))
+        lives_text = text_cache.render(self.state_manager.font_medium, f"Vidas: {self.simulation.player.lives}", True, WHITE)
+        dirty_rects.append(surface.blit(lives_text, (10, 40)))
         
         # ✅ IMPLEMENTADO: Indicadores visuales de vidas
-        for i in range(self.player.lives):
+        for i in range(self.simulation.player.lives):
             heart_x = 80 + i * 25
             heart_y = 45
-            pygame.draw.circle(surface, RED, (heart_x, heart_y), 8)
+            dirty_rects.append(pygame.draw.circle(surface, RED, (heart_x, heart_y), 8))
             pygame.draw.circle(surface, WHITE, (heart_x, heart_y), 8, 1)
         
         # Estado del escudo con mejor visualización
-        if self.player.has_shield:
-            shield_text = self.state_manager.font_small.render("🛡️ ESCUDO ACTIVO", True, CACHOPO_COLOR)
+        if self.simulation.player.has_shield:
+            shield_text = text_cache.render(self.state_manager.font_small, "🛡️ ESCUDO ACTIVO", True, CACHOPO_COLOR)
             shield_rect = shield_text.get_rect()
             shield_rect.x = 10
             shield_rect.y = 70
@@ -614,58 +655,173 @@ class JuliasRunGame:
             pygame.draw.rect(surface, CACHOPO_COLOR, bg_rect, 1)
             
             surface.blit(shield_text, shield_rect)
+            dirty_rects.append(bg_rect)
         
         # ✅ IMPLEMENTADO: Barra de cooldown visual
-        self.knife_cooldown.draw_cooldown_bar(surface)
+        dirty_rects.append(self.simulation.knife_cooldown.draw_cooldown_bar(surface))
         
         # ✅ IMPLEMENTADO: Efectos activos
-        self.powerup_effects.draw_active_effects(surface, self.state_manager.font_small)
+        dirty_rects.extend(self.simulation.powerup_effects.draw_active_effects(surface, self.state_manager.font_small))
         
         # ✅ IMPLEMENTADO: Sistema de combos
-        self.combo_system.draw_combo_display(surface, self.state_manager.font_small)
+        dirty_rects.append(self.simulation.combo_system.draw_combo_display(surface, self.state_manager.font_small))
         
         # ✅ IMPLEMENTADO: Indicador de dificultad
-        if self.current_difficulty > 1.0:
-            diff_text = f"Dificultad: {self.current_difficulty:.1f}x"
-            diff_surface = self.state_manager.font_small.render(diff_text, True, YELLOW)
+        if self.simulation.current_difficulty > 1.0:
+            diff_text = f"Dificultad: {self.simulation.current_difficulty:.1f}x"
+            diff_surface = text_cache.render(self.state_manager.font_small, diff_text, True, YELLOW)
             diff_rect = diff_surface.get_rect()
             diff_rect.right = WINDOW_WIDTH - 10
             diff_rect.bottom = WINDOW_HEIGHT - 10
-            surface.blit(diff_surface, diff_rect)
+            dirty_rects.append(surface.blit(diff_surface, diff_rect))
+        
+        return dirty_rects
     
     def draw_debug_info(self):
         """
         ✅ IMPLEMENTADO: Dibuja información de debug.
+        
+        Returns:
+            list: Zonas dibujadas (pygame.Rect), para dirty rects
         """
         debug_info = [
             f"FPS: {self.clock.get_fps():.1f}",
-            f"Obstáculos: {len(self.obstacles)}",
-            f"Enemigos: {len(self.enemies)}",
-            f"Cuchillos: {len(self.knives)}",
-            f"Power-ups: {len(self.powerups)}",
+            f"Obstáculos: {len(self.simulation.obstacles)}",
+            f"Enemigos: {len(self.simulation.enemies)}",
+            f"Cuchillos: {len(self.simulation.knives)}",
+            f"Power-ups: {len(self.simulation.powerups)}",
             f"Explosiones: {len(self.explosions)}",
-            f"Partículas: {len(self.particles)}",
-            f"Frame: {self.frame_count}",
+            f"Efectos de partículas: {len(self.particles)}",
+            f"Partículas vivas: {len(particle_system)} / {particle_system.get_effective_budget()} (LOD {particle_system.lod:.0%})",
+            f"Partículas descartadas: {particle_system.culled} ({particle_system.merged} ráfagas fusionadas)",
+            "Pools: " + ", ".join(pool.get_stats_text() for pool in self.simulation.get_pools()[:2]),
+            "Pools: " + ", ".join(pool.get_stats_text() for pool in
+                                  self.simulation.get_pools()[2:] + [self.explosion_pool, self.particle_effect_pool]),
+            f"Sprites en caché: {len(sprite_cache)} ({sprite_cache.hits} hits / {sprite_cache.misses} misses)",
+            f"Textos en caché: {len(text_cache)} (aciertos {text_cache.get_hit_rate():.0%}, {text_cache.misses} renders)",
+            f"Dirty rects: {dirty_renderer.last_count if dirty_renderer.enabled else 'OFF'}",
+            f"Frame: {self.simulation.frame_count}",
+            f"Semilla: {self.simulation.run_seed} (RUN_SEED en settings.py para repetir)",
+            f"Ticks: {self.timestep.last_ticks} en este frame ({TICK_RATE}/s), alpha {self.get_render_alpha():.2f}, "
+            f"descartados {self.timestep.dropped_ticks}",
             f"Estado: {self.state_manager.get_current_state()}",
+            f"Traza (F6): {'ON' if tracer.enabled else 'OFF'}, {tracer.count} eventos ({tracer.dropped} perdidos)",
+            f"Memoria por frame (F7): {'ON' if allocation_tracker.enabled else 'OFF'}",
         ]
         
+        dirty_rects = []
         y_offset = WINDOW_HEIGHT - len(debug_info) * 20 - 10
         for info in debug_info:
+            # Sin caché: estas líneas cambian cada frame y expulsarían los textos del HUD
             text = self.state_manager.font_small.render(info, True, WHITE)
             bg_rect = pygame.Rect(10, y_offset - 2, text.get_width() + 4, text.get_height() + 4)
             pygame.draw.rect(self.screen, BLACK, bg_rect)
             pygame.draw.rect(self.screen, GREEN, bg_rect, 1)
             self.screen.blit(text, (12, y_offset))
+            dirty_rects.append(bg_rect)
             y_offset += 20
+        
+        return dirty_rects
+    
+    def draw_profiler(self):
+        """
+        ✅ IMPLEMENTADO: Dibuja el tiempo de cada fase del frame (ver profiler.py).
+        
+        Abajo a la derecha: una gráfica de barras apiladas (un frame por
+        barra, la línea amarilla es el presupuesto de un frame) y, para
+        cada fase, su color, la media y el máximo en milisegundos.
+        
+        Returns:
+            list: Zonas dibujadas (pygame.Rect), para dirty rects
+        """
+        stats = frame_profiler.get_stats()
+        if not stats:
+            return []
+        
+        font = self.state_manager.font_small
+        line_height = 20
+        width = 260
+        graph_height = 80
+        panel = pygame.Rect(0, 0, width + 8, graph_height + (len(stats) + 1) * line_height + 12)
+        panel.bottomright = (WINDOW_WIDTH - 10, WINDOW_HEIGHT - 10)
+        pygame.draw.rect(self.screen, BLACK, panel)
+        pygame.draw.rect(self.screen, GREEN, panel, 1)
+        
+        left = panel.left + 4
+        graph = pygame.Rect(left, panel.top + 4, width, graph_height)
+        frame_profiler.draw_graph(self.screen, graph)
+        
+        # Cabecera: trabajo medio del frame frente al presupuesto
+        work = sum(avg for phase, avg, _ in stats if phase != IDLE_PHASE)
+        y = graph.bottom + 4
+        header = font.render(f"Trabajo {work:.2f} ms de {1000 / FPS:.1f}   media / máx", True, WHITE)
+        self.screen.blit(header, (left, y))
+        
+        for phase, avg, peak in stats:
+            y += line_height
+            if phase != IDLE_PHASE:
+                pygame.draw.rect(self.screen, frame_profiler.get_phase_color(phase), (left, y + 4, 10, 10))
+            self.screen.blit(text_cache.render(font, phase, True, WHITE), (left + 16, y))
+            for value, right in ((avg, left + 200), (peak, left + width)):
+                text = font.render(f"{value:.2f}", True, WHITE)
+                self.screen.blit(text, text.get_rect(topright=(right, y)))
+        
+        return [panel]
+    
+    def draw_allocations(self):
+        """
+        ✅ IMPLEMENTADO: Dibuja las líneas que más memoria reservan (F7, ver allocations.py).
+        
+        Arriba a la derecha: el pico de memoria temporal del frame y, para
+        cada línea de código, los bytes por segundo que reserva y los
+        bloques (objetos) por frame que siguen vivos.
+        
+        Returns:
+            list: Zonas dibujadas (pygame.Rect), para dirty rects
+        """
+        if not allocation_tracker.enabled:
+            return []
+        
+        font = self.state_manager.font_small
+        lines = [f"Memoria temporal: {allocation_tracker.frame_peak / 1024:.1f} KiB/frame "
+                 f"(máx {allocation_tracker.max_frame_peak / 1024:.1f})"]
+        lines += [f"{site}  {bytes_per_second / 1024:.1f} KiB/s  {blocks:.1f} obj/frame"
+                  for site, bytes_per_second, blocks in allocation_tracker.top_sites]
+        if not allocation_tracker.top_sites:
+            lines.append("Sin reservas que sigan vivas")
+        
+        # Sin caché: estas líneas cambian cada medio segundo
+        texts = [font.render(line, True, WHITE) for line in lines]
+        panel = pygame.Rect(0, 0, max(text.get_width() for text in texts) + 8, len(texts) * 20 + 6)
+        panel.topright = (WINDOW_WIDTH - 10, 50)
+        pygame.draw.rect(self.screen, BLACK, panel)
+        pygame.draw.rect(self.screen, GREEN, panel, 1)
+        for i, text in enumerate(texts):
+            self.screen.blit(text, (panel.left + 4, panel.top + 3 + i * 20))
+        
+        return [panel]
+    
+    def dump_frame_times(self):
+        """✅ IMPLEMENTADO: Guarda p50/p90/p99/p99.9 y los peores frames en FRAME_TIME_FILE."""
+        report = frame_time_recorder.dump()
+        percentiles = ", ".join(f"{name} {ms:.1f} ms" for name, ms in report["percentiles_ms"].items())
+        print(f"Tiempos de frame ({report['frames']} frames): {percentiles} -> {FRAME_TIME_FILE}")
     
     def draw_fps_counter(self):
         """
         ✅ IMPLEMENTADO: Dibuja contador de FPS con código de colores.
+        
+        Junto a los FPS (una media suavizada) se muestra el p99 de los
+        últimos frames: es lo que delata los tirones.
+        
+        Returns:
+            pygame.Rect: Zona dibujada, para dirty rects
         """
         fps = self.clock.get_fps()
         fps_color = get_fps_color(fps)
+        p99 = frame_time_recorder.get_recent_percentile(99)
         
-        fps_text = self.state_manager.font_medium.render(f"FPS: {fps:.0f}", True, fps_color)
+        fps_text = text_cache.render(self.state_manager.font_medium, f"FPS: {fps:.0f}  p99: {p99:.0f} ms", True, fps_color)
         fps_rect = fps_text.get_rect()
         fps_rect.right = WINDOW_WIDTH - 10
         fps_rect.top = 10
@@ -677,6 +833,31 @@ class JuliasRunGame:
         pygame.draw.rect(self.screen, fps_color, bg_rect, 1)
         
         self.screen.blit(fps_text, fps_rect)
+        return bg_rect
+    
+    def draw_dirty_rect_counter(self):
+        """
+        ✅ IMPLEMENTADO: Muestra cuántos rects se enviaron a pantalla el último frame.
+        
+        Sirve para comparar el modo dirty rects con el flip completo en
+        pantallas con renderizado por software. "flip" indica frame completo.
+        
+        Returns:
+            pygame.Rect: Zona dibujada, para dirty rects
+        """
+        count = dirty_renderer.last_count
+        label = f"Dirty rects: {count}" if count else "Dirty rects: flip"
+        
+        text = text_cache.render(self.state_manager.font_small, label, True, WHITE)
+        text_rect = text.get_rect(centerx=WINDOW_WIDTH // 2, top=10)
+        
+        bg_rect = pygame.Rect(text_rect.x - 5, text_rect.y - 2,
+                            text_rect.width + 10, text_rect.height + 4)
+        pygame.draw.rect(self.screen, BLACK, bg_rect)
+        pygame.draw.rect(self.screen, LIGHT_BLUE, bg_rect, 1)
+        
+        self.screen.blit(text, text_rect)
+        return bg_rect
     
     def run(self):
         """
@@ -685,41 +866,70 @@ class JuliasRunGame:
         Este es el corazón del juego: un bucle que se ejecuta continuamente
         hasta que el jugador decide salir. En cada iteración:
         1. Maneja eventos
-        2. Actualiza lógica
-        3. Dibuja en pantalla
-        4. Controla el framerate
+        2. Actualiza lógica: tantos ticks fijos como tiempo real haya pasado
+        3. Dibuja en pantalla (interpolando entre el último par de ticks)
+        4. Controla el framerate y mide cuánto ha durado el frame
+        
+        ✅ IMPLEMENTADO: Paso de tiempo fijo (ver timestep.py). La lógica
+        siempre avanza TICK_RATE ticks por segundo de tiempo real, aunque
+        los frames se alarguen o la pantalla dibuje más rápido.
         """
         
         print("¡Iniciando Julia's Run!")
         print("Usa las flechas para mover, ESPACIO para lanzar cuchillos.")
         print("¡Buena suerte!")
         
+        # El primer frame ejecuta un tick; después, lo que mida clock.tick()
+        frame_seconds = self.timestep.tick_seconds
+        
         # Game loop principal
         while self.running:
+            # ✅ IMPLEMENTADO: Con F1, medir cuánto tarda cada fase (ver profiler.py)
+            frame_profiler.start_frame()
+            
             # 1. Manejar eventos (input del usuario)
             self.running = self.handle_events()
+            frame_profiler.lap("Eventos")
             
-            # 2. Actualizar lógica del juego
+            # 2. Actualizar lógica del juego (0, 1 o varios ticks)
             if self.running:
-                self.update()
+                ticks = self.timestep.advance(frame_seconds)
+                for tick in range(ticks):
+                    if tick == ticks - 1:
+                        # Posiciones "de antes" para interpolar al dibujar
+                        self.simulation.sync_views()
+                        self.interpolator.capture(self.get_drawable_entities())
+                        frame_profiler.lap("Interpolación")
+                    self.update()
+                    self.check_restart()
             
             # 3. Dibujar todo en pantalla
             if self.running:
                 self.draw()
             
-            # 4. Controlar framerate (mantener FPS constantes)
-            self.clock.tick(FPS)
+            # 4. Controlar framerate (como mucho FPS dibujos por segundo)
+            frame_seconds = self.clock.tick(FPS) / 1000.0
+            frame_profiler.lap(IDLE_PHASE)
             
-            # Comprobar si necesitamos reiniciar el juego
-            if (self.state_manager.get_current_state() == STATE_PLAYING and 
-                self.state_manager.next_state == STATE_PLAYING):
-                # El estado cambió a PLAYING desde otro estado - reiniciar
-                self.reset_game()
-                self.state_manager.next_state = None
+            # ✅ IMPLEMENTADO: Tiempo real de cada frame, para los percentiles
+            frame_time_recorder.mark_frame()
+            allocation_tracker.mark_frame()  # ✅ IMPLEMENTADO: Con F7, memoria reservada por frame
+            
+            # ✅ IMPLEMENTADO: Ajustar el detalle de las partículas según lo
+            # que ha tardado el frame (get_rawtime() no cuenta la espera del tick)
+            particle_system.report_frame_time(self.clock.get_rawtime())
         
         # Cleanup al salir
         self.cleanup()
     
+    def check_restart(self):
+        """Reinicia la partida si el estado acaba de cambiar a PLAYING desde otro estado."""
+        if (self.state_manager.get_current_state() == STATE_PLAYING and 
+            self.state_manager.next_state == STATE_PLAYING):
+            # El estado cambió a PLAYING desde otro estado - reiniciar
+            self.reset_game()
+            self.state_manager.next_state = None
+    
     def cleanup(self):
         """
         Limpia recursos antes de salir del juego.
@@ -728,6 +938,11 @@ class JuliasRunGame:
         antes de terminar el programa.
         """
         
+        # ✅ IMPLEMENTADO: Guardar la traza si se grabó algo (F6)
+        if tracer.count:
+            saved = tracer.write()
+            print(f"Traza guardada en {TRACE_FILE} ({saved} eventos): ábrela en https://ui.perfetto.dev")
+        
         print("¡Gracias por jugar Julia's Run!")
         pygame.quit()
 
@@ -798,7 +1013,7 @@ def main():
 
 # ✅ IMPLEMENTADO: Opciones de configuración
 # - Sistema de configuración en utils.py
-# - Controles de debug (F1, F2, F3)
+# - Controles de debug (F1, F2, F3, F4, F5, F6, F7)
 # - Modo debug con información detallada
 
 # TODO 9: Multijugador local
@@ -899,7 +1114,7 @@ Conceptos importantes del game loop y arquitectura de juegos:
 
 8. DEBUG Y HERRAMIENTAS DE DESARROLLO:
    - Modo debug para visualizar estado interno
-   - Teclas especiales para testing (F1, F2, F3)
+   - Teclas especiales para testing (F1, F2, F3, F4, F5, F6, F7)
    - Información en tiempo real para optimización
 
 9. GESTIÓN DE MEMORIA Y RENDIMIENTO:
@@ -919,7 +1134,8 @@ ERRORES COMUNES QUE LOS ESTUDIANTES PODRÍAN COMETER:
    
 2. **No manejar la eliminación segura de listas**:
    - Problema: for item in lista: lista.remove(item)
-   - Solución: for item in lista[:]: # Iterar sobre copia
+   - Solución sencilla: for item in lista[:]: # Iterar sobre copia
+   - Solución sin copias: EntityList (containers.py) con discard() + compact()
    
 3. **Hardcodear valores en lugar de usar constants**:
    - Problema: if countdown == 60:
@@ -0,0 +1,413 @@
+"""
+particles.py - Motor de partículas vectorizado con NumPy
+
+Antes cada Explosion y cada ParticleEffect guardaba sus partículas en una
+lista de diccionarios y las actualizaba una a una en Python, y para
+dibujarlas llamaba a pygame.draw.circle() por cada partícula.
+
+Aquí todas las partículas del juego viven en un único motor que las guarda
+en arrays de NumPy (una "columna" por atributo: x, y, velocidad, vida...).
+Así la física de TODAS las partículas se calcula con unas pocas operaciones
+sobre arrays, y el dibujo se hace con un solo surface.blits() usando
+"sellos" (pequeñas Surfaces con el círculo ya dibujado) cacheados.
+
+Además el motor tiene un presupuesto: nunca hay más de PARTICLE_BUDGET
+partículas vivas. Cada ráfaga tiene una prioridad (impacto > brillo >
+decoración); si no cabe, se "fusiona" (menos partículas pero más grandes),
+se hace hueco quitando partículas menos importantes o, como último
+recurso, se descarta. Si los frames tardan demasiado, el presupuesto se
+reduce (nivel de detalle, LOD) hasta que el juego vuelve a ir fluido.
+
+Conceptos de programación cubiertos:
+- Estructura de arrays (Structure of Arrays, SoA)
+- Operaciones vectorizadas con NumPy (sin bucles en Python)
+- Máscaras booleanas para filtrar elementos
+- Cachés de Surfaces pre-dibujadas
+- Presupuestos y niveles de detalle (LOD)
+
+Referencias útiles:
+- NumPy: https://numpy.org/doc/stable/user/absolute_beginners.html
+- pygame.Surface.blits: https://www.pygame.org/docs/ref/surface.html#pygame.Surface.blits
+"""
+
+import numpy as np
+import pygame
+from settings import *
+from random_streams import random_streams
+
+
+# ✅ IMPLEMENTADO: Comportamiento de cada tipo de partícula.
+# - "blast": partículas de Explosion (entities.py)
+# - "explosion", "sparkle", "trail": tipos de ParticleEffect (abilities.py)
+# angle/speed/size/life son rangos (mín, máx) para los valores aleatorios;
+# jitter desplaza el punto de salida; shrink hace que el radio se reduzca al desvanecerse;
+# priority es la prioridad por defecto de las ráfagas de ese tipo
+PARTICLE_PRESETS = {
+    "blast": {
+        'angle': (0, 2 * 3.14159), 'speed': (2, 8), 'size': (2, 5),
+        'life': (15, PARTICLE_LIFE), 'max_life': PARTICLE_LIFE,
+        'jitter': 0, 'shrink': False, 'gravity': 0.2, 'friction': 0.98,
+        'priority': PARTICLE_PRIORITY_IMPACT,
+    },
+    "explosion": {
+        'angle': (0, 2 * 3.14159), 'speed': (1, 6), 'size': (1, 4),
+        'life': (20, 40), 'max_life': 40,
+        'jitter': 5, 'shrink': True, 'gravity': 0.1, 'friction': 0.98,
+        'priority': PARTICLE_PRIORITY_COSMETIC,
+    },
+    "sparkle": {
+        'angle': (-0.5, 0.5), 'speed': (0.5, 2), 'size': (1, 4),
+        'life': (20, 40), 'max_life': 40,
+        'jitter': 5, 'shrink': True, 'gravity': -0.05, 'friction': 0.99,
+        'priority': PARTICLE_PRIORITY_SPARKLE,
+    },
+    "trail": {
+        'angle': (1.57 - 0.3, 1.57 + 0.3), 'speed': (1, 3), 'size': (1, 4),
+        'life': (20, 40), 'max_life': 40,
+        'jitter': 5, 'shrink': True, 'gravity': 0.0, 'friction': 1.0,
+        'priority': PARTICLE_PRIORITY_COSMETIC,
+    },
+}
+
+
+class ParticleSystem:
+    """
+    Motor global de partículas.
+
+    Todas las partículas se guardan en arrays de NumPy de tamaño fijo
+    (que se duplican si hacen falta más). Las partículas vivas ocupan
+    siempre las primeras `count` posiciones.
+
+    Uso:
+        particle_system.spawn_burst(x, y, YELLOW, 12, "explosion")
+        particle_system.update()          # Una vez por frame
+        particle_system.draw(screen)      # Un solo blits() para todas
+        particle_system.report_frame_time(ms)  # Ajusta el nivel de detalle
+
+    Atributos:
+    - count: Número de partículas vivas
+    - rng: Generador aleatorio de NumPy usado para las ráfagas (random_streams.particles)
+    - budget: Máximo de partículas vivas con el detalle al 100%
+    - lod: Nivel de detalle actual (1.0 = completo, baja si los frames van lentos)
+    - culled: Partículas descartadas o quitadas por el presupuesto
+    - merged: Ráfagas que se han fusionado (menos partículas, más grandes)
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, budget=PARTICLE_BUDGET):
+        """
+        Constructor del motor de partículas.
+
+        Args:
+            capacity: Número de partículas reservadas al principio
+            budget: Máximo de partículas vivas a la vez
+        """
+        self.count = 0
+        self.rng = random_streams.particles  # ✅ Cosmético: no altera la partida
+
+        # ✅ IMPLEMENTADO: Presupuesto y nivel de detalle
+        self.budget = budget
+        self.lod = 1.0
+        self.frame_time_ms = 0.0   # Media móvil del tiempo de cada frame
+        self.culled = 0
+        self.merged = 0
+
+        # Tablas por tipo (índice de tipo -> gravedad / fricción)
+        self._kinds = {name: index for index, name in enumerate(PARTICLE_PRESETS)}
+        self._gravity = np.array([preset['gravity'] for preset in PARTICLE_PRESETS.values()])
+        self._friction = np.array([preset['friction'] for preset in PARTICLE_PRESETS.values()])
+
+        # Colores usados (color -> índice), para guardar el color como un entero
+        self._palette = {}
+        self._colors = []
+
+        # Sellos pre-dibujados: clave entera -> Surface con el círculo
+        self._stamps = {}
+
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Reserva (o amplía) los arrays conservando las partículas vivas."""
+        n = self.count
+        old = getattr(self, 'x', None)
+
+        fields = {
+            'x': np.float64, 'y': np.float64,
+            'vel_x': np.float64, 'vel_y': np.float64,
+            'life': np.int32, 'max_life': np.int32, 'size': np.int32,
+            'kind': np.int8, 'color': np.int32, 'shrink': np.bool_,
+            'priority': np.int8,
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+
+        self.capacity = capacity
+
+    def _color_index(self, color):
+        """Devuelve el índice de un color en la paleta, añadiéndolo si es nuevo."""
+        color = tuple(color[:3])
+        index = self._palette.get(color)
+        if index is None:
+            index = len(self._colors)
+            self._palette[color] = index
+            self._colors.append(color)
+        return index
+
+    def get_effective_budget(self):
+        """Presupuesto actual, reducido según el nivel de detalle."""
+        return int(self.budget * self.lod)
+
+    def _room_for(self, priority):
+        """Cuántas partículas de esta prioridad caben todavía."""
+        limit = int(self.get_effective_budget() * PARTICLE_PRIORITY_SHARE[priority])
+        return max(0, limit - self.count)
+
+    def spawn_burst(self, x, y, color, count, kind="explosion", priority=None):
+        """
+        Crea una ráfaga de partículas en una sola operación.
+
+        Si la ráfaga no cabe en el presupuesto:
+        1. Se quitan partículas de menor prioridad para hacerle hueco
+        2. Si aun así no cabe entera, se fusiona: se crean menos
+           partículas pero más grandes, para que ocupe lo mismo en pantalla
+        3. Si no cabe ninguna, se descarta
+
+        Args:
+            x, y: Punto de origen de la ráfaga
+            color: Color base (RGB)
+            count: Número de partículas
+            kind: Tipo de partícula (clave de PARTICLE_PRESETS)
+            priority: PARTICLE_PRIORITY_* (None = la del tipo de partícula)
+
+        Returns:
+            int: Número de partículas creadas
+        """
+        if count <= 0:
+            return 0
+
+        preset = PARTICLE_PRESETS[kind]
+        if priority is None:
+            priority = preset['priority']
+
+        # ✅ IMPLEMENTADO: Aplicar el presupuesto
+        room = self._room_for(priority)
+        if room < count:
+            self._evict(count - room, priority)
+            room = self._room_for(priority)
+        if room <= 0:
+            self.culled += count
+            return 0
+
+        size_scale = 1.0
+        if room < count:
+            # Fusionar: las partículas que quedan crecen para ocupar la misma área
+            size_scale = (count / room) ** 0.5
+            self.culled += count - room
+            self.merged += 1
+            count = room
+
+        start = self.count
+        end = start + count
+        if end > self.capacity:
+            self._allocate(max(end, self.capacity * 2))
+
+        rng = self.rng
+        angles = rng.uniform(*preset['angle'], count)
+        speeds = rng.uniform(*preset['speed'], count)
+        jitter = preset['jitter']
+
+        sl = slice(start, end)
+        if jitter:
+            self.x[sl] = x + rng.uniform(-jitter, jitter, count)
+            self.y[sl] = y + rng.uniform(-jitter, jitter, count)
+        else:
+            self.x[sl] = x
+            self.y[sl] = y
+        self.vel_x[sl] = speeds * np.cos(angles)
+        self.vel_y[sl] = speeds * np.sin(angles)
+        # integers() excluye el máximo: +1 para incluirlo (igual que random.randint)
+        sizes = rng.integers(preset['size'][0], preset['size'][1] + 1, count)
+        if size_scale != 1.0:
+            # Como mucho el doble del tamaño máximo del tipo
+            sizes = np.minimum(np.rint(sizes * size_scale), preset['size'][1] * 2)
+        self.size[sl] = sizes
+        self.life[sl] = rng.integers(preset['life'][0], preset['life'][1] + 1, count)
+        self.max_life[sl] = preset['max_life']
+        self.kind[sl] = self._kinds[kind]
+        self.color[sl] = self._color_index(color)
+        self.shrink[sl] = preset['shrink']
+        self.priority[sl] = priority
+
+        self.count = end
+        return count
+
+    def update(self):
+        """
+        Avanza la física de todas las partículas un frame.
+
+        Movimiento, gravedad, fricción y vida se calculan para todas a la
+        vez; después se compactan los arrays quitando las que han muerto.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        kind = self.kind[:n]
+        self.x[:n] += self.vel_x[:n]
+        self.y[:n] += self.vel_y[:n]
+        self.life[:n] -= 1
+        self.vel_y[:n] += self._gravity[kind]
+        self.vel_x[:n] *= self._friction[kind]
+
+        self._keep(self.life[:n] > 0)
+
+        # Si el nivel de detalle ha bajado, quitar lo que sobre
+        excess = self.count - self.get_effective_budget()
+        if excess > 0:
+            self._evict(excess, PARTICLE_PRIORITY_IMPACT - 1)
+
+    def _keep(self, alive):
+        """Compacta los arrays dejando solo las partículas marcadas en `alive`."""
+        n = self.count
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count < n:
+            for name in ('x', 'y', 'vel_x', 'vel_y', 'life', 'max_life',
+                         'size', 'kind', 'color', 'shrink', 'priority'):
+                array = getattr(self, name)
+                array[:alive_count] = array[:n][alive]
+            self.count = alive_count
+
+    def _evict(self, needed, priority):
+        """
+        Quita hasta `needed` partículas de prioridad menor que `priority`.
+
+        Se quitan primero las de menor prioridad y, dentro de cada
+        prioridad, las que menos vida les queda (las que menos se notan).
+
+        Returns:
+            int: Número de partículas quitadas
+        """
+        n = self.count
+        candidates = np.flatnonzero(self.priority[:n] > priority)
+        if needed <= 0 or len(candidates) == 0:
+            return 0
+
+        # lexsort ordena por la última clave primero: prioridad (de mayor a menor) y luego vida
+        order = np.lexsort((self.life[candidates], -self.priority[candidates]))
+        victims = candidates[order[:needed]]
+
+        alive = np.ones(n, dtype=np.bool_)
+        alive[victims] = False
+        self._keep(alive)
+        self.culled += len(victims)
+        return len(victims)
+
+    def report_frame_time(self, milliseconds):
+        """
+        Informa de lo que ha tardado el último frame para ajustar el detalle.
+
+        Si la media supera PARTICLE_FRAME_BUDGET_MS, el presupuesto baja un
+        5% cada frame (hasta PARTICLE_MIN_LOD); si va sobrado, se recupera
+        poco a poco.
+
+        Args:
+            milliseconds: Tiempo de trabajo del frame (sin la espera del tick)
+        """
+        self.frame_time_ms = self.frame_time_ms * 0.9 + milliseconds * 0.1
+        if self.frame_time_ms > PARTICLE_FRAME_BUDGET_MS:
+            self.lod = max(PARTICLE_MIN_LOD, self.lod * 0.95)
+        else:
+            self.lod = min(1.0, self.lod + 0.01)
+
+    def _build_stamp(self, color_index, life, max_life, radius):
+        """Dibuja el sello de una partícula (círculo del color ya desvanecido)."""
+        alpha_factor = life / max_life
+        faded_color = tuple(int(c * alpha_factor) for c in self._colors[color_index])
+
+        stamp = pygame.Surface((radius * 2, radius * 2))
+        # Colorkey distinto del color de la partícula para que el fondo sea transparente
+        key_color = WHITE if faded_color == BLACK else BLACK
+        stamp.fill(key_color)
+        stamp.set_colorkey(key_color)
+        pygame.draw.circle(stamp, faded_color, (radius, radius), radius)
+        return stamp
+
+    def draw(self, screen):
+        """
+        Dibuja todas las partículas con un solo surface.blits().
+
+        Cada partícula usa un sello cacheado según su color, su vida y su
+        radio, así que el resultado es idéntico a pygame.draw.circle().
+
+        Args:
+            screen: Superficie donde dibujar
+
+        Returns:
+            pygame.Rect: Zona que cubren las partículas (None si no hay ninguna)
+        """
+        n = self.count
+        if n == 0:
+            return None
+
+        life = self.life[:n]
+        max_life = self.max_life[:n]
+        size = self.size[:n]
+
+        # Radio: fijo, o reducido según la vida restante ("shrink")
+        shrunk = (size * (life / max_life)).astype(np.int64)
+        radius = np.where(self.shrink[:n], shrunk, size)
+
+        visible = radius > 0
+        if not visible.all():
+            radius = radius[visible]
+            if len(radius) == 0:
+                return None
+            life = life[visible]
+            max_life = max_life[visible]
+            color = self.color[:n][visible]
+            x = self.x[:n][visible]
+            y = self.y[:n][visible]
+        else:
+            color = self.color[:n]
+            x = self.x[:n]
+            y = self.y[:n]
+
+        # Clave entera única por (color, vida, vida máxima, radio)
+        keys = ((color.astype(np.int64) * 1024 + life) * 1024 + max_life) * 64 + radius
+
+        stamps = self._stamps
+        for key in np.unique(keys).tolist():
+            if key not in stamps:
+                rest, key_radius = divmod(key, 64)
+                rest, key_max_life = divmod(rest, 1024)
+                key_color, key_life = divmod(rest, 1024)
+                stamps[key] = self._build_stamp(key_color, key_life, key_max_life, key_radius)
+
+        # Esquina superior izquierda de cada sello (int() trunca igual que antes)
+        left = x.astype(np.int64) - radius
+        top = y.astype(np.int64) - radius
+
+        screen.blits(zip(map(stamps.__getitem__, keys.tolist()),
+                         zip(left.tolist(), top.tolist())), doreturn=False)
+
+        right = int((left + radius * 2).max())
+        bottom = int((top + radius * 2).max())
+        min_left = int(left.min())
+        min_top = int(top.min())
+        return pygame.Rect(min_left, min_top, right - min_left, bottom - min_top)
+
+    def clear(self):
+        """Elimina todas las partículas (por ejemplo al reiniciar la partida)."""
+        self.count = 0
+        self.culled = 0
+        self.merged = 0
+
+    def __len__(self):
+        """Número de partículas vivas."""
+        return self.count
+
+
+# Motor de partículas compartido por todo el juego
+particle_system = ParticleSystem()
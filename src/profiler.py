@@ -0,0 +1,198 @@
+"""
+profiler.py - Perfilador de fases del frame (overlay de F1)
+
+El contador de FPS dice CUÁNTO tarda un frame, pero no EN QUÉ. Este
+perfilador parte cada frame en fases (eventos, spawn, movimiento,
+colisiones, efectos, fondo, entidades, partículas, HUD, flip...) y
+guarda cuántos milisegundos se fueron en cada una durante los últimos
+PROFILER_HISTORY frames.
+
+Funciona como un cronómetro de vueltas: lap("Colisiones") apunta el
+tiempo pasado desde la vuelta anterior a la fase "Colisiones". Si en un
+frame hay varios ticks de lógica, las vueltas de la misma fase se suman.
+
+Desactivado (lo normal) no mide nada: lap() y start_frame() son una
+función vacía, así que dejar las llamadas en el código es gratis. Se
+activa junto con el modo debug (F1). Con la traza activa (F6, ver
+tracing.py) cada vuelta se apunta además como un tramo de la traza.
+
+Conceptos de programación cubiertos:
+- Perfilado (profiling) manual con time.perf_counter()
+- Medias móviles y máximos sobre una ventana de frames
+- Gráficas de barras apiladas para ver el presupuesto de cada frame
+
+Referencias útiles:
+- time.perf_counter: https://docs.python.org/3/library/time.html#time.perf_counter
+"""
+
+import time
+from collections import deque
+import pygame
+from settings import *
+
+# Fase que no es trabajo: el tiempo que clock.tick() espera para no pasar de FPS
+IDLE_PHASE = "Espera"
+
+# Colores de las fases en la gráfica (en orden de aparición)
+PHASE_COLORS = [
+    (230, 80, 80), (240, 160, 60), (240, 220, 70), (120, 210, 90),
+    (70, 190, 200), (80, 130, 240), (160, 100, 230), (230, 110, 200),
+    (200, 200, 200), (150, 110, 70), (90, 160, 120), (250, 140, 140),
+]
+
+
+def _skip(*args):
+    """Sustituto de lap()/start_frame() con el perfilador desactivado."""
+
+
+class FrameProfiler:
+    """
+    Tiempo de cada fase del frame, con media y máximo de los últimos frames.
+
+    Uso:
+        frame_profiler.set_enabled(True)
+        frame_profiler.start_frame()      # Al empezar cada vuelta del game loop
+        handle_events()
+        frame_profiler.lap("Eventos")     # Tiempo desde la vuelta anterior
+        ...
+        frame_profiler.get_stats()        # [(fase, media ms, máx ms), ...]
+
+    Atributos:
+    - enabled: Si está midiendo
+    - history: Últimos frames completos, cada uno un dict {fase: ms}
+    - order: Fases en el orden en que aparecieron (el de la gráfica)
+    - tracer: Traza que recibe cada vuelta como tramo (None = ninguna)
+    """
+
+    def __init__(self, history=PROFILER_HISTORY):
+        """
+        Constructor del perfilador.
+
+        Args:
+            history: Número de frames que se recuerdan
+        """
+        self.enabled = False
+        self.history = deque(maxlen=history)
+        self.order = []
+        self._current = {}
+        self._last = 0.0
+        self._frame_start = None
+        self.tracer = None
+        self.lap = _skip
+        self.start_frame = _skip
+
+    def set_enabled(self, enabled):
+        """Activa o desactiva las mediciones (al desactivar se olvida el historial)."""
+        self.enabled = enabled
+        self._bind()
+        self.clear()
+
+    def set_tracer(self, tracer):
+        """Envía también cada vuelta (y cada frame) como tramo a una traza (None = a ninguna)."""
+        self.tracer = tracer
+        self._bind()
+
+    def _bind(self):
+        """Elige entre medir de verdad o la función vacía."""
+        active = self.enabled or self.tracer is not None
+        self.lap = self._lap if active else _skip
+        self.start_frame = self._start_frame if active else _skip
+        self._last = time.perf_counter()
+        self._frame_start = None
+
+    def _start_frame(self):
+        """Cierra el frame anterior (si lo hay) y empieza a cronometrar uno nuevo."""
+        now = time.perf_counter()
+        if self.tracer is not None and self._frame_start is not None:
+            self.tracer.span("Frame", self._frame_start, now)
+        self._frame_start = now
+
+        if self._current:
+            self.history.append(self._current)
+            self._current = {}
+        self._last = now
+
+    def _lap(self, phase):
+        """Suma a `phase` el tiempo pasado desde la vuelta anterior."""
+        now = time.perf_counter()
+        if self.enabled:
+            current = self._current
+            if phase not in current and phase not in self.order:
+                self.order.append(phase)
+            current[phase] = current.get(phase, 0.0) + (now - self._last) * 1000
+        if self.tracer is not None:
+            self.tracer.span(phase, self._last, now)
+        self._last = now
+
+    def get_stats(self):
+        """
+        Media y máximo de cada fase en los frames del historial.
+
+        Returns:
+            list: Tuplas (fase, media en ms, máximo en ms) en orden de aparición
+        """
+        frames = len(self.history)
+        if frames == 0:
+            return []
+
+        stats = []
+        for phase in self.order:
+            values = [frame.get(phase, 0.0) for frame in self.history]
+            stats.append((phase, sum(values) / frames, max(values)))
+        return stats
+
+    def get_phase_color(self, phase):
+        """Color de una fase en la gráfica."""
+        return PHASE_COLORS[self.order.index(phase) % len(PHASE_COLORS)]
+
+    def draw_graph(self, surface, rect, scale_ms=PROFILER_GRAPH_MS):
+        """
+        Dibuja una barra apilada por frame (la más reciente a la derecha).
+
+        La espera de clock.tick() no se dibuja: la altura de cada barra es
+        el trabajo del frame. La línea amarilla marca el presupuesto de un
+        frame a FPS.
+
+        Args:
+            surface: Superficie donde dibujar
+            rect: Zona de la gráfica (pygame.Rect)
+            scale_ms: Milisegundos que corresponden a la altura completa
+
+        Returns:
+            pygame.Rect: Zona dibujada (para dirty rects)
+        """
+        pygame.draw.rect(surface, BLACK, rect)
+        pixels_per_ms = rect.height / scale_ms
+        bar_width = max(1, rect.width // self.history.maxlen)
+
+        x = rect.right - bar_width
+        for frame in reversed(self.history):
+            if x < rect.left:
+                break
+            bottom = rect.bottom
+            for phase in self.order:
+                ms = frame.get(phase)
+                if not ms or phase == IDLE_PHASE:
+                    continue
+                height = min(bottom - rect.top, max(1, round(ms * pixels_per_ms)))
+                if height <= 0:
+                    break
+                pygame.draw.rect(surface, self.get_phase_color(phase), (x, bottom - height, bar_width, height))
+                bottom -= height
+            x -= bar_width
+
+        budget_y = rect.bottom - round(1000 / FPS * pixels_per_ms)
+        if budget_y > rect.top:
+            pygame.draw.line(surface, YELLOW, (rect.left, budget_y), (rect.right - 1, budget_y))
+        pygame.draw.rect(surface, GREEN, rect, 1)
+        return rect
+
+    def clear(self):
+        """Olvida el historial y el frame en curso."""
+        self.history.clear()
+        self.order = []
+        self._current = {}
+
+
+# Instancia global (como particle_system)
+frame_profiler = FrameProfiler()
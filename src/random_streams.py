@@ -0,0 +1,91 @@
+"""
+random_streams.py - Generadores aleatorios con semilla, separados por subsistema
+
+Antes todo el juego usaba el módulo global `random`: la X y el tipo de
+cada obstáculo, el power-up que sale, el temblor de pantalla... Así no
+hay forma de repetir una partida, y cualquier efecto visual que pidiera
+un número aleatorio de más cambiaba los obstáculos que venían después.
+
+RandomStreams guarda un generador para cada uso, todos sacados de una
+única "semilla de partida" (run seed):
+- gameplay: todo lo que cambia la partida (spawns, tipos, power-ups)
+- cosmetic: lo que solo se ve (temblor de pantalla, pulso de los sprites)
+- particles: generador de NumPy para las ráfagas de partículas (cosmético)
+
+Cada generador tiene su propia secuencia, así que gastar números en
+los efectos visuales NUNCA cambia la partida: misma semilla + mismos
+controles = misma partida.
+
+Conceptos de programación cubiertos:
+- Números pseudoaleatorios y semillas
+- Reproducibilidad (repetir partidas, comparar benchmarks)
+- Separar el estado de la lógica del de la presentación
+
+Referencias útiles:
+- random.Random: https://docs.python.org/3/library/random.html#random.Random
+- Generadores de NumPy: https://numpy.org/doc/stable/reference/random/generator.html
+"""
+
+import random
+import numpy as np
+from settings import *
+
+
+class RandomStreams:
+    """
+    Generadores aleatorios de la partida, uno por subsistema.
+
+    Uso:
+        random_streams.seed(1234)                      # Al empezar la partida
+        x = random_streams.gameplay.randint(0, 100)    # Lógica
+        dx = random_streams.cosmetic.randint(-3, 3)    # Solo visual
+
+    seed() vuelve a sembrar los generadores en el sitio (no crea otros),
+    así que se pueden guardar referencias a ellos (ParticleSystem.rng).
+
+    Atributos:
+    - run_seed: Semilla de la partida actual (para poder repetirla)
+    - gameplay: random.Random de la lógica de juego
+    - cosmetic: random.Random de los efectos visuales
+    - particles: numpy.random.Generator de las partículas
+    """
+
+    def __init__(self, seed=None):
+        """
+        Constructor de los generadores.
+
+        Args:
+            seed: Semilla de partida (None = una al azar)
+        """
+        self.gameplay = random.Random()
+        self.cosmetic = random.Random()
+        self.particles = np.random.default_rng()
+        self.run_seed = None
+        self.seed(seed)
+
+    def seed(self, run_seed=None):
+        """
+        Siembra todos los generadores a partir de una semilla de partida.
+
+        Cada generador recibe una semilla distinta derivada de run_seed
+        (por ejemplo "1234:gameplay"), así sus secuencias no se parecen.
+
+        Args:
+            run_seed: Semilla de partida (int). None = elegir una al azar
+
+        Returns:
+            int: La semilla usada (guardarla permite repetir la partida)
+        """
+        if run_seed is None:
+            run_seed = random.SystemRandom().randrange(2 ** 32)
+
+        self.run_seed = run_seed
+        self.gameplay.seed(f"{run_seed}:gameplay")
+        self.cosmetic.seed(f"{run_seed}:cosmetic")
+        particle_seed = random.Random(f"{run_seed}:particles").getrandbits(64)
+        self.particles.bit_generator.state = np.random.PCG64(particle_seed).state
+        return run_seed
+
+
+# Instancia global (como particle_system o sprite_cache)
+random_streams = RandomStreams()
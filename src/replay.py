@@ -0,0 +1,289 @@
+"""
+replay.py - Grabación de partidas y repeticiones en formato binario compacto
+
+Como la partida solo depende de la semilla (ver random_streams.py) y de
+los controles de cada tick (ver InputSnapshot), para guardar una partida
+entera basta con guardar:
+- La semilla de partida (run_seed)
+- Una máscara de bits por tick: flechas, ESPACIO y P (INPUT_BIT_*)
+
+Casi siempre el jugador mantiene las mismas teclas muchos ticks
+seguidos, así que los controles se guardan con run-length encoding
+(RLE): "máscara 2 durante 47 ticks, máscara 0 durante 12 ticks...".
+Los tramos se escriben como un byte de máscara + la longitud en varint
+y todo se comprime con zlib. Una hora de partida ocupa unos pocos KB.
+
+Formato de un archivo .rpl (little endian):
+    Cabecera: b"CHRP", versión (u8), ticks por segundo (u16),
+              semilla (u64), ticks (u32), puntuación final (u32)
+    Cuerpo:   zlib( [máscara (u8), longitud (varint)] * tramos )
+
+play_replay() vuelve a jugar una repetición sin pantalla y sin esperar
+al reloj: miles de ticks por segundo, para perfilar y para comprobar
+que un cambio no altera las partidas (misma puntuación final).
+
+Conceptos de programación cubiertos:
+- Formatos binarios con struct
+- Run-length encoding y enteros de longitud variable (varint)
+- Partidas deterministas: semilla + entradas = partida
+
+Referencias útiles:
+- struct: https://docs.python.org/3/library/struct.html
+- Varint (LEB128): https://en.wikipedia.org/wiki/LEB128
+"""
+
+import os
+import struct
+import time
+import zlib
+from settings import *
+from simulation import GameSimulation, InputSnapshot
+
+REPLAY_MAGIC = b"CHRP"
+REPLAY_VERSION = 1
+REPLAY_EXTENSION = ".rpl"
+
+# Magia, versión, ticks por segundo, semilla, ticks, puntuación final
+_HEADER = struct.Struct("<4sBHQII")
+
+# Bits que entran en la simulación (la pausa solo se guarda como dato)
+_CONTROL_BITS = INPUT_BIT_LEFT | INPUT_BIT_RIGHT | INPUT_BIT_UP | INPUT_BIT_DOWN | INPUT_BIT_THROW
+
+
+def _write_varint(out, value):
+    """Añade un entero sin signo en varint (7 bits por byte) a un bytearray."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    """Lee un varint de data a partir de pos. Devuelve (valor, nueva posición)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """
+    Una partida grabada: semilla + controles de cada tick en tramos RLE.
+
+    Uso:
+        replay = Replay(seed)
+        replay.append(inputs.get_bits())   # Una vez por tick
+        replay.save("replays/partida.rpl")
+        replay = Replay.load("replays/partida.rpl")
+
+    Atributos:
+    - seed: Semilla de partida
+    - runs: Lista de tramos [máscara, ticks]
+    - score: Puntuación final al grabarla (para comprobar la repetición)
+    - tick_rate: Ticks por segundo con los que se grabó
+    """
+
+    def __init__(self, seed, runs=None, score=0, tick_rate=TICK_RATE):
+        """
+        Constructor de la repetición.
+
+        Args:
+            seed: Semilla de partida (entero de 0 a 2**64 - 1)
+            runs: Tramos [máscara, ticks] ya grabados (opcional)
+            score: Puntuación final
+            tick_rate: Ticks por segundo
+        """
+        self.seed = seed
+        self.runs = runs if runs is not None else []
+        self.score = score
+        self.tick_rate = tick_rate
+
+    def append(self, mask):
+        """Añade un tick con esa máscara (alarga el último tramo si es igual)."""
+        runs = self.runs
+        if runs and runs[-1][0] == mask:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+
+    def iter_masks(self):
+        """Recorre las máscaras de todos los ticks en orden."""
+        for mask, length in self.runs:
+            for _ in range(length):
+                yield mask
+
+    def iter_inputs(self):
+        """
+        Recorre los controles de cada tick como InputSnapshot.
+
+        Dentro de un tramo se devuelve siempre el mismo objeto (la
+        simulación no lo modifica), así no se crea uno por tick.
+        """
+        for mask, length in self.runs:
+            inputs = InputSnapshot.from_bits(mask & _CONTROL_BITS)
+            for _ in range(length):
+                yield inputs
+
+    def get_pause_count(self):
+        """Número de veces que se pausó la partida."""
+        return sum(1 for mask, _ in self.runs if mask & INPUT_BIT_PAUSE)
+
+    def to_bytes(self):
+        """
+        Codifica la repetición en el formato binario .rpl.
+
+        Returns:
+            bytes: Cabecera + tramos comprimidos
+        """
+        body = bytearray()
+        for mask, length in self.runs:
+            body.append(mask)
+            _write_varint(body, length)
+
+        header = _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.tick_rate,
+                              self.seed, len(self), self.score)
+        return header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decodifica una repetición en formato .rpl.
+
+        Args:
+            data: Contenido del archivo
+
+        Returns:
+            Replay: La repetición
+
+        Raises:
+            ValueError: Si no es una repetición válida o es de otra versión
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Repetición demasiado corta")
+
+        magic, version, tick_rate, seed, ticks, score = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("No es un archivo de repetición")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Versión de repetición no soportada: {version}")
+
+        body = zlib.decompress(data[_HEADER.size:])
+        runs = []
+        pos = 0
+        while pos < len(body):
+            mask = body[pos]
+            length, pos = _read_varint(body, pos + 1)
+            runs.append([mask, length])
+
+        replay = cls(seed, runs, score, tick_rate)
+        if len(replay) != ticks:
+            raise ValueError(f"Repetición dañada: {len(replay)} ticks de {ticks}")
+        return replay
+
+    def save(self, path):
+        """Guarda la repetición en un archivo (crea la carpeta si hace falta)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Carga una repetición desde un archivo .rpl."""
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+    def __len__(self):
+        """Número de ticks grabados."""
+        return sum(length for _, length in self.runs)
+
+
+class ReplayRecorder:
+    """
+    Graba los controles de la partida en curso.
+
+    Uso (lo hace JuliasRunGame en main.py):
+        recorder.start(simulation.run_seed)   # Al empezar la partida
+        recorder.record(inputs)               # En cada tick de juego
+        recorder.mark_pause()                 # Al pulsar P
+        recorder.mark_tainted()               # Al usar un cheat (F3)
+        if not recorder.tainted:
+            recorder.save(score)              # Al acabar
+
+    Atributos:
+    - replay: Repetición que se está grabando (None antes de start())
+    - tainted: Si la partida se cambió por fuera de los controles (un
+      cheat): su repetición ya no se puede reproducir y no se guarda
+    """
+
+    def __init__(self):
+        """Constructor del grabador."""
+        self.replay = None
+        self.tainted = False
+        self._pause_pending = False
+
+    def start(self, seed):
+        """Empieza a grabar una partida nueva con esa semilla."""
+        self.replay = Replay(seed)
+        self.tainted = False
+        self._pause_pending = False
+
+    def record(self, inputs):
+        """Graba los controles de un tick (InputSnapshot)."""
+        mask = inputs.get_bits()
+        if self._pause_pending:
+            mask |= INPUT_BIT_PAUSE
+            self._pause_pending = False
+        self.replay.append(mask)
+
+    def mark_pause(self):
+        """Apunta que se pausó la partida (se guarda en el siguiente tick)."""
+        self._pause_pending = True
+
+    def mark_tainted(self):
+        """Apunta que la partida cambió sin pasar por los controles (no se podrá reproducir)."""
+        self.tainted = True
+
+    def save(self, score, directory=REPLAY_DIR):
+        """
+        Guarda la repetición grabada.
+
+        Args:
+            score: Puntuación final de la partida
+            directory: Carpeta donde guardarla
+
+        Returns:
+            str: Ruta del archivo creado
+        """
+        self.replay.score = score
+        name = f"replay_{time.strftime('%Y%m%d_%H%M%S')}_{self.replay.seed}{REPLAY_EXTENSION}"
+        path = os.path.join(directory, name)
+        self.replay.save(path)
+        return path
+
+
+def play_replay(replay, threat_backend=THREAT_BACKEND):
+    """
+    Vuelve a jugar una repetición sin pantalla y sin límite de velocidad.
+
+    Args:
+        replay: Repetición a jugar
+        threat_backend: "objects" o "soa" (ver GameSimulation)
+
+    Returns:
+        GameSimulation: La simulación al acabar (player.score debería
+        coincidir con replay.score)
+    """
+    simulation = GameSimulation(threat_backend, seed=replay.seed)
+    step = simulation.step
+    for inputs in replay.iter_inputs():
+        if simulation.game_over:
+            break
+        step(inputs)
+    return simulation
@@ -35,7 +35,14 @@ import pygame
 # 🔍 Mejora sugerida: Estos valores podrían leerse de un archivo de configuración
 WINDOW_WIDTH = 850      # Ancho de la ventana en píxeles
 WINDOW_HEIGHT = 650     # Alto de la ventana en píxeles  
-FPS = 60               # Cuadros por segundo - ¡Prueba cambiar a 30 o 120!
+FPS = 60               # Cuadros por segundo que se dibujan - ¡Prueba cambiar a 30 o 120!
+
+# ✅ IMPLEMENTADO: Paso de tiempo fijo (ver timestep.py). La lógica avanza
+# TICK_RATE ticks por segundo aunque se dibuje a otra velocidad (FPS).
+# Todas las duraciones y velocidades de abajo que dicen "frames" son ticks.
+TICK_RATE = 60               # Ticks de lógica por segundo
+MAX_TICKS_PER_FRAME = 5      # Máximo de ticks por frame al ponerse al día
+INTERPOLATION_MAX_STEP = 48  # Saltos mayores (en píxeles) no se interpolan al dibujar
 
 # === COLORES (formato RGB) ===
 # 📚 Los colores se definen como tuplas de 3 valores (Red, Green, Blue)
@@ -101,6 +108,8 @@ POINTS_PER_POWERUP = 10           # Puntos por recoger power-up
 
 # === CONFIGURACIÓN DE ARCHIVOS ===
 SCORE_FILE = "best_score.json"    # Archivo donde se guarda el récord
+REPLAY_DIR = "replays"            # ✅ Carpeta de las repeticiones grabadas (ver replay.py)
+RECORD_REPLAYS = False            # ✅ True = guardar una repetición al acabar cada partida
 
 # === TECLAS DEL JUEGO ===
 # Estas constantes se usan para hacer el código más legible
@@ -124,6 +133,24 @@ STATE_INSTRUCTIONS = "instructions" # IMPLEMENTADO: Estado de instrucciones
 STATE_GAME_OVER = "game_over"
 STATE_PAUSED = "paused"  # ✅ IMPLEMENTADO: Estado de pausa
 
+# ✅ IMPLEMENTADO: Eventos que devuelve GameSimulation.step() (ver simulation.py)
+EVENT_KNIFE_THROWN = "knife_thrown"          # Se lanzó una espátula
+EVENT_SPAWN = "spawn"                        # Apareció una entidad nueva
+EVENT_DIFFICULTY_UP = "difficulty_up"        # Subió el nivel de dificultad
+EVENT_THREAT_AVOIDED = "threat_avoided"      # Obstáculo/enemigo esquivado
+EVENT_THREAT_DESTROYED = "threat_destroyed"  # Obstáculo/enemigo destruido
+EVENT_PLAYER_HIT = "player_hit"              # El jugador chocó con una amenaza
+EVENT_POWERUP_COLLECTED = "powerup_collected"
+EVENT_GAME_OVER = "game_over"
+
+# ✅ IMPLEMENTADO: Bits de los controles de cada tick en las repeticiones (ver replay.py)
+INPUT_BIT_LEFT = 1
+INPUT_BIT_RIGHT = 2
+INPUT_BIT_UP = 4
+INPUT_BIT_DOWN = 8
+INPUT_BIT_THROW = 16   # ESPACIO pulsado (lanzar espátula)
+INPUT_BIT_PAUSE = 32   # Se pausó (P) justo antes de este tick; no cambia la partida
+
 # === CONFIGURACIÓN DE FUENTES ===
 FONT_SIZE_LARGE = 48   # Tamaño de fuente para títulos
 FONT_SIZE_MEDIUM = 24  # Tamaño de fuente para texto normal
@@ -144,6 +171,38 @@ MAX_SPAWN_RATE_REDUCTION = 30      # Máxima reducción en frames de spawn
 # ✅ IMPLEMENTADO: Configuración de efectos visuales
 PARTICLE_COUNT = 15                # Número de partículas en explosión
 PARTICLE_LIFE = 30                 # Vida de partículas en frames
+PARTICLE_CAPACITY = 1024           # ✅ Partículas reservadas en el motor NumPy (crece si hace falta)
+
+# ✅ IMPLEMENTADO: Presupuesto de partículas (ver ParticleSystem en particles.py)
+PARTICLE_BUDGET = 800              # Máximo de partículas vivas a la vez
+PARTICLE_PRIORITY_IMPACT = 0       # Impactos y explosiones: lo más importante
+PARTICLE_PRIORITY_SPARKLE = 1      # Brillos de power-ups
+PARTICLE_PRIORITY_COSMETIC = 2     # Decoración: lo primero que se descarta
+PARTICLE_PRIORITY_SHARE = {        # Parte del presupuesto que puede llenar cada prioridad
+    PARTICLE_PRIORITY_IMPACT: 1.0,
+    PARTICLE_PRIORITY_SPARKLE: 0.75,
+    PARTICLE_PRIORITY_COSMETIC: 0.5,
+}
+PARTICLE_FRAME_BUDGET_MS = 1000 / FPS  # Si un frame tarda más, se reduce el detalle
+PARTICLE_MIN_LOD = 0.25            # Nivel de detalle mínimo (25% del presupuesto)
+
+# ✅ IMPLEMENTADO: Perfilador de fases del frame en el overlay de F1 (ver profiler.py)
+PROFILER_HISTORY = 120             # Frames para la media, el máximo y la gráfica
+PROFILER_GRAPH_MS = 2000 / FPS     # Milisegundos de la altura completa de la gráfica (2 frames)
+
+# ✅ IMPLEMENTADO: Tiempos de frame y percentiles (ver frame_times.py)
+FRAME_TIME_BUFFER = 600            # Últimos frames en el buffer circular (10 s a 60 FPS)
+FRAME_TIME_WORST = 20              # Peores frames que se guardan en el informe
+FRAME_TIME_FILE = "frame_times.json"  # Informe que se guarda con F5 y al acabar la partida
+
+# ✅ IMPLEMENTADO: Traza Chrome trace-event (F6, ver tracing.py)
+TRACE_CAPACITY = 500_000           # Máximo de eventos (unos 10 MB de buffer, reservado al activar)
+TRACE_FILE = "trace.json"          # Se guarda al salir; abrir en https://ui.perfetto.dev
+
+# ✅ IMPLEMENTADO: Memoria reservada por frame con tracemalloc (F7, ver allocations.py)
+ALLOC_SAMPLE_FRAMES = 30           # Frames entre dos fotos de la memoria (medio segundo a 60 FPS)
+ALLOC_TOP_SITES = 8                # Líneas de código que se muestran en el overlay
+ALLOC_SUMMARY_FILE = "allocations.json"  # Resumen que se guarda al acabar la partida
 SCREEN_SHAKE_INTENSITY = 5         # Intensidad del screen shake
 SCREEN_SHAKE_DURATION = 10         # Duración del screen shake en frames
 
@@ -151,6 +210,27 @@ SCREEN_SHAKE_DURATION = 10         # Duración del screen shake en frames
 SPRITE_ANIMATION_SPEED = 8         # Frames entre cambios de sprite
 POWERUP_PULSE_SPEED = 4           # Velocidad del efecto de pulso en power-ups
 
+# ✅ IMPLEMENTADO: Configuración de cachés gráficas
+ROTATION_CACHE_BUCKETS = 72        # Ángulos pre-rotados por sprite (72 = cada 5 grados)
+TEXT_CACHE_SIZE = 256              # Máximo de textos renderizados guardados (LRU)
+
+# ✅ IMPLEMENTADO: Renderizado por rectángulos sucios (activar/desactivar con F4)
+DIRTY_RECT_RENDERING = False       # Desactivado por defecto; se activa y desactiva con F4
+DIRTY_RECT_MAX = 128               # A partir de aquí se hace un flip completo
+
+# ✅ IMPLEMENTADO: Rejilla espacial para colisiones (ver spatial.py)
+SPATIAL_CELL_SIZE = 128            # Lado de cada celda en píxeles
+SPATIAL_MIN_ITEMS = 128             # Con menos entidades se comprueban todas una a una
+
+# ✅ IMPLEMENTADO: Cómo se mueven las amenazas (ver simulation.py y threat_store.py)
+# "objects": un objeto por amenaza (lo más rápido con pocas)
+# "soa": arrays de NumPy para todas a la vez (para hordas de cientos)
+THREAT_BACKEND = "objects"
+
+# ✅ IMPLEMENTADO: Semilla de partida (ver random_streams.py)
+# None = una distinta en cada partida; un número = repetir siempre la misma
+RUN_SEED = None
+
 # TODO 4: Añadir rutas de assets cuando estén disponibles
 # SPRITE_JULIA = "assets/sprites/julia.png"
 SPRITE_CHIPI_BUENO = "assets/sprites/chipi_bueno.png"
@@ -171,6 +251,15 @@ SOUND_POWERUP = "assets/sounds/power-up-sparkle.wav"
 SOUND_BACKGROUND = "assets/sounds/grabacion_estandar.wav"
 SOUND_GAMEOVER = "assets/sounds/game-over.wav"
 
+# ✅ IMPLEMENTADO: Configuración del banco de sonidos (ver audio.py)
+SOUNDBANK_CHANNELS = 8             # Canales del mixer reservados para efectos
+SOUNDBANK_DEFAULT_VOICES = 2       # Máximo de copias simultáneas de un mismo sonido
+SOUNDBANK_MAX_VOICES = {           # Límites específicos por sonido
+    SOUND_THROW: 3,                # Ráfagas de espátulas: como mucho 3 a la vez
+    SOUND_HIT: 2,
+    SOUND_POWERUP: 2,
+}
+
 # === NOTAS EDUCATIVAS ===
 """
 ¿Por qué usar constantes?
@@ -0,0 +1,556 @@
+"""
+simulation.py - Núcleo de simulación de Chipi's Run (sin pantalla ni audio)
+
+Este archivo contiene TODA la lógica de juego: movimiento, spawn de
+entidades, colisiones, puntuación, combos, power-ups y dificultad.
+No dibuja nada ni reproduce sonidos: cada frame recibe el estado de los
+controles y devuelve una lista de eventos con lo que ha pasado.
+
+JuliasRunGame (main.py) se limita a:
+1. Leer el teclado y construir un InputSnapshot
+2. Llamar a simulation.step(inputs)
+3. Reaccionar a los eventos (explosiones, sonidos, screen shake...)
+4. Dibujar el estado de la simulación
+
+Gracias a esta separación se pueden ejecutar miles de pasos por segundo
+en un servidor sin pantalla ni tarjeta de sonido (tests, bots, benchmarks).
+
+Conceptos de programación cubiertos:
+- Separación entre lógica y presentación
+- Eventos como forma de comunicar "qué ha pasado"
+- Simulación determinista paso a paso
+
+Referencias útiles:
+- Game Programming Patterns (Game Loop): https://gameprogrammingpatterns.com/game-loop.html
+"""
+
+from settings import *
+from entities import Player, Obstacle, Knife, PowerUp, Enemy
+from abilities import CooldownTimer, PowerUpEffect, ComboSystem
+from spatial import SpatialHash
+from threat_store import ThreatStore
+from containers import EntityList, ObjectPool
+from utils import get_difficulty_multiplier, get_random_powerup_type
+from random_streams import random_streams
+from profiler import frame_profiler
+from tracing import tracer
+
+
+class InputSnapshot:
+    """
+    Estado de los controles del jugador en un frame concreto.
+
+    Se puede indexar igual que pygame.key.get_pressed() con las teclas
+    de movimiento (KEY_LEFT, KEY_RIGHT...), así Player.move() funciona
+    tanto con el teclado real como con entradas generadas por código.
+
+    Atributos:
+    - left, right, up, down: Flechas pulsadas
+    - throw: True si en este frame se pulsó ESPACIO (lanzar espátula)
+    """
+
+    def __init__(self, left=False, right=False, up=False, down=False, throw=False):
+        """Constructor del estado de los controles."""
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.throw = throw
+
+    @classmethod
+    def from_keys(cls, keys_pressed, throw=False):
+        """
+        Crea un InputSnapshot a partir del estado del teclado.
+
+        Args:
+            keys_pressed: Resultado de pygame.key.get_pressed()
+            throw: Si se pulsó la tecla de lanzar en este frame
+
+        Returns:
+            InputSnapshot: Controles del frame
+        """
+        return cls(
+            left=bool(keys_pressed[KEY_LEFT]),
+            right=bool(keys_pressed[KEY_RIGHT]),
+            up=bool(keys_pressed[KEY_UP]),
+            down=bool(keys_pressed[KEY_DOWN]),
+            throw=throw,
+        )
+
+    @classmethod
+    def from_bits(cls, mask):
+        """
+        Crea un InputSnapshot a partir de una máscara de bits (INPUT_BIT_*).
+
+        Args:
+            mask: Entero con los bits de los controles (ver get_bits())
+
+        Returns:
+            InputSnapshot: Controles del frame
+        """
+        return cls(
+            left=bool(mask & INPUT_BIT_LEFT),
+            right=bool(mask & INPUT_BIT_RIGHT),
+            up=bool(mask & INPUT_BIT_UP),
+            down=bool(mask & INPUT_BIT_DOWN),
+            throw=bool(mask & INPUT_BIT_THROW),
+        )
+
+    def get_bits(self):
+        """Controles como máscara de bits (INPUT_BIT_*), para grabar repeticiones."""
+        return ((INPUT_BIT_LEFT if self.left else 0)
+                | (INPUT_BIT_RIGHT if self.right else 0)
+                | (INPUT_BIT_UP if self.up else 0)
+                | (INPUT_BIT_DOWN if self.down else 0)
+                | (INPUT_BIT_THROW if self.throw else 0))
+
+    def __getitem__(self, key):
+        """Permite usar el snapshot como pygame.key.get_pressed()."""
+        if key == KEY_LEFT:
+            return self.left
+        if key == KEY_RIGHT:
+            return self.right
+        if key == KEY_UP:
+            return self.up
+        if key == KEY_DOWN:
+            return self.down
+        return False
+
+
+class GameSimulation:
+    """
+    Simulación completa de una partida, sin pantalla ni audio.
+
+    Es dueña de todas las entidades (jugador, obstáculos, enemigos,
+    espátulas, power-ups) y de los sistemas de juego (cooldown, efectos
+    de power-ups, combos y dificultad).
+
+    Uso típico:
+        simulation = GameSimulation()
+        while not simulation.game_over:
+            events = simulation.step(InputSnapshot(right=True))
+
+    Cada evento es un diccionario con al menos la clave 'type'
+    (una de las constantes EVENT_* de settings.py) y datos extra
+    según el tipo (posición 'x'/'y', 'points', 'kind'...).
+
+    Las amenazas (obstáculos y enemigos) pueden moverse de dos formas:
+    - "objects": cada objeto con su update() y colisiones con la rejilla
+    - "soa": todas a la vez con arrays de NumPy (ver threat_store.py).
+      Útil con cientos de amenazas; con pocas, "objects" es más rápido
+    Las dos dan exactamente la misma partida.
+
+    Toda la aleatoriedad sale de random_streams, sembrado en reset() con
+    la semilla de partida (run_seed): con la misma semilla y los mismos
+    controles, la partida se repite igual.
+    """
+
+    def __init__(self, threat_backend=THREAT_BACKEND, seed=RUN_SEED):
+        """
+        Constructor de la simulación. Empieza una partida nueva.
+
+        Args:
+            threat_backend: "objects" o "soa" (cómo se mueven las amenazas)
+            seed: Semilla de todas las partidas (None = una al azar en cada reset)
+        """
+
+        # ✅ IMPLEMENTADO: Semilla fija para repetir partidas (ver random_streams.py)
+        self.seed = seed
+
+        # ✅ IMPLEMENTADO: Pools de entidades (ver ObjectPool en containers.py).
+        # Duran toda la sesión: las entidades se reutilizan entre partidas
+        self.obstacle_pool = ObjectPool(Obstacle, "Obstáculos")
+        self.enemy_pool = ObjectPool(Enemy, "Enemigos")
+        self.knife_pool = ObjectPool(Knife, "Espátulas")
+        self.powerup_pool = ObjectPool(PowerUp, "Power-ups")
+
+        # Listas de entidades del juego (✅ EntityList: borrado sin copias, ver containers.py).
+        # Lo que sale de cada lista vuelve solo a su pool
+        self.obstacles = EntityList(pool=self.obstacle_pool)   # Lista de obstáculos en pantalla
+        self.knives = EntityList(pool=self.knife_pool)         # Lista de cuchillos lanzados
+        self.powerups = EntityList(pool=self.powerup_pool)     # Lista de power-ups en pantalla
+        self.enemies = EntityList(pool=self.enemy_pool)        # Lista de enemigos
+
+        # ✅ IMPLEMENTADO: Almacén SoA opcional para las amenazas (None = objetos)
+        if threat_backend not in ("objects", "soa"):
+            raise ValueError(f"Backend de amenazas desconocido: {threat_backend}")
+        self.threat_store = ThreatStore() if threat_backend == "soa" else None
+
+        self.reset()
+
+    def get_pools(self):
+        """Devuelve los pools de entidades (para las estadísticas del modo debug)."""
+        return [self.obstacle_pool, self.enemy_pool, self.knife_pool, self.powerup_pool]
+
+    def reset(self, seed=None):
+        """
+        Reinicia la simulación al estado inicial de una partida.
+
+        Es importante resetear TODOS los componentes para evitar bugs.
+
+        Args:
+            seed: Semilla de esta partida (None = la del constructor, o una al azar)
+        """
+
+        # ✅ IMPLEMENTADO: Sembrar los generadores aleatorios de la partida.
+        # Misma semilla + mismos controles = misma partida
+        self.run_seed = random_streams.seed(self.seed if seed is None else seed)
+
+        # Crear jugador
+        self.player = Player()
+
+        # ✅ IMPLEMENTADO: Vaciar las listas devuelve las entidades a sus pools
+        self.obstacles.clear()
+        self.knives.clear()
+        self.powerups.clear()
+        self.enemies.clear()
+        if self.threat_store is not None:
+            self.threat_store.clear()
+
+        # Sistemas de juego
+        self.knife_cooldown = CooldownTimer(SCRAPER_COOLDOWN)
+        self.powerup_effects = PowerUpEffect()
+        self.combo_system = ComboSystem()
+
+        # ✅ IMPLEMENTADO: Rejillas espaciales para las colisiones (ver spatial.py)
+        self.threat_grid = SpatialHash()
+        self.powerup_grid = SpatialHash()
+
+        # Contadores
+        self.frame_count = 0
+        self.enemy_spawn_timer = 0
+
+        # Dificultad progresiva
+        self.current_difficulty = 1.0
+        self.last_difficulty_score = 0
+
+        self.game_over = False
+        self._events = []
+
+    def get_elapsed_time(self):
+        """Tiempo de partida simulado en segundos (ticks / TICK_RATE)."""
+        return self.frame_count / TICK_RATE
+
+    def _emit(self, event_type, **data):
+        """Añade un evento a la lista del frame actual."""
+        data['type'] = event_type
+        self._events.append(data)
+        tracer.instant(event_type, data.get('kind'))  # ✅ Spawns, colisiones, puntos... en la traza (F6)
+
+    def step(self, inputs):
+        """
+        Avanza la simulación un frame.
+
+        Args:
+            inputs: InputSnapshot con los controles de este frame
+
+        Returns:
+            list: Eventos (diccionarios) ocurridos durante el frame
+        """
+        self._events = []
+        if self.game_over:
+            return self._events
+
+        # Lanzar espátula si se pidió y no hay cooldown
+        if inputs.throw and self.knife_cooldown.is_ready():
+            new_knife = self.knife_pool.acquire(self.player.rect)
+            self.knives.append(new_knife)
+            self.knife_cooldown.start_cooldown()
+            self._emit(EVENT_KNIFE_THROWN, x=new_knife.rect.centerx, y=new_knife.rect.centery)
+
+        # Incrementar contador de frames
+        self.frame_count += 1
+
+        # Calcular dificultad progresiva
+        self.current_difficulty = get_difficulty_multiplier(self.player.score)
+        if self.player.score // DIFFICULTY_INCREASE_INTERVAL > self.last_difficulty_score // DIFFICULTY_INCREASE_INTERVAL:
+            self.last_difficulty_score = self.player.score
+            self._emit(EVENT_DIFFICULTY_UP, difficulty=self.current_difficulty)
+
+        self.spawn_entities()
+        frame_profiler.lap("Spawn")
+
+        # Actualizar lógica del juego
+        if not self.update_entities(inputs):
+            self.game_over = True
+            self._emit(EVENT_GAME_OVER, score=self.player.score)
+
+        return self._events
+
+    def spawn_entities(self):
+        """Crea obstáculos, enemigos y power-ups según la dificultad actual."""
+
+        # Spawn de nuevos obstáculos (con dificultad ajustada)
+        adjusted_spawn_rate = max(30, OBSTACLE_SPAWN_RATE - int(self.current_difficulty * 10))
+        if self.frame_count % adjusted_spawn_rate == 0:
+            self.add_obstacle(self.obstacle_pool.acquire(self.current_difficulty))
+            self._emit(EVENT_SPAWN, kind='obstacle')
+
+        # Spawn de enemigos ocasional
+        self.enemy_spawn_timer += 1
+        enemy_spawn_rate = max(300, 600 - int(self.current_difficulty * 50))
+        if self.enemy_spawn_timer >= enemy_spawn_rate:
+            if len(self.enemies) < 2:  # Máximo 2 enemigos a la vez
+                self.add_enemy(self.enemy_pool.acquire(self.player.rect.centerx, self.current_difficulty))
+                self._emit(EVENT_SPAWN, kind='enemy')
+            self.enemy_spawn_timer = 0
+
+        # Spawn de power-ups (menos frecuente con dificultad)
+        adjusted_powerup_rate = max(200, POWERUP_SPAWN_RATE + int(self.current_difficulty * 20))
+        if self.frame_count % adjusted_powerup_rate == 0:
+            self.powerups.append(self.powerup_pool.acquire(get_random_powerup_type()))
+            self._emit(EVENT_SPAWN, kind='powerup')
+
+    def add_obstacle(self, obstacle):
+        """Añade un obstáculo a la partida (y al almacén SoA si está activo)."""
+        self.obstacles.append(obstacle)
+        if self.threat_store is not None:
+            self.threat_store.add(obstacle)
+
+    def add_enemy(self, enemy):
+        """Añade un enemigo a la partida (y al almacén SoA si está activo)."""
+        self.enemies.append(enemy)
+        if self.threat_store is not None:
+            self.threat_store.add(enemy)
+
+    def sync_views(self):
+        """
+        Prepara los objetos de las amenazas para dibujarlos.
+
+        Con el backend "soa" la posición, la rotación y el pulso viven en
+        los arrays: se copian a los objetos antes de dibujar. Con "objects"
+        no hace nada.
+        """
+        if self.threat_store is not None:
+            self.threat_store.sync_views(self.player.rect.centerx)
+
+    def update_entities(self, inputs):
+        """
+        Mueve las entidades y resuelve colisiones y puntuación.
+
+        Args:
+            inputs: InputSnapshot con los controles de este frame
+
+        Returns:
+            bool: True si el jugador sigue vivo, False si Game Over
+        """
+
+        # Actualizar timers y sistemas
+        self.knife_cooldown.update()
+        self.powerup_effects.update(self.player)
+        self.combo_system.update()
+
+        # Mover jugador según los controles
+        self.player.move(inputs)
+
+        # ✅ IMPLEMENTADO: Amenazas con objetos o con arrays (ver threat_store.py)
+        if self.threat_store is None:
+            self._move_threats()
+        else:
+            self._move_threats_soa()
+
+        # Actualizar cuchillos y power-ups (se quedan los que siguen en pantalla)
+        self.knives.retain(Knife.update)
+        self.powerups.retain(PowerUp.update)
+        frame_profiler.lap("Movimiento")
+
+        if self.threat_store is None:
+            alive = self._collide_threats()
+        else:
+            alive = self._collide_threats_soa()
+        if not alive:
+            frame_profiler.lap("Colisiones")
+            return False  # Game Over
+
+        # Detectar colisiones jugador-power-ups
+        powerup_grid = self.powerup_grid
+        powerup_grid.clear()
+        powerup_grid.insert_all(self.powerups)
+
+        for powerup in powerup_grid.query(self.player.rect):
+            self.powerups.discard(powerup)
+
+            # Puntos con sistema de combos
+            points = self.combo_system.get_combo_bonus_points(POINTS_PER_POWERUP)
+            self.player.score += points
+
+            # Activar efecto según el tipo
+            if powerup.type == 'vodka':
+                self.powerup_effects.activate_cocacola_boost(self.player)
+            elif powerup.type == 'tea':
+                self.powerup_effects.activate_cachopo_shield(self.player)
+
+            self._emit(EVENT_POWERUP_COLLECTED, kind=powerup.type, points=points,
+                       x=powerup.rect.centerx, y=powerup.rect.centery,
+                       color=powerup.color)
+        self.powerups.compact()
+        frame_profiler.lap("Colisiones")
+
+        return True  # Jugador sigue vivo
+
+    def _threat_avoided(self, kind):
+        """Da los puntos por esquivar una amenaza que salió de la pantalla."""
+        base_points = POINTS_PER_OBSTACLE_AVOIDED * (2 if kind == 'enemy' else 1)
+        points = self.combo_system.get_combo_bonus_points(base_points)
+        self.player.score += points
+        self._emit(EVENT_THREAT_AVOIDED, kind=kind, points=points)
+
+    def _player_hit(self, x, y):
+        """
+        El jugador choca con una amenaza (que ya se ha quitado).
+
+        Returns:
+            bool: True si el jugador sigue vivo, False si Game Over
+        """
+        if not self.player.take_damage():
+            return False
+
+        # Resetear combo al recibir daño
+        self.combo_system.add_miss()
+
+        self._emit(EVENT_PLAYER_HIT, x=x, y=y)
+        return True
+
+    def _threat_destroyed(self, kind, x, y):
+        """Da los puntos (con combo) por destruir una amenaza con una espátula."""
+        if kind == 'enemy':
+            # Los enemigos dan más puntos
+            points = self.combo_system.get_combo_bonus_points(POINTS_PER_OBSTACLE_DESTROYED * 3)
+        else:
+            points = self.combo_system.get_combo_bonus_points(POINTS_PER_OBSTACLE_DESTROYED)
+
+        # Puntos con sistema de combos
+        self.player.score += points
+        self.combo_system.add_hit()
+
+        self._emit(EVENT_THREAT_DESTROYED, kind=kind, points=points, x=x, y=y,
+                   combo=self.combo_system.combo_count)
+
+    def _move_threats(self):
+        """Backend "objects": mueve cada amenaza con su propio update()."""
+
+        # ✅ IMPLEMENTADO: Las entidades que terminan se marcan con discard()
+        # y se eliminan todas juntas con compact(), sin copiar las listas
+
+        # Actualizar obstáculos normales
+        for obstacle in self.obstacles:
+            if not obstacle.update():
+                # Obstáculo salió de pantalla - dar puntos por esquivar
+                self.obstacles.discard(obstacle)
+                self._threat_avoided('obstacle')
+        self.obstacles.compact()
+
+        # Actualizar enemigos (los enemigos dan más puntos por esquivar)
+        for enemy in self.enemies:
+            if not enemy.update(self.player.rect.centerx):
+                self.enemies.discard(enemy)
+                self._threat_avoided('enemy')
+        self.enemies.compact()
+
+    def _collide_threats(self):
+        """
+        Backend "objects": colisiones de las amenazas con el jugador y las espátulas.
+
+        Returns:
+            bool: True si el jugador sigue vivo, False si Game Over
+        """
+
+        # ✅ IMPLEMENTADO: Rejilla con las amenazas de este frame. Obstáculos
+        # antes que enemigos, igual que el orden en que se comprobaban antes
+        threat_grid = self.threat_grid
+        threat_grid.clear()
+        threat_grid.insert_all(self.obstacles)
+        threat_grid.insert_all(self.enemies)
+
+        # Detección de colisiones jugador-obstáculos (con invulnerabilidad)
+        for threat in threat_grid.query(self.player.rect):
+            # Remover la amenaza
+            self._threat_list(threat).discard(threat)
+
+            # Efectos al recibir daño
+            if not self._player_hit(threat.rect.centerx, threat.rect.centery):
+                self.obstacles.compact()
+                self.enemies.compact()
+                return False
+
+        # Detección de colisiones cuchillo-amenazas
+        for knife in self.knives:
+            for threat in threat_grid.query(knife.rect):
+                threats = self._threat_list(threat)
+                if threats.is_dead(threat):
+                    continue
+
+                # Destruir ambos y dar puntos
+                threats.discard(threat)
+                self.knives.discard(knife)
+                kind = 'enemy' if threats is self.enemies else 'obstacle'
+                self._threat_destroyed(kind, threat.rect.centerx, threat.rect.centery)
+                break
+
+        self.obstacles.compact()
+        self.enemies.compact()
+        self.knives.compact()
+        return True
+
+    def _kill_threat_soa(self, index):
+        """Backend "soa": quita una amenaza de los arrays y de su lista."""
+        store = self.threat_store
+        store.kill(index)
+        threat = store.views[index]
+        self._threat_list(threat).discard(threat)
+
+    def _move_threats_soa(self):
+        """Backend "soa": mueve todas las amenazas a la vez con NumPy."""
+        store = self.threat_store
+        gone_obstacles, gone_enemies = store.move(self.player.rect.centerx)
+
+        for index in gone_obstacles:
+            self._kill_threat_soa(index)
+            self._threat_avoided('obstacle')
+        for index in gone_enemies:
+            self._kill_threat_soa(index)
+            self._threat_avoided('enemy')
+
+    def _collide_threats_soa(self):
+        """
+        Backend "soa": colisiones AABB vectorizadas con el jugador y las espátulas.
+
+        Resuelve los choques en el mismo orden que _collide_threats().
+
+        Returns:
+            bool: True si el jugador sigue vivo, False si Game Over
+        """
+        store = self.threat_store
+        alive = True
+
+        # Detección de colisiones jugador-amenazas (con invulnerabilidad)
+        for index in store.overlapping(self.player.rect):
+            self._kill_threat_soa(index)
+            if not self._player_hit(*store.center(index)):
+                alive = False
+                break
+
+        # Detección de colisiones espátula-amenazas: todas las espátulas a la
+        # vez; cada una destruye la primera amenaza que toca y se rompe
+        if alive:
+            knives = self.knives
+            all_hits = store.overlapping_many([knife.rect for knife in knives])
+            for knife, hits in zip(knives, all_hits):
+                for index in hits:
+                    if not store.alive[index]:
+                        continue
+                    kind = 'enemy' if store.is_enemy(index) else 'obstacle'
+                    self._kill_threat_soa(index)
+                    self.knives.discard(knife)
+                    self._threat_destroyed(kind, *store.center(index))
+                    break
+
+        store.compact()
+        self.obstacles.compact()
+        self.enemies.compact()
+        self.knives.compact()
+        return alive
+
+    def _threat_list(self, threat):
+        """Devuelve la lista (obstáculos o enemigos) a la que pertenece una amenaza."""
+        return self.enemies if isinstance(threat, Enemy) else self.obstacles
@@ -0,0 +1,146 @@
+"""
+spatial.py - Rejilla espacial (spatial hash) para detectar colisiones
+
+Comprobar cada espátula contra cada obstáculo cuesta O(espátulas × amenazas):
+con pocas entidades no importa, pero con cientos o miles se nota mucho.
+
+Una rejilla espacial divide la pantalla en celdas cuadradas. Cada entidad
+se apunta en las celdas que toca, y para saber "qué choca con este rect"
+solo hay que mirar las entidades de las celdas que ese rect toca.
+
+Conceptos de programación cubiertos:
+- Estructuras de datos espaciales
+- Diccionarios con tuplas como clave
+- Complejidad algorítmica (O(n²) frente a O(n))
+
+Referencias útiles:
+- Spatial hashing: https://gameprogrammingpatterns.com/spatial-partition.html
+"""
+
+from settings import *
+
+
+class SpatialHash:
+    """
+    Rejilla uniforme que responde "¿qué entidades solapan este rect?".
+
+    Se reconstruye cada frame (clear + insert), porque casi todas las
+    entidades se mueven en cada frame. Las consultas devuelven las entidades
+    en el mismo orden en que se insertaron, así el resultado de las
+    colisiones es idéntico al de recorrer las listas una a una.
+
+    Atributos:
+    - cell_size: Lado de cada celda en píxeles
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE, min_items=SPATIAL_MIN_ITEMS):
+        """
+        Constructor de la rejilla.
+
+        Args:
+            cell_size: Lado de cada celda en píxeles
+            min_items: Con menos entidades que esto se recorre la lista
+                       directamente (montar las celdas costaría más)
+        """
+        self.cell_size = cell_size
+        self.min_items = min_items
+        self._cells = {}     # (columna, fila) -> lista de índices
+        self._items = []     # índice -> (entidad, rect)
+        self._indexed = False
+
+    def clear(self):
+        """Vacía la rejilla (llamar al principio de cada frame)."""
+        self._cells.clear()
+        self._items.clear()
+        self._indexed = False
+
+    def _cell_range(self, rect):
+        """Devuelve (col_min, col_max, fila_min, fila_max) de las celdas que toca un rect."""
+        size = self.cell_size
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def insert(self, item, rect):
+        """
+        Añade una entidad a la rejilla.
+
+        Las celdas no se calculan aquí sino en la primera consulta,
+        y solo si hay suficientes entidades para que compense.
+
+        Args:
+            item: Entidad (cualquier objeto)
+            rect: pygame.Rect que ocupa la entidad
+        """
+        self._items.append((item, rect))
+        self._indexed = False
+
+    def insert_all(self, items):
+        """Añade varias entidades usando su atributo .rect."""
+        for item in items:
+            self._items.append((item, item.rect))
+        self._indexed = False
+
+    def _build_cells(self):
+        """Apunta cada entidad en las celdas que toca."""
+        cells = self._cells
+        cells.clear()
+        cell_range = self._cell_range
+
+        for index, (item, rect) in enumerate(self._items):
+            col_min, col_max, row_min, row_max = cell_range(rect)
+
+            # Caso más común: la entidad cabe entera en una celda
+            if col_min == col_max and row_min == row_max:
+                cells.setdefault((col_min, row_min), []).append(index)
+                continue
+
+            for col in range(col_min, col_max + 1):
+                for row in range(row_min, row_max + 1):
+                    cells.setdefault((col, row), []).append(index)
+
+        self._indexed = True
+
+    def query(self, rect):
+        """
+        Busca las entidades cuyo rect solapa con el indicado.
+
+        Args:
+            rect: pygame.Rect a comprobar
+
+        Returns:
+            list: Entidades que solapan, en orden de inserción
+        """
+        items = self._items
+
+        # Pocas entidades: recorrer la lista es lo más rápido
+        if len(items) < self.min_items:
+            return [item for item, item_rect in items if rect.colliderect(item_rect)]
+
+        if not self._indexed:
+            self._build_cells()
+
+        col_min, col_max, row_min, row_max = self._cell_range(rect)
+        cells = self._cells
+
+        # Caso más común: el rect cae dentro de una sola celda
+        if col_min == col_max and row_min == row_max:
+            candidates = cells.get((col_min, row_min), ())
+        else:
+            found = set()
+            for col in range(col_min, col_max + 1):
+                for row in range(row_min, row_max + 1):
+                    bucket = cells.get((col, row))
+                    if bucket:
+                        found.update(bucket)
+            candidates = sorted(found)
+
+        hits = []
+        for index in candidates:
+            item, item_rect = items[index]
+            if rect.colliderect(item_rect):
+                hits.append(item)
+        return hits
+
+    def __len__(self):
+        """Número de entidades en la rejilla."""
+        return len(self._items)
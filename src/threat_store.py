@@ -0,0 +1,281 @@
+"""
+threat_store.py - Amenazas guardadas en arrays de NumPy (Structure of Arrays)
+
+Normalmente cada obstáculo y cada enemigo es un objeto de Python que se
+mueve con su propio update(), y las colisiones se comprueban con
+Rect.colliderect() dentro de bucles. Con unas pocas amenazas es lo más
+sencillo y rápido; con cientos (hordas, pruebas de estrés) el coste de
+recorrer tantos objetos en Python se nota.
+
+ThreatStore guarda los datos de TODAS las amenazas en arrays de NumPy
+(una "columna" por atributo): posición, tamaño, velocidad, tipo,
+rotación y pulso. Moverlas, quitar las que salen de la pantalla, hacer
+que los enemigos sigan al jugador y comprobar los solapes (AABB) con el
+jugador y con cada espátula son operaciones sobre arrays completos.
+
+Los objetos Obstacle/Enemy siguen existiendo como "vistas": guardan el
+sprite, el color, etc. y se usan para dibujar. sync_views() copia en
+ellos la posición, la rotación y el pulso justo antes de dibujar.
+
+Se activa con THREAT_BACKEND = "soa" en settings.py (ver GameSimulation).
+
+Conceptos de programación cubiertos:
+- Structure of Arrays (SoA) frente a Array of Structures (AoS)
+- Operaciones vectorizadas y máscaras booleanas con NumPy
+- Colisiones AABB (cajas alineadas con los ejes)
+
+Referencias útiles:
+- Data-Oriented Design: https://gameprogrammingpatterns.com/data-locality.html
+"""
+
+import numpy as np
+from settings import *
+
+# Código numérico de cada tipo de amenaza (columna 'kind')
+THREAT_KINDS = {'normal': 0, 'fast': 1, 'big': 2, 'enemy': 3}
+KIND_ENEMY = THREAT_KINDS['enemy']
+
+
+class ThreatStore:
+    """
+    Obstáculos y enemigos en arrays de NumPy, en orden de aparición.
+
+    Uso típico (lo hace GameSimulation):
+        store.add(obstacle)                         # Al hacer spawn
+        obstacles_out, enemies_out = store.move(player_x)
+        hits = store.overlapping(player.rect)       # Índices, obstáculos primero
+        store.kill(index)
+        store.compact()                             # Quitar las muertas
+        store.sync_views(player_x)                  # Antes de dibujar
+
+    Las amenazas vivas ocupan las primeras `count` posiciones de los
+    arrays; views[i] es el objeto Obstacle/Enemy de la posición i.
+
+    Atributos:
+    - count: Número de amenazas en los arrays (incluidas las marcadas como muertas)
+    - views: Objetos Obstacle/Enemy, en el mismo orden que los arrays
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Constructor del almacén.
+
+        Args:
+            capacity: Amenazas reservadas al principio (crece si hace falta)
+        """
+        self.count = 0
+        self.views = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Reserva (o amplía) los arrays conservando las amenazas actuales."""
+        n = self.count
+        old = getattr(self, 'x', None)
+
+        fields = {
+            'x': np.int64, 'y': np.int64, 'w': np.int64, 'h': np.int64,
+            'speed': np.int64, 'kind': np.int8,
+            'rotation': np.int64, 'pulse': np.int64, 'alive': np.bool_,
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+
+        self.capacity = capacity
+
+    def add(self, threat):
+        """
+        Añade un Obstacle o Enemy recién creado (copia sus datos a los arrays).
+
+        Args:
+            threat: Objeto Obstacle o Enemy, que pasa a ser la vista de esta amenaza
+        """
+        i = self.count
+        if i == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        rect = threat.rect
+        self.x[i] = rect.x
+        self.y[i] = rect.y
+        self.w[i] = rect.width
+        self.h[i] = rect.height
+        self.speed[i] = threat.speed
+        self.kind[i] = THREAT_KINDS[threat.obstacle_type]
+        self.rotation[i] = threat.rotation
+        self.pulse[i] = threat.pulse_timer
+        self.alive[i] = True
+
+        self.views.append(threat)
+        self.count = i + 1
+
+    def move(self, player_x):
+        """
+        Mueve todas las amenazas un frame y marca las que salen por abajo.
+
+        Hace lo mismo que Obstacle.update() y Enemy.update(): caer, seguir
+        al jugador (solo enemigos, 1 píxel por frame, sin salir de la
+        ventana), rotar y avanzar el pulso.
+
+        Args:
+            player_x: Centro X del jugador (objetivo de los enemigos)
+
+        Returns:
+            tuple: (índices de obstáculos, índices de enemigos) que han salido
+                   de la pantalla, en orden de aparición. Ya están marcados como muertos.
+        """
+        n = self.count
+        if n == 0:
+            return (), ()
+
+        x = self.x[:n]
+        w = self.w[:n]
+        enemy = self.kind[:n] == KIND_ENEMY
+
+        self.y[:n] += self.speed[:n]
+
+        # Enemigos: acercarse al jugador y no salir por los lados
+        if enemy.any():
+            step = np.sign(player_x - (x + w // 2))
+            moved = np.maximum(x + step, 0)
+            moved = np.minimum(moved, WINDOW_WIDTH - w)
+            x[enemy] = moved[enemy]
+
+        self.rotation[:n] += np.where(enemy, 3, 2)
+        self.pulse[:n] += 1
+
+        gone = self.alive[:n] & (self.y[:n] >= WINDOW_HEIGHT)
+        if not gone.any():
+            return (), ()
+
+        self.alive[:n] &= ~gone
+        return (np.flatnonzero(gone & ~enemy).tolist(),
+                np.flatnonzero(gone & enemy).tolist())
+
+    def overlapping(self, rect):
+        """
+        Busca las amenazas vivas que solapan con un rect (test AABB).
+
+        Args:
+            rect: pygame.Rect a comprobar
+
+        Returns:
+            list: Índices que solapan; primero los obstáculos y luego los
+                  enemigos, cada grupo en orden de aparición (el mismo
+                  orden que usa la rejilla espacial)
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        x = self.x[:n]
+        y = self.y[:n]
+        hit = (self.alive[:n]
+               & (x < rect.right) & (x + self.w[:n] > rect.left)
+               & (y < rect.bottom) & (y + self.h[:n] > rect.top))
+        if not hit.any():
+            return []
+
+        enemy = self.kind[:n] == KIND_ENEMY
+        return np.flatnonzero(hit & ~enemy).tolist() + np.flatnonzero(hit & enemy).tolist()
+
+    def overlapping_many(self, rects):
+        """
+        Como overlapping(), pero para muchos rects a la vez (las espátulas).
+
+        Calcula de una vez la matriz de solapes rects × amenazas en lugar
+        de llamar a overlapping() una vez por rect.
+
+        Args:
+            rects: Lista de pygame.Rect
+
+        Returns:
+            list: Para cada rect, la lista de índices que solapan (mismo
+                  orden que overlapping(): obstáculos primero)
+        """
+        n = self.count
+        results = [[] for _ in rects]
+        if n == 0 or not rects:
+            return results
+
+        # Columnas ordenadas: primero obstáculos, luego enemigos
+        enemy = self.kind[:n] == KIND_ENEMY
+        order = np.concatenate((np.flatnonzero(~enemy), np.flatnonzero(enemy)))
+        order = order[self.alive[order]]
+        if len(order) == 0:
+            return results
+
+        x = self.x[order]
+        y = self.y[order]
+        right = x + self.w[order]
+        bottom = y + self.h[order]
+
+        boxes = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.int64)
+        left, top, rect_right, rect_bottom = (boxes[:, i:i + 1] for i in range(4))
+        hit = (x < rect_right) & (right > left) & (y < rect_bottom) & (bottom > top)
+
+        for row in np.flatnonzero(hit.any(axis=1)).tolist():
+            results[row] = order[hit[row]].tolist()
+        return results
+
+    def is_enemy(self, index):
+        """Indica si la amenaza de esa posición es un enemigo."""
+        return self.kind[index] == KIND_ENEMY
+
+    def center(self, index):
+        """Centro (x, y) de una amenaza, igual que rect.center."""
+        return (int(self.x[index] + self.w[index] // 2),
+                int(self.y[index] + self.h[index] // 2))
+
+    def kill(self, index):
+        """Marca una amenaza como muerta (se quita en el próximo compact())."""
+        self.alive[index] = False
+
+    def compact(self):
+        """
+        Quita de los arrays (y de views) las amenazas muertas, conservando el orden.
+
+        Returns:
+            int: Número de amenazas eliminadas
+        """
+        n = self.count
+        alive = self.alive[:n].copy()  # Copia: el propio array 'alive' también se compacta
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count == n:
+            return 0
+
+        for name in ('x', 'y', 'w', 'h', 'speed', 'kind', 'rotation', 'pulse', 'alive'):
+            array = getattr(self, name)
+            array[:alive_count] = array[:n][alive]
+
+        self.views = [view for view, keep in zip(self.views, alive.tolist()) if keep]
+        self.count = alive_count
+        return n - alive_count
+
+    def sync_views(self, player_x):
+        """
+        Copia posición, rotación y pulso de los arrays a los objetos (para dibujar).
+
+        Args:
+            player_x: Centro X del jugador (el target_x de los enemigos)
+        """
+        n = self.count
+        for view, x, y, rotation, pulse, kind in zip(
+                self.views, self.x[:n].tolist(), self.y[:n].tolist(),
+                self.rotation[:n].tolist(), self.pulse[:n].tolist(), self.kind[:n].tolist()):
+            view.rect.x = x
+            view.rect.y = y
+            view.rotation = rotation
+            view.pulse_timer = pulse
+            if kind == KIND_ENEMY:
+                view.target_x = player_x
+
+    def clear(self):
+        """Vacía el almacén (las vistas las devuelve GameSimulation a sus pools)."""
+        self.count = 0
+        self.views = []
+
+    def __len__(self):
+        """Número de amenazas en los arrays."""
+        return self.count
@@ -0,0 +1,176 @@
+"""
+timestep.py - Paso de tiempo fijo (fixed timestep) e interpolación al dibujar
+
+Toda la lógica del juego cuenta en "ticks": un obstáculo cae `speed`
+píxeles por tick, el cooldown dura SCRAPER_COOLDOWN ticks, etc. Antes cada
+vuelta del game loop era exactamente un tick, así que si un frame tardaba
+más el juego iba a cámara lenta, y con una pantalla de 144 Hz iría más
+rápido.
+
+Con un paso de tiempo fijo la lógica avanza siempre TICK_RATE ticks por
+segundo de tiempo real, se dibuje a la velocidad que se dibuje:
+- FixedTimestep acumula el tiempo real de cada frame y dice cuántos
+  ticks tocan (con un máximo, para no quedarse atascado poniéndose al día)
+- RenderInterpolator dibuja cada entidad entre su posición del tick
+  anterior y la del actual, para que el movimiento se vea suave aunque
+  los frames y los ticks no coincidan
+
+Conceptos de programación cubiertos:
+- Game loop con acumulador ("Fix Your Timestep")
+- Interpolación lineal (lerp)
+- Separar el tiempo de la lógica del tiempo de dibujo
+
+Referencias útiles:
+- Fix Your Timestep!: https://gafferongames.com/post/fix_your_timestep/
+- Game Programming Patterns (Game Loop): https://gameprogrammingpatterns.com/game-loop.html
+"""
+
+from settings import *
+
+
+class FixedTimestep:
+    """
+    Acumulador de tiempo real que reparte ticks de lógica de duración fija.
+
+    Uso en el game loop:
+        ticks = timestep.advance(clock.tick(FPS) / 1000)
+        for _ in range(ticks):
+            update()
+        draw(timestep.get_alpha())
+
+    Atributos:
+    - tick_seconds: Duración de un tick en segundos (1 / tick_rate)
+    - max_ticks: Máximo de ticks por frame al ponerse al día
+    - accumulator: Tiempo real todavía sin convertir en ticks
+    - last_ticks: Ticks ejecutados en el último frame
+    - dropped_ticks: Ticks descartados en total por ir demasiado atrasado
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, max_ticks=MAX_TICKS_PER_FRAME):
+        """
+        Constructor del acumulador.
+
+        Args:
+            tick_rate: Ticks de lógica por segundo
+            max_ticks: Máximo de ticks por frame (evita la "espiral de la muerte":
+                       si ponerse al día cuesta más que el propio frame, el
+                       retraso crecería sin parar)
+        """
+        self.tick_seconds = 1.0 / tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.last_ticks = 0
+        self.dropped_ticks = 0
+
+    def advance(self, elapsed_seconds):
+        """
+        Suma el tiempo real de un frame y devuelve cuántos ticks ejecutar.
+
+        Args:
+            elapsed_seconds: Tiempo real desde el frame anterior
+
+        Returns:
+            int: Ticks de lógica a ejecutar en este frame (0..max_ticks)
+        """
+        self.accumulator += elapsed_seconds
+        ticks = int(self.accumulator / self.tick_seconds)
+
+        if ticks > self.max_ticks:
+            # Demasiado atrasado: ejecutar el máximo y olvidar el resto
+            self.dropped_ticks += ticks - self.max_ticks
+            ticks = self.max_ticks
+            self.accumulator = ticks * self.tick_seconds
+
+        self.accumulator -= ticks * self.tick_seconds
+        self.last_ticks = ticks
+        return ticks
+
+    def get_alpha(self):
+        """
+        Fracción del siguiente tick que ya ha pasado (0.0 a 1.0).
+
+        Se usa para dibujar las entidades entre el tick anterior y el actual.
+        """
+        return min(1.0, self.accumulator / self.tick_seconds)
+
+    def reset(self):
+        """Olvida el tiempo acumulado (por ejemplo tras una pausa larga)."""
+        self.accumulator = 0.0
+
+
+class RenderInterpolator:
+    """
+    Dibuja las entidades en una posición intermedia entre dos ticks.
+
+    Antes del último tick de cada frame se guarda la posición de cada
+    entidad (capture). Al dibujar, apply() mueve temporalmente cada rect
+    a la mezcla entre esa posición y la actual, y restore() lo devuelve a
+    su sitio para que la lógica no note nada.
+
+    Las entidades que no estaban en la captura (recién creadas) se
+    dibujan en su posición actual. Tampoco se interpolan los saltos de más
+    de INTERPOLATION_MAX_STEP píxeles: solo pasan cuando un pool ha
+    reutilizado el objeto para otra entidad, y no hay que dibujarla "viajando"
+    de la posición vieja a la nueva.
+    """
+
+    def __init__(self):
+        """Constructor del interpolador."""
+        self._previous = {}   # id(entidad) -> (entidad, x, y); guardar la entidad evita que se reutilice su id
+        self._moved = []      # (rect, x, y) originales a restaurar
+
+    def capture(self, entities):
+        """
+        Guarda la posición actual de las entidades (llamar antes de un tick).
+
+        Args:
+            entities: Entidades con atributo .rect
+        """
+        previous = self._previous
+        previous.clear()
+        for entity in entities:
+            rect = entity.rect
+            previous[id(entity)] = (entity, rect.x, rect.y)
+
+    def apply(self, entities, alpha):
+        """
+        Mueve los rects a su posición interpolada (llamar justo antes de dibujar).
+
+        Args:
+            entities: Entidades que se van a dibujar
+            alpha: Fracción entre el tick anterior (0.0) y el actual (1.0)
+        """
+        self._moved.clear()
+        if alpha >= 1.0:
+            return
+
+        previous = self._previous
+        moved = self._moved
+        for entity in entities:
+            entry = previous.get(id(entity))
+            if entry is None:
+                continue
+
+            rect = entity.rect
+            x, y = rect.x, rect.y
+            _, old_x, old_y = entry
+            if old_x == x and old_y == y:
+                continue
+            if abs(x - old_x) > INTERPOLATION_MAX_STEP or abs(y - old_y) > INTERPOLATION_MAX_STEP:
+                continue
+
+            moved.append((rect, x, y))
+            rect.x = round(old_x + (x - old_x) * alpha)
+            rect.y = round(old_y + (y - old_y) * alpha)
+
+    def restore(self):
+        """Devuelve cada rect a su posición real después de dibujar."""
+        for rect, x, y in self._moved:
+            rect.x = x
+            rect.y = y
+        self._moved.clear()
+
+    def clear(self):
+        """Olvida las posiciones guardadas (al reiniciar la partida)."""
+        self._previous.clear()
+        self._moved.clear()
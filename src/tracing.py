@@ -0,0 +1,177 @@
+"""
+tracing.py - Línea de tiempo en formato Chrome trace-event (F6)
+
+El perfilador de F1 (profiler.py) resume CUÁNTO tarda cada fase de
+media; una traza guarda CUÁNDO pasó cada cosa, frame a frame, para ver
+exactamente qué había alrededor de un tirón.
+
+Con la traza activa (F6) se apuntan:
+- Un tramo (span) por cada frame y por cada fase del game loop y de la
+  simulación: los mismos lap() del perfilador
+- Eventos instantáneos: spawns, colisiones y puntos (los eventos de
+  GameSimulation), sonidos y cambios de estado
+
+Todo va a un buffer de arrays de NumPy reservado de antemano (no se crea
+un objeto por evento). Al salir del juego se guarda en TRACE_FILE en
+formato Chrome trace-event JSON, que se abre en https://ui.perfetto.dev
+o en chrome://tracing.
+
+Desactivada, instant() es una función vacía (como lap() en profiler.py),
+así que las llamadas repartidas por el código no cuestan nada apreciable.
+
+Conceptos de programación cubiertos:
+- Trazas de eventos (tracing) frente a perfiles (profiling)
+- Buffers preasignados e "internado" de cadenas (una id por nombre)
+- Formatos de intercambio: Chrome trace-event JSON
+
+Referencias útiles:
+- Formato trace-event: https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+- Perfetto UI: https://ui.perfetto.dev
+"""
+
+import json
+import time
+import numpy as np
+from settings import *
+
+
+def _skip(*args):
+    """Sustituto de instant() con la traza desactivada."""
+
+
+class Tracer:
+    """
+    Graba tramos y eventos instantáneos y los exporta para un visor de trazas.
+
+    Uso:
+        tracer.toggle()                               # F6
+        tracer.span("Colisiones", start, end)         # Tiempos de time.perf_counter()
+        tracer.instant("spawn", "obstacle")           # Evento puntual
+        tracer.write()                                # Al salir
+
+    Atributos:
+    - enabled: Si está grabando
+    - count: Eventos en el buffer
+    - dropped: Eventos perdidos porque el buffer estaba lleno
+    """
+
+    def __init__(self, capacity=TRACE_CAPACITY):
+        """
+        Constructor de la traza.
+
+        Args:
+            capacity: Máximo de eventos (el buffer se reserva la primera vez que se activa)
+        """
+        self.enabled = False
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        self._start = None       # Inicio de cada evento (µs desde _origin)
+        self._duration = None    # Duración en µs (-1 = evento instantáneo)
+        self._name_id = None     # Índice en _names
+        self._names = []
+        self._ids = {}
+        self._origin = time.perf_counter()
+        self.instant = _skip
+
+    def set_enabled(self, enabled):
+        """Activa o pausa la grabación (lo grabado se conserva)."""
+        if enabled and self._start is None:
+            self._start = np.empty(self.capacity, dtype=np.float64)
+            self._duration = np.empty(self.capacity, dtype=np.float64)
+            self._name_id = np.empty(self.capacity, dtype=np.int32)
+        self.enabled = enabled
+        self.instant = self._instant if enabled else _skip
+
+    def toggle(self):
+        """Cambia entre grabar y no grabar. Devuelve el nuevo estado."""
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def _intern(self, name):
+        """Id numérica de un nombre (cada nombre distinto se guarda una vez)."""
+        name_id = self._ids.get(name)
+        if name_id is None:
+            name_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return name_id
+
+    def _add(self, name, start_us, duration_us):
+        """Guarda un evento en el buffer (o lo cuenta como perdido si está lleno)."""
+        i = self.count
+        if i == self.capacity:
+            self.dropped += 1
+            return
+        self._start[i] = start_us
+        self._duration[i] = duration_us
+        self._name_id[i] = self._intern(name)
+        self.count = i + 1
+
+    def span(self, name, start, end):
+        """
+        Apunta un tramo con principio y fin.
+
+        Args:
+            name: Nombre del tramo (fase)
+            start, end: Instantes de time.perf_counter() en segundos
+        """
+        if self.enabled:
+            self._add(name, (start - self._origin) * 1e6, (end - start) * 1e6)
+
+    def _instant(self, name, detail=None):
+        """Apunta un evento instantáneo ("nombre: detalle")."""
+        label = name if detail is None else f"{name}: {detail}"
+        self._add(label, (time.perf_counter() - self._origin) * 1e6, -1.0)
+
+    def get_events(self):
+        """
+        Eventos grabados en formato Chrome trace-event.
+
+        Returns:
+            list: Diccionarios "X" (tramo completo) e "i" (instantáneo)
+        """
+        names = self._names
+        events = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": 1,
+                   "args": {"name": "Game loop"}}]
+        if self.count == 0:
+            return events
+
+        n = self.count
+        for start, duration, name_id in zip(self._start[:n].tolist(), self._duration[:n].tolist(),
+                                            self._name_id[:n].tolist()):
+            if duration < 0:
+                events.append({"name": names[name_id], "ph": "i", "s": "t",
+                               "ts": start, "pid": 1, "tid": 1})
+            else:
+                events.append({"name": names[name_id], "ph": "X", "ts": start,
+                               "dur": duration, "pid": 1, "tid": 1})
+        return events
+
+    def write(self, path=TRACE_FILE):
+        """
+        Guarda la traza como JSON para un visor de trazas.
+
+        Returns:
+            int: Número de eventos guardados
+        """
+        trace = {
+            "traceEvents": self.get_events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped},
+        }
+        try:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(trace, file)
+        except OSError as e:
+            print(f"Error guardando la traza: {e}")
+            return 0
+        return self.count
+
+    def clear(self):
+        """Borra los eventos grabados."""
+        self.count = 0
+        self.dropped = 0
+
+
+# Instancia global (como frame_profiler)
+tracer = Tracer()
@@ -18,9 +18,9 @@ Referencias útiles:
 """
 
 import json
-import random
 import os
 from settings import *
+from random_streams import random_streams
 
 def load_best_score():
     """
@@ -144,7 +144,7 @@ def get_random_powerup_type():
         str: 'vodka' o 'tea'
     """
     
-    return random.choice(['vodka', 'tea'])
+    return random_streams.gameplay.choice(['vodka', 'tea'])
 
 
 def clamp(value, min_value, max_value):
@@ -258,9 +258,9 @@ def create_random_color():
         tuple: Color RGB aleatorio (r, g, b)
     """
     
-    r = random.randint(0, 255)
-    g = random.randint(0, 255)
-    b = random.randint(0, 255)
+    r = random_streams.cosmetic.randint(0, 255)
+    g = random_streams.cosmetic.randint(0, 255)
+    b = random_streams.cosmetic.randint(0, 255)
     return (r, g, b)
 
 
@@ -354,14 +354,9 @@ def play_sound(sound_file, volume=1.0):
         sound_file: Ruta del archivo de sonido
         volume: Volumen (0.0 a 1.0)
     """
-    try:
-        import pygame
-        if pygame.mixer.get_init():  # Verificar que el mixer esté inicializado
-            sound = pygame.mixer.Sound(sound_file)
-            sound.set_volume(volume)
-            sound.play()
-    except (pygame.error, FileNotFoundError) as e:
-        print(f"Error reproduciendo sonido {sound_file}: {e}")
+    # ✅ IMPLEMENTADO: Usa el banco de sonidos (sonido precargado, canal del pool)
+    from audio import sound_bank
+    sound_bank.play(sound_file, volume)
 
 # ✅ IMPLEMENTADO: Funciones para partículas y efectos visuales
 def create_particle_explosion(x, y, color, particle_count=10):
@@ -380,16 +375,16 @@ def create_particle_explosion(x, y, color, particle_count=10):
     
     for _ in range(particle_count):
         # Ángulo aleatorio en radianes
-        angle = random.uniform(0, 2 * 3.14159)
-        speed = random.uniform(2, 8)
+        angle = random_streams.cosmetic.uniform(0, 2 * 3.14159)
+        speed = random_streams.cosmetic.uniform(2, 8)
         
         particle = {
             'x': x,
             'y': y,
-            'vel_x': speed * (random.uniform(-1, 1)),
-            'vel_y': speed * (random.uniform(-1, 1)),
-            'size': random.randint(2, 5),
-            'life': random.randint(15, 30),
+            'vel_x': speed * (random_streams.cosmetic.uniform(-1, 1)),
+            'vel_y': speed * (random_streams.cosmetic.uniform(-1, 1)),
+            'size': random_streams.cosmetic.randint(2, 5),
+            'life': random_streams.cosmetic.randint(15, 30),
             'color': color
         }
         particles.append(particle)
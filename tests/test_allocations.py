@@ -0,0 +1,100 @@
+"""
+test_allocations.py - Tests del medidor de memoria reservada por frame (F7)
+
+Para ejecutar los tests:
+    python -m unittest tests.test_allocations
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import allocations
+from src.allocations import AllocationTracker
+
+
+def keep_allocating(store):
+    """Reserva memoria que sigue viva (una lista nueva por llamada)."""
+    store.append([0] * 1000)
+
+
+class TestAllocationTracker(unittest.TestCase):
+    """Tests de la clase AllocationTracker."""
+
+    def setUp(self):
+        # Contar también las reservas de este archivo de tests
+        self.tracker = AllocationTracker(interval=5, top=3)
+        self.tracker._filters.append(tracemalloc.Filter(True, os.path.abspath(__file__)))
+
+    def tearDown(self):
+        self.tracker.set_enabled(False)
+
+    def test_disabled_does_nothing(self):
+        """Desactivado, mark_frame() no hace nada y tracemalloc no arranca."""
+        was_tracing = tracemalloc.is_tracing()
+        self.tracker.mark_frame()
+        self.assertEqual(self.tracker.frames, 0)
+        self.assertEqual(tracemalloc.is_tracing(), was_tracing)
+
+    def test_toggle_starts_and_stops_tracemalloc(self):
+        """Al activar arranca tracemalloc y al desactivar lo para."""
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc ya estaba activo")
+        self.assertTrue(self.tracker.toggle())
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertFalse(self.tracker.toggle())
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_finds_allocating_line(self):
+        """La línea que reserva memoria cada frame sale la primera, con bytes/s y objetos/frame."""
+        store = []
+        self.tracker.set_enabled(True)
+        for _ in range(10):
+            keep_allocating(store)
+            self.tracker.mark_frame()
+
+        self.assertEqual(self.tracker.frames, 10)
+        site, bytes_per_second, blocks = self.tracker.top_sites[0]
+        self.assertTrue(site.startswith("test_allocations.py:"))
+        self.assertGreater(bytes_per_second, 0)
+        self.assertAlmostEqual(blocks, 1.0, delta=0.5)
+
+    def test_frame_peak_sees_temporary_memory(self):
+        """La memoria que se libera en el mismo frame cuenta en el pico del frame."""
+        self.tracker.set_enabled(True)
+        temporary = bytearray(200_000)
+        del temporary
+        self.tracker.mark_frame()
+        self.assertGreaterEqual(self.tracker.frame_peak, 200_000)
+        self.assertGreaterEqual(self.tracker.max_frame_peak, self.tracker.frame_peak)
+
+    def test_summary(self):
+        """write_summary() guarda un JSON con las líneas que más han reservado."""
+        store = []
+        self.tracker.set_enabled(True)
+        for _ in range(5):
+            keep_allocating(store)
+            self.tracker.mark_frame()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "allocations.json")
+            self.tracker.write_summary(path)
+            with open(path, encoding='utf-8') as file:
+                summary = json.load(file)
+        self.assertEqual(summary["frames"], 5)
+        self.assertTrue(summary["top_sites"][0]["site"].startswith("test_allocations.py:"))
+        self.assertGreater(summary["net_bytes_per_second"], 0)
+
+    def test_only_game_sources_by_default(self):
+        """Por defecto solo se miran los archivos de src/."""
+        tracker = AllocationTracker()
+        self.assertEqual(tracker._filters[0].filename_pattern,
+                         os.path.join(os.path.dirname(os.path.abspath(allocations.__file__)), "*"))
+
+
+if __name__ == '__main__':
+    unittest.main()
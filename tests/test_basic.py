@@ -10,8 +10,20 @@ ruta_proyecto = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(ruta_proyecto)
 
 # Importar entities
+import pygame
 from src.entities import Player
 
 def test_player_starts_with_three_lives():
        player = Player()
-       assert player.lives == 3
\ No newline at end of file
+       assert player.lives == 3
+
+def test_player_sprite_variants_share_pulse():
+       # Con sprite real, las dos fases del pulso usan la misma Surface
+       player = Player()
+       player.using_fallback = False
+       player.sprite = pygame.Surface(player.rect.size, pygame.SRCALPHA)
+       variants = player.build_sprite_variants()
+       assert len(variants) == 8
+       for facing in (1, -1):
+              for has_shield in (False, True):
+                     assert variants[(facing, has_shield, 0)] is variants[(facing, has_shield, 1)]
@@ -0,0 +1,116 @@
+"""
+test_containers.py - Tests de EntityList (borrado diferido) y ObjectPool
+
+Para ejecutar los tests:
+    python -m unittest tests.test_containers
+"""
+
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.containers import EntityList, ObjectPool
+
+
+class TestEntityList(unittest.TestCase):
+    """Tests de la clase EntityList."""
+
+    def test_discard_during_iteration_keeps_order(self):
+        """Se pueden marcar elementos mientras se recorre y el orden se conserva."""
+        entities = EntityList(range(10))
+        visited = []
+        for value in entities:
+            visited.append(value)
+            if value % 3 == 0:
+                entities.discard(value)
+
+        self.assertEqual(visited, list(range(10)), "Se deben recorrer todos los elementos")
+        self.assertEqual(entities.compact(), 4)
+        self.assertEqual(list(entities), [1, 2, 4, 5, 7, 8])
+
+    def test_discard_uses_identity(self):
+        """Dos diccionarios iguales no se confunden (list.remove sí lo haría)."""
+        first = {'life': 0}
+        second = {'life': 0}
+        particles = EntityList([first, second])
+
+        particles.discard(second)
+        self.assertTrue(particles.is_dead(second))
+        self.assertFalse(particles.is_dead(first))
+
+        particles.compact()
+        self.assertEqual(len(particles), 1)
+        self.assertIs(particles[0], first)
+
+    def test_retain_updates_in_place(self):
+        """retain() deja solo los elementos que siguen vivos, sin crear otra lista."""
+        entities = EntityList([5, 0, 3, 0, 1])
+        same_list = entities
+
+        removed = entities.retain(lambda value: value > 0)
+
+        self.assertEqual(removed, 2)
+        self.assertIs(entities, same_list)
+        self.assertEqual(list(entities), [5, 3, 1])
+
+    def test_compact_without_marks_does_nothing(self):
+        """compact() sin marcas no toca la lista."""
+        entities = EntityList(['a', 'b'])
+        self.assertEqual(entities.compact(), 0)
+        self.assertEqual(list(entities), ['a', 'b'])
+
+
+class Token:
+    """Objeto mínimo reutilizable (con reset() como las entidades)."""
+
+    def __init__(self, value):
+        self.reset(value)
+
+    def reset(self, value):
+        self.value = value
+
+
+class TestObjectPool(unittest.TestCase):
+    """Tests de la clase ObjectPool."""
+
+    def test_acquire_reuses_released_objects(self):
+        """Un objeto devuelto se reutiliza y se reinicia."""
+        pool = ObjectPool(Token)
+        first = pool.acquire(1)
+        pool.release(first)
+
+        second = pool.acquire(2)
+
+        self.assertIs(second, first)
+        self.assertEqual(second.value, 2)
+        self.assertEqual((pool.created, pool.reused), (1, 1))
+
+    def test_compact_releases_only_removed_items(self):
+        """compact() devuelve al pool exactamente los elementos eliminados."""
+        pool = ObjectPool(Token)
+        tokens = EntityList([pool.acquire(i) for i in range(5)], pool=pool)
+        removed = [tokens[0], tokens[3]]
+        for token in removed:
+            tokens.discard(token)
+
+        tokens.compact()
+
+        self.assertEqual([token.value for token in tokens], [1, 2, 4])
+        self.assertCountEqual([id(t) for t in pool._free], [id(t) for t in removed])
+
+    def test_retain_and_clear_release_to_pool(self):
+        """retain() y clear() también devuelven los elementos al pool."""
+        pool = ObjectPool(Token)
+        tokens = EntityList([pool.acquire(i) for i in range(4)], pool=pool)
+
+        tokens.retain(lambda token: token.value % 2 == 0)
+        self.assertEqual(len(pool), 2)
+
+        tokens.clear()
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.get_in_use(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+test_frame_times.py - Tests del histograma y los percentiles de tiempos de frame
+
+Para ejecutar los tests:
+    python -m unittest tests.test_frame_times
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.frame_times import FrameTimeHistogram, FrameTimeRecorder, MAX_FRAME_US
+
+
+class TestFrameTimeHistogram(unittest.TestCase):
+    """Tests de la clase FrameTimeHistogram."""
+
+    def test_buckets_are_contiguous_and_precise(self):
+        """Cada valor cae en una cubeta cuyo límite superior está a menos del 1,6%."""
+        previous = -1
+        for us in list(range(0, 5000)) + [16_667, 33_333, 250_000, MAX_FRAME_US]:
+            index = FrameTimeHistogram.bucket_index(us)
+            upper = FrameTimeHistogram.bucket_upper(index)
+            self.assertGreaterEqual(upper, us)
+            self.assertLessEqual(upper - us, us / 64 + 1)
+            self.assertGreaterEqual(index, previous, "Las cubetas deben ir en orden")
+            previous = index
+
+    def test_percentiles(self):
+        """Con 1000 frames de 16 ms y 10 de 100 ms, el p99 es de 16 ms y el p99.9 de 100 ms."""
+        histogram = FrameTimeHistogram()
+        for _ in range(1000):
+            histogram.record(16.0)
+        for _ in range(10):
+            histogram.record(100.0)
+
+        self.assertAlmostEqual(histogram.get_percentile(50), 16.0, delta=0.3)
+        self.assertAlmostEqual(histogram.get_percentile(99), 16.0, delta=0.3)
+        self.assertAlmostEqual(histogram.get_percentile(99.9), 100.0, delta=1.6)
+        self.assertEqual(sum(count for _, count in histogram.get_buckets()), 1010)
+
+    def test_empty_and_clear(self):
+        """Sin frames los percentiles son 0."""
+        histogram = FrameTimeHistogram()
+        histogram.record(5.0)
+        histogram.clear()
+        self.assertEqual(histogram.get_percentile(99), 0.0)
+
+
+class TestFrameTimeRecorder(unittest.TestCase):
+    """Tests de la clase FrameTimeRecorder."""
+
+    def test_ring_buffer_keeps_last_frames(self):
+        """El buffer circular solo guarda los últimos `size` frames."""
+        recorder = FrameTimeRecorder(size=4)
+        for ms in (100, 100, 1, 2, 3, 4):
+            recorder.record(ms)
+
+        self.assertEqual(sorted(recorder.get_recent().tolist()), [1, 2, 3, 4])
+        self.assertEqual(recorder.get_recent_percentile(100), 4)
+        self.assertEqual(recorder.histogram.total, 6, "El histograma guarda toda la partida")
+
+    def test_worst_frames(self):
+        """Los peores frames se guardan de peor a mejor con su número de frame."""
+        recorder = FrameTimeRecorder(worst_count=2)
+        for ms in (10, 50, 12, 80, 11):
+            recorder.record(ms)
+
+        report = recorder.get_report()
+        self.assertEqual(report["worst_frames"], [{"frame": 4, "ms": 80}, {"frame": 2, "ms": 50}])
+        self.assertEqual(report["max_ms"], 80)
+        self.assertAlmostEqual(report["mean_ms"], 32.6)
+
+    def test_dump_writes_json(self):
+        """dump() guarda el informe con los percentiles pedidos."""
+        recorder = FrameTimeRecorder()
+        for ms in range(1, 101):
+            recorder.record(ms)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frame_times.json")
+            recorder.dump(path)
+            with open(path, encoding='utf-8') as file:
+                report = json.load(file)
+
+        self.assertEqual(list(report["percentiles_ms"]), ["p50", "p90", "p99", "p99.9"])
+        self.assertEqual(report["frames"], 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+test_particles.py - Tests del motor de partículas (ParticleSystem)
+
+Comprueba que las partículas mueren y se compactan, y que los sellos
+dibujan exactamente lo mismo que pygame.draw.circle().
+
+Para ejecutar los tests:
+    python -m unittest tests.test_particles
+"""
+
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from src.particles import ParticleSystem, PARTICLE_PRESETS
+from src.settings import (PARTICLE_PRIORITY_IMPACT, PARTICLE_PRIORITY_SPARKLE,
+                          PARTICLE_PRIORITY_COSMETIC, PARTICLE_MIN_LOD)
+
+
+class TestParticleSystem(unittest.TestCase):
+    """Tests de la clase ParticleSystem."""
+
+    def test_particles_expire_and_compact(self):
+        """Al acabarse la vida las partículas desaparecen de los arrays."""
+        system = ParticleSystem(capacity=4)
+        system.spawn_burst(100, 100, (255, 255, 0), 10, "blast")
+        system.spawn_burst(200, 100, (255, 0, 0), 5, "sparkle")
+        self.assertEqual(len(system), 15, "La capacidad debe crecer si hace falta")
+
+        longest = max(preset['max_life'] for preset in PARTICLE_PRESETS.values())
+        for _ in range(longest):
+            system.update()
+
+        self.assertEqual(len(system), 0)
+
+    def test_compact_keeps_survivors(self):
+        """Las partículas vivas conservan sus datos tras compactar."""
+        system = ParticleSystem()
+        system.spawn_burst(0, 0, (255, 255, 255), 3, "trail")
+        system.life[:3] = [1, 5, 1]
+        system.x[:3] = [10.0, 20.0, 30.0]
+        system.vel_x[:3] = 0.0
+
+        system.update()
+
+        self.assertEqual(len(system), 1)
+        self.assertEqual(system.life[0], 4)
+        self.assertEqual(system.x[0], 20.0)
+
+    def test_draw_matches_draw_circle(self):
+        """El dibujo con sellos es idéntico a dibujar cada círculo."""
+        system = ParticleSystem()
+        system.rng = np.random.default_rng(3)
+        system.spawn_burst(150, 120, (255, 200, 40), 30, "blast")
+        system.spawn_burst(80, 60, (120, 0, 255), 30, "explosion")
+        for _ in range(3):
+            system.update()
+
+        stamped = pygame.Surface((320, 240))
+        expected = pygame.Surface((320, 240))
+        rect = system.draw(stamped)
+
+        for i in range(len(system)):
+            life, max_life = int(system.life[i]), int(system.max_life[i])
+            radius = int(system.size[i])
+            if system.shrink[i]:
+                radius = int(radius * (life / max_life))
+            color = tuple(int(c * (life / max_life)) for c in system._colors[system.color[i]])
+            pygame.draw.circle(expected, color, (int(system.x[i]), int(system.y[i])), radius)
+
+        self.assertEqual(pygame.image.tobytes(stamped, "RGB"), pygame.image.tobytes(expected, "RGB"))
+        self.assertTrue(expected.get_bounding_rect().colliderect(rect))
+
+    def test_clear_removes_everything(self):
+        """clear() deja el motor vacío."""
+        system = ParticleSystem()
+        system.spawn_burst(0, 0, (255, 0, 0), 20)
+        system.clear()
+        self.assertEqual(len(system), 0)
+        self.assertIsNone(system.draw(pygame.Surface((10, 10))))
+
+
+class TestParticleBudget(unittest.TestCase):
+    """Tests del presupuesto de partículas."""
+
+    def test_budget_is_never_exceeded(self):
+        """Por muchas ráfagas que se lancen, nunca hay más partículas que el presupuesto."""
+        system = ParticleSystem(budget=100)
+        for _ in range(50):
+            system.spawn_burst(0, 0, (255, 0, 0), 15, "blast")
+        self.assertLessEqual(len(system), 100)
+        self.assertEqual(len(system) + system.culled, 50 * 15)
+
+    def test_cosmetic_uses_only_its_share(self):
+        """Las partículas decorativas no pueden llenar todo el presupuesto."""
+        system = ParticleSystem(budget=100)
+        for _ in range(20):
+            system.spawn_burst(0, 0, (255, 0, 0), 10, "explosion", PARTICLE_PRIORITY_COSMETIC)
+        self.assertEqual(len(system), 50)
+
+    def test_impact_evicts_lower_priorities(self):
+        """Un impacto hace hueco quitando primero lo decorativo y luego los brillos."""
+        system = ParticleSystem(budget=100)
+        system.spawn_burst(0, 0, (255, 0, 0), 50, "explosion", PARTICLE_PRIORITY_COSMETIC)
+        system.spawn_burst(0, 0, (0, 255, 0), 25, "sparkle", PARTICLE_PRIORITY_SPARKLE)
+        system.spawn_burst(0, 0, (0, 0, 255), 25, "blast", PARTICLE_PRIORITY_IMPACT)
+
+        created = system.spawn_burst(0, 0, (0, 0, 255), 40, "blast", PARTICLE_PRIORITY_IMPACT)
+
+        priorities = list(system.priority[:len(system)])
+        self.assertEqual(created, 40)
+        self.assertEqual(priorities.count(PARTICLE_PRIORITY_IMPACT), 65)
+        self.assertEqual(priorities.count(PARTICLE_PRIORITY_SPARKLE), 25)
+        self.assertEqual(priorities.count(PARTICLE_PRIORITY_COSMETIC), 10)
+
+    def test_partial_burst_is_merged(self):
+        """Si solo cabe parte de la ráfaga, se crean menos partículas pero más grandes."""
+        system = ParticleSystem(budget=20)
+        system.spawn_burst(0, 0, (255, 0, 0), 16, "blast")
+        system.size[:16] = 1
+
+        created = system.spawn_burst(0, 0, (255, 0, 0), 16, "blast")
+
+        self.assertEqual(created, 4)
+        self.assertEqual(system.merged, 1)
+        self.assertEqual(system.culled, 12)
+        self.assertGreaterEqual(system.size[16:20].min(), 4, "Tamaño mínimo 2 escalado por raíz(16/4)")
+
+    def test_slow_frames_lower_detail(self):
+        """Con frames lentos el presupuesto baja, y se recupera cuando van bien."""
+        system = ParticleSystem(budget=400)
+        system.spawn_burst(0, 0, (255, 0, 0), 300, "blast")
+
+        for _ in range(200):
+            system.report_frame_time(100)
+        self.assertAlmostEqual(system.lod, PARTICLE_MIN_LOD)
+        system.update()
+        self.assertLessEqual(len(system), system.get_effective_budget())
+
+        for _ in range(200):
+            system.report_frame_time(1)
+        self.assertEqual(system.lod, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
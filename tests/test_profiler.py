@@ -0,0 +1,88 @@
+"""
+test_profiler.py - Tests del perfilador de fases del frame
+
+Para ejecutar los tests:
+    python -m unittest tests.test_profiler
+"""
+
+import unittest
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.profiler import FrameProfiler, IDLE_PHASE
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Tests de la clase FrameProfiler."""
+
+    def test_disabled_records_nothing(self):
+        """Desactivado, lap() y start_frame() no hacen nada."""
+        profiler = FrameProfiler()
+        for _ in range(3):
+            profiler.start_frame()
+            profiler.lap("Eventos")
+
+        self.assertEqual(profiler.get_stats(), [])
+        self.assertEqual(len(profiler.history), 0)
+
+    def test_laps_add_up_per_phase(self):
+        """Las vueltas de la misma fase en un frame se suman."""
+        profiler = FrameProfiler()
+        profiler.set_enabled(True)
+
+        profiler.start_frame()
+        time.sleep(0.002)
+        profiler.lap("Movimiento")
+        profiler.lap("Colisiones")
+        time.sleep(0.002)
+        profiler.lap("Movimiento")
+        profiler.start_frame()  # Cierra el frame
+
+        stats = {phase: (avg, peak) for phase, avg, peak in profiler.get_stats()}
+        self.assertEqual(list(stats), ["Movimiento", "Colisiones"], "Las fases van en orden de aparición")
+        self.assertGreaterEqual(stats["Movimiento"][0], 4.0)
+        self.assertLess(stats["Colisiones"][0], stats["Movimiento"][0])
+
+    def test_average_and_max_over_window(self):
+        """La media y el máximo salen de los últimos `history` frames."""
+        profiler = FrameProfiler(history=2)
+        profiler.set_enabled(True)
+        for frame in ({"HUD": 1.0}, {"HUD": 3.0}, {"HUD": 5.0}):
+            profiler.start_frame()
+            profiler.lap("HUD")
+            profiler._current = dict(frame)  # Tiempos conocidos
+        profiler.start_frame()
+
+        self.assertEqual(profiler.get_stats(), [("HUD", 4.0, 5.0)])
+
+    def test_disable_clears_history(self):
+        """Al desactivarlo se olvida lo medido."""
+        profiler = FrameProfiler()
+        profiler.set_enabled(True)
+        profiler.start_frame()
+        profiler.lap("Eventos")
+        profiler.start_frame()
+        profiler.set_enabled(False)
+
+        self.assertEqual(profiler.get_stats(), [])
+
+    def test_draw_graph(self):
+        """La gráfica se dibuja dentro de su rect (la espera no cuenta)."""
+        profiler = FrameProfiler()
+        profiler.set_enabled(True)
+        for _ in range(5):
+            profiler.start_frame()
+            profiler.lap("Fondo")
+            profiler.lap(IDLE_PHASE)
+        profiler.start_frame()
+
+        surface = pygame.Surface((300, 100))
+        rect = pygame.Rect(10, 10, 240, 80)
+        self.assertEqual(profiler.draw_graph(surface, rect), rect)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+test_random_streams.py - Tests de los generadores aleatorios con semilla
+
+Para ejecutar los tests:
+    python -m unittest tests.test_random_streams
+"""
+
+import unittest
+import contextlib
+import io
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.random_streams import RandomStreams, random_streams
+from src.simulation import GameSimulation, InputSnapshot
+from src.particles import particle_system
+from src.entities import ScreenEffect
+
+
+def play(seed, cosmetic_noise=False, steps=1500):
+    """Juega una partida con semilla y devuelve la puntuación y los obstáculos de cada frame."""
+    history = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = GameSimulation(seed=seed)
+        shake = ScreenEffect()
+        for step in range(steps):
+            simulation.step(InputSnapshot(left=step % 120 < 60, right=step % 120 >= 60, throw=step % 9 == 0))
+            if cosmetic_noise:
+                # Efectos visuales gastando números aleatorios entre frames
+                particle_system.spawn_burst(100, 100, (255, 255, 0), 20, "sparkle")
+                shake.start_screen_shake(5, 10)
+                shake.update()
+            history.append((simulation.player.score,
+                            [tuple(obstacle.rect) for obstacle in simulation.obstacles]))
+    particle_system.clear()
+    return history
+
+
+class TestRandomStreams(unittest.TestCase):
+    """Tests de la clase RandomStreams."""
+
+    def test_same_seed_same_sequence(self):
+        """La misma semilla da la misma secuencia en cada generador."""
+        first = RandomStreams(42)
+        second = RandomStreams(42)
+
+        self.assertEqual([first.gameplay.random() for _ in range(5)],
+                         [second.gameplay.random() for _ in range(5)])
+        self.assertEqual(first.particles.integers(0, 1000, 5).tolist(),
+                         second.particles.integers(0, 1000, 5).tolist())
+
+    def test_streams_are_independent(self):
+        """Gastar números cosméticos no cambia la secuencia de gameplay."""
+        quiet = RandomStreams(7)
+        noisy = RandomStreams(7)
+        noisy.cosmetic.random()
+        noisy.particles.uniform(0, 1, 100)
+
+        self.assertEqual([quiet.gameplay.randint(0, 100) for _ in range(10)],
+                         [noisy.gameplay.randint(0, 100) for _ in range(10)])
+        self.assertNotEqual(quiet.gameplay.random(), quiet.cosmetic.random(),
+                            "Cada generador debe tener su propia secuencia")
+
+    def test_random_seed_is_recorded(self):
+        """Sin semilla se elige una y se guarda para poder repetir la partida."""
+        streams = RandomStreams()
+        first = [streams.gameplay.random() for _ in range(3)]
+
+        streams.seed(streams.run_seed)
+        self.assertEqual([streams.gameplay.random() for _ in range(3)], first)
+
+    def test_seed_keeps_generator_objects(self):
+        """seed() resiembra en el sitio (ParticleSystem guarda una referencia)."""
+        particles = random_streams.particles
+        gameplay = random_streams.gameplay
+        random_streams.seed(3)
+
+        self.assertIs(random_streams.particles, particles)
+        self.assertIs(random_streams.gameplay, gameplay)
+
+
+class TestSeededSimulation(unittest.TestCase):
+    """La partida solo depende de la semilla y de los controles."""
+
+    def test_same_seed_same_game(self):
+        """Dos partidas con la misma semilla son idénticas."""
+        self.assertEqual(play(11), play(11))
+
+    def test_cosmetic_effects_do_not_change_game(self):
+        """Partículas y screen shake no alteran los spawns."""
+        self.assertEqual(play(11), play(11, cosmetic_noise=True))
+
+    def test_different_seed_different_game(self):
+        """Otra semilla da otra partida."""
+        self.assertNotEqual(play(11), play(12))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+test_replay.py - Tests de la grabación y reproducción de partidas
+
+Para ejecutar los tests:
+    python -m unittest tests.test_replay
+"""
+
+import unittest
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.replay import Replay, ReplayRecorder, play_replay, _write_varint, _read_varint
+from src.simulation import GameSimulation, InputSnapshot
+from src.settings import INPUT_BIT_LEFT, INPUT_BIT_THROW, INPUT_BIT_PAUSE
+
+
+class TestReplayFormat(unittest.TestCase):
+    """Tests del formato binario de las repeticiones."""
+
+    def test_varint_roundtrip(self):
+        """Los varint se leen igual que se escriben, con 1 byte para valores pequeños."""
+        for value in (0, 1, 127, 128, 300, 2 ** 32):
+            data = bytearray()
+            _write_varint(data, value)
+            self.assertEqual(_read_varint(data, 0), (value, len(data)))
+
+        data = bytearray()
+        _write_varint(data, 127)
+        self.assertEqual(len(data), 1)
+
+    def test_held_keys_are_run_length_encoded(self):
+        """Las teclas mantenidas ocupan un solo tramo."""
+        replay = Replay(seed=1)
+        for mask in [INPUT_BIT_LEFT] * 500 + [0] * 20 + [INPUT_BIT_LEFT]:
+            replay.append(mask)
+
+        self.assertEqual(replay.runs, [[INPUT_BIT_LEFT, 500], [0, 20], [INPUT_BIT_LEFT, 1]])
+        self.assertEqual(len(replay), 521)
+
+    def test_bytes_roundtrip(self):
+        """to_bytes() y from_bytes() conservan semilla, tramos y puntuación."""
+        replay = Replay(seed=2 ** 40, runs=[[3, 1000], [INPUT_BIT_THROW, 1]], score=42)
+        loaded = Replay.from_bytes(replay.to_bytes())
+
+        self.assertEqual((loaded.seed, loaded.runs, loaded.score, loaded.tick_rate),
+                         (replay.seed, replay.runs, replay.score, replay.tick_rate))
+
+    def test_invalid_data_raises(self):
+        """Un archivo que no es una repetición da ValueError."""
+        with self.assertRaises(ValueError):
+            Replay.from_bytes(b"no es una repeticion, solo texto")
+        with self.assertRaises(ValueError):
+            Replay.from_bytes(b"CH")
+
+    def test_pause_is_recorded_but_not_played(self):
+        """La pausa se guarda en el siguiente tick pero no llega a la simulación."""
+        recorder = ReplayRecorder()
+        recorder.start(seed=1)
+        recorder.record(InputSnapshot(left=True))
+        recorder.mark_pause()
+        recorder.record(InputSnapshot(left=True))
+
+        self.assertEqual(list(recorder.replay.iter_masks()), [INPUT_BIT_LEFT, INPUT_BIT_LEFT | INPUT_BIT_PAUSE])
+        self.assertEqual(recorder.replay.get_pause_count(), 1)
+        self.assertEqual([inputs.get_bits() for inputs in recorder.replay.iter_inputs()],
+                         [INPUT_BIT_LEFT, INPUT_BIT_LEFT])
+
+    def test_tainted_until_next_start(self):
+        """Un cheat marca la partida como no reproducible hasta la siguiente."""
+        recorder = ReplayRecorder()
+        recorder.start(seed=1)
+        self.assertFalse(recorder.tainted)
+        recorder.mark_tainted()
+        self.assertTrue(recorder.tainted)
+        recorder.start(seed=2)
+        self.assertFalse(recorder.tainted)
+
+
+class TestReplayPlayback(unittest.TestCase):
+    """Una partida grabada se reproduce exactamente igual."""
+
+    def test_recorded_game_replays_identically(self):
+        """Reproducir la repetición da la misma puntuación y duración."""
+        controls = random.Random(4)
+        recorder = ReplayRecorder()
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulation = GameSimulation(seed=99)
+            recorder.start(simulation.run_seed)
+            while not simulation.game_over and simulation.frame_count < 5000:
+                inputs = InputSnapshot(left=controls.random() < 0.4, right=controls.random() < 0.4,
+                                       throw=controls.random() < 0.1)
+                recorder.record(inputs)
+                simulation.step(inputs)
+
+            with tempfile.TemporaryDirectory() as directory:
+                path = recorder.save(simulation.player.score, directory)
+                replay = Replay.load(path)
+                replayed = play_replay(replay)
+
+        self.assertEqual(replayed.player.score, simulation.player.score)
+        self.assertEqual(replayed.frame_count, simulation.frame_count)
+        self.assertEqual(replayed.game_over, simulation.game_over)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+test_spatial.py - Tests de la rejilla espacial (SpatialHash)
+
+Comprueba que la rejilla encuentra exactamente las mismas colisiones
+que recorrer la lista completa, y en el mismo orden.
+
+Para ejecutar los tests:
+    python -m unittest tests.test_spatial
+"""
+
+import unittest
+import os
+import random
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.spatial import SpatialHash
+
+
+class Box:
+    """Entidad mínima con un rect."""
+
+    def __init__(self, x, y, width=30, height=30):
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Tests de la clase SpatialHash."""
+
+    def test_query_finds_overlapping_items(self):
+        """Solo se devuelven las entidades que solapan de verdad."""
+        grid = SpatialHash(cell_size=64, min_items=0)
+        near = Box(10, 10)
+        touching_cell_only = Box(50, 50, 10, 10)
+        far = Box(500, 500)
+        grid.insert_all([near, touching_cell_only, far])
+
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 20, 20)), [near])
+        self.assertEqual(grid.query(pygame.Rect(400, 400, 10, 10)), [])
+
+    def test_query_keeps_insertion_order(self):
+        """Los resultados salen en el orden de inserción aunque ocupen varias celdas."""
+        grid = SpatialHash(cell_size=16, min_items=0)
+        boxes = [Box(40 - i * 10, 40 - i * 10, 40, 40) for i in range(4)]
+        grid.insert_all(boxes)
+
+        self.assertEqual(grid.query(pygame.Rect(45, 45, 10, 10)), boxes)
+
+    def test_matches_linear_scan(self):
+        """Con muchas entidades el resultado es idéntico al de comprobarlas todas."""
+        rng = random.Random(1)
+        boxes = [Box(rng.randrange(-100, 2000), rng.randrange(-100, 2000)) for _ in range(500)]
+        grid = SpatialHash(cell_size=128, min_items=0)
+        grid.insert_all(boxes)
+
+        for _ in range(200):
+            probe = pygame.Rect(rng.randrange(2000), rng.randrange(2000), 8, 20)
+            expected = [box for box in boxes if probe.colliderect(box.rect)]
+            self.assertEqual(grid.query(probe), expected)
+
+    def test_clear_empties_grid(self):
+        """Después de clear() no queda ninguna entidad."""
+        grid = SpatialHash(min_items=0)
+        grid.insert_all([Box(0, 0), Box(5, 5)])
+        self.assertEqual(len(grid), 2)
+
+        grid.clear()
+        self.assertEqual(len(grid), 0)
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 50, 50)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+test_threat_store.py - Tests del almacén SoA de amenazas (ThreatStore)
+
+Comprueba que los solapes AABB coinciden con Rect.colliderect() y que
+una partida con THREAT_BACKEND "soa" es idéntica a una con "objects".
+
+Para ejecutar los tests:
+    python -m unittest tests.test_threat_store
+"""
+
+import unittest
+import contextlib
+import io
+import os
+import random
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.threat_store import ThreatStore
+from src.simulation import GameSimulation, InputSnapshot
+
+
+class Threat:
+    """Amenaza mínima con los atributos que copia ThreatStore.add()."""
+
+    def __init__(self, x, y, width=30, height=30, obstacle_type='normal'):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.speed = 3
+        self.obstacle_type = obstacle_type
+        self.rotation = 0
+        self.pulse_timer = 0
+
+
+def play(backend, seed, steps=3000):
+    """Juega una partida con controles aleatorios y devuelve todo lo ocurrido."""
+    controls = random.Random(seed)
+    history = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = GameSimulation(backend, seed=seed)
+        for step in range(steps):
+            inputs = InputSnapshot(left=controls.random() < 0.4, right=controls.random() < 0.4,
+                                   throw=step % 9 == 0)
+            events = simulation.step(inputs)
+            simulation.sync_views()
+            history.append((simulation.player.score,
+                            [tuple(threat.rect) for threat in simulation.obstacles],
+                            [tuple(threat.rect) for threat in simulation.enemies],
+                            [sorted(event.items(), key=str) for event in events]))
+            if simulation.game_over:
+                simulation.reset()
+    return history
+
+
+class TestThreatStore(unittest.TestCase):
+    """Tests de la clase ThreatStore."""
+
+    def test_overlapping_matches_colliderect(self):
+        """El test AABB vectorizado da lo mismo que colliderect(), obstáculos primero."""
+        rng = random.Random(5)
+        store = ThreatStore(capacity=4)
+        threats = []
+        for _ in range(300):
+            kind = rng.choice(['normal', 'fast', 'enemy'])
+            threat = Threat(rng.randrange(800), rng.randrange(600), obstacle_type=kind)
+            threats.append(threat)
+            store.add(threat)
+
+        for _ in range(100):
+            probe = pygame.Rect(rng.randrange(800), rng.randrange(600), 8, 20)
+            hits = [store.views[i] for i in store.overlapping(probe)]
+            expected = ([t for t in threats if t.obstacle_type != 'enemy' and probe.colliderect(t.rect)]
+                        + [t for t in threats if t.obstacle_type == 'enemy' and probe.colliderect(t.rect)])
+            self.assertEqual(hits, expected)
+
+    def test_compact_keeps_order_and_views(self):
+        """Al compactar se quitan las muertas y cada vista sigue con sus datos."""
+        store = ThreatStore()
+        threats = [Threat(i * 40, 0) for i in range(5)]
+        for threat in threats:
+            store.add(threat)
+
+        store.kill(1)
+        store.kill(3)
+        self.assertEqual(store.compact(), 2)
+
+        self.assertEqual(store.views, [threats[0], threats[2], threats[4]])
+        self.assertEqual(store.x[:len(store)].tolist(), [0, 80, 160])
+
+
+class TestThreatBackends(unittest.TestCase):
+    """Los dos backends de GameSimulation tienen que jugar igual."""
+
+    def test_soa_matches_objects(self):
+        """Misma semilla y mismos controles: mismos eventos, puntos y posiciones."""
+        self.assertEqual(play("soa", 11), play("objects", 11))
+
+    def test_unknown_backend(self):
+        """Un backend desconocido es un error."""
+        with self.assertRaises(ValueError):
+            GameSimulation("gpu")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+test_timestep.py - Tests del paso de tiempo fijo y de la interpolación
+
+Para ejecutar los tests:
+    python -m unittest tests.test_timestep
+"""
+
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from src.timestep import FixedTimestep, RenderInterpolator
+from src.settings import INTERPOLATION_MAX_STEP
+
+
+class Box:
+    """Entidad mínima con un rect, para probar el interpolador."""
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 10, 10)
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Tests de la clase FixedTimestep."""
+
+    def test_ticks_follow_real_time(self):
+        """Los ticks dependen del tiempo real, no del número de frames."""
+        timestep = FixedTimestep(tick_rate=60, max_ticks=5)
+
+        # 120 Hz: un tick cada dos frames
+        ticks = [timestep.advance(1 / 120) for _ in range(120)]
+        self.assertEqual(sum(ticks), 60)
+        self.assertTrue(set(ticks) <= {0, 1})
+
+        # 30 Hz: dos ticks por frame
+        self.assertEqual(sum(timestep.advance(1 / 30) for _ in range(30)), 60)
+
+    def test_alpha_is_leftover_fraction(self):
+        """alpha es la parte del siguiente tick que ya ha pasado."""
+        timestep = FixedTimestep(tick_rate=10, max_ticks=5)
+
+        self.assertEqual(timestep.advance(0.25), 2)
+        self.assertAlmostEqual(timestep.get_alpha(), 0.5)
+
+        timestep.reset()
+        self.assertEqual(timestep.get_alpha(), 0.0)
+
+    def test_max_ticks_drops_backlog(self):
+        """Un frame muy largo no ejecuta más de max_ticks ni arrastra el retraso."""
+        timestep = FixedTimestep(tick_rate=60, max_ticks=5)
+
+        self.assertEqual(timestep.advance(1.0), 5)
+        self.assertEqual(timestep.dropped_ticks, 55)
+        self.assertEqual(timestep.last_ticks, 5)
+        # El siguiente frame normal vuelve a un solo tick
+        self.assertEqual(timestep.advance(1 / 60 + 1e-9), 1)
+
+
+class TestRenderInterpolator(unittest.TestCase):
+    """Tests de la clase RenderInterpolator."""
+
+    def test_apply_and_restore(self):
+        """Los rects se dibujan a medio camino y luego vuelven a su sitio."""
+        box = Box(0, 0)
+        interpolator = RenderInterpolator()
+        interpolator.capture([box])
+        box.rect.x, box.rect.y = 10, 20
+
+        interpolator.apply([box], 0.5)
+        self.assertEqual(box.rect.topleft, (5, 10))
+
+        interpolator.restore()
+        self.assertEqual(box.rect.topleft, (10, 20))
+
+    def test_skips_new_entities_and_big_jumps(self):
+        """Las entidades nuevas y los saltos grandes se dibujan en su posición real."""
+        jumper = Box(0, 0)
+        newcomer = Box(50, 50)
+        interpolator = RenderInterpolator()
+        interpolator.capture([jumper])
+        jumper.rect.y = INTERPOLATION_MAX_STEP + 1
+
+        interpolator.apply([jumper, newcomer], 0.5)
+        self.assertEqual(jumper.rect.topleft, (0, INTERPOLATION_MAX_STEP + 1))
+        self.assertEqual(newcomer.rect.topleft, (50, 50))
+
+    def test_full_alpha_and_clear(self):
+        """Con alpha 1.0 o tras clear() no se mueve nada."""
+        box = Box(0, 0)
+        interpolator = RenderInterpolator()
+        interpolator.capture([box])
+        box.rect.x = 10
+
+        interpolator.apply([box], 1.0)
+        self.assertEqual(box.rect.x, 10)
+
+        interpolator.clear()
+        interpolator.apply([box], 0.0)
+        self.assertEqual(box.rect.x, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
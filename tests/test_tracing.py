@@ -0,0 +1,102 @@
+"""
+test_tracing.py - Tests de la traza Chrome trace-event (F6)
+
+Para ejecutar los tests:
+    python -m unittest tests.test_tracing
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tracing import Tracer
+from src.profiler import FrameProfiler
+
+
+class TestTracer(unittest.TestCase):
+    """Tests de la clase Tracer."""
+
+    def test_disabled_records_nothing(self):
+        """Desactivada no se apunta nada ni se reserva el buffer."""
+        tracer = Tracer(capacity=10)
+        tracer.instant("spawn", "obstacle")
+        tracer.span("Colisiones", 0.0, 1.0)
+        self.assertEqual(tracer.count, 0)
+        self.assertIsNone(tracer._start)
+
+    def test_spans_and_instants(self):
+        """Los tramos son eventos "X" con duración y los instantáneos eventos "i"."""
+        tracer = Tracer(capacity=10)
+        self.assertTrue(tracer.toggle())
+        start = time.perf_counter()
+        tracer.span("Colisiones", start, start + 0.002)
+        tracer.instant("spawn", "enemy")
+
+        events = tracer.get_events()[1:]  # El primero es el nombre del hilo
+        self.assertEqual(events[0]["ph"], "X")
+        self.assertEqual(events[0]["name"], "Colisiones")
+        self.assertAlmostEqual(events[0]["dur"], 2000, delta=1)
+        self.assertEqual(events[1]["ph"], "i")
+        self.assertEqual(events[1]["name"], "spawn: enemy")
+        self.assertGreaterEqual(events[1]["ts"], events[0]["ts"])
+
+    def test_full_buffer_drops_events(self):
+        """Con el buffer lleno los eventos nuevos se cuentan como perdidos."""
+        tracer = Tracer(capacity=3)
+        tracer.set_enabled(True)
+        for _ in range(5):
+            tracer.instant("estado")
+        self.assertEqual(tracer.count, 3)
+        self.assertEqual(tracer.dropped, 2)
+
+        tracer.clear()
+        self.assertEqual((tracer.count, tracer.dropped), (0, 0))
+
+    def test_pause_keeps_events(self):
+        """Pausar la grabación conserva lo grabado."""
+        tracer = Tracer(capacity=10)
+        tracer.toggle()
+        tracer.instant("estado", "playing")
+        self.assertFalse(tracer.toggle())
+        tracer.instant("estado", "game_over")
+        self.assertEqual(tracer.count, 1)
+
+    def test_write_valid_json(self):
+        """write() guarda un JSON con traceEvents que entiende un visor de trazas."""
+        tracer = Tracer(capacity=10)
+        tracer.toggle()
+        tracer.instant("sonido", "assets/sounds/hit.wav")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            self.assertEqual(tracer.write(path), 1)
+            with open(path, encoding='utf-8') as file:
+                trace = json.load(file)
+        self.assertEqual(len(trace["traceEvents"]), 2)
+        self.assertEqual(trace["otherData"]["dropped_events"], 0)
+
+    def test_profiler_laps_become_spans(self):
+        """Con una traza conectada, cada lap() del perfilador es un tramo aunque F1 esté apagado."""
+        tracer = Tracer(capacity=100)
+        tracer.set_enabled(True)
+        profiler = FrameProfiler()
+        profiler.set_tracer(tracer)
+        for _ in range(2):
+            profiler.start_frame()
+            profiler.lap("Eventos")
+            profiler.lap("Flip")
+
+        names = [event["name"] for event in tracer.get_events()[1:]]
+        self.assertEqual(names, ["Eventos", "Flip", "Frame", "Eventos", "Flip"])
+        self.assertEqual(len(profiler.history), 0, "Sin F1 no se guarda historial")
+
+        profiler.set_tracer(None)
+        profiler.lap("Eventos")
+        self.assertEqual(tracer.count, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()